@@ -1,4 +1,3 @@
-from json import loads as json_loads
 from time import sleep
 from typing import cast
 from core.db import DbSession, SqlBuilder
@@ -6,13 +5,13 @@ from core.Env import Env
 from core.FastAPIAppConfig import FastAPIAppConfig
 from core.routing import AppExceptionHandlingRoute, AppRouter, BaseMiddleware
 from core.security import AuthSecurity
+from core.serialization import JsonCodec
 from core.types import SafeDateTime
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from models import User, UserProfile
 from pydantic import SecretStr
-from .ai import BotScheduleHelper
 from .Constants import APP_CONFIG_FILE, SCHEMA_DIR
 from .Loader import ModuleLoader
 from .middlewares import AuthMiddleware, RoleMiddleware
@@ -38,7 +37,6 @@ class App:
 
     def create(self):
         AppRouter.set_app(self.api)
-        BotScheduleHelper.reload_cron()
         self.app_config.set_restarting(True)
         return self.api
 
@@ -116,6 +114,8 @@ class App:
             sleep(1)
 
     def _openapi_json(self):
-        with open(SCHEMA_DIR / "openapi.json", "r") as f:
-            content = f.read()
-        return json_loads(content)
+        # The schema file is written once on startup, so it is parsed on the first call only.
+        if self.api.openapi_schema is None:
+            with open(SCHEMA_DIR / "openapi.json", "rb") as f:
+                self.api.openapi_schema = JsonCodec.loads(f.read())
+        return self.api.openapi_schema
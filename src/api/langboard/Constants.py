@@ -23,9 +23,6 @@ LOGGING_DIR = Path(Env.get_from_env("LOGGING_DIR", DATA_DIR / "logs" / "api"))
 # Storage
 LOCAL_STORAGE_DIR = Path(Env.get_from_env("LOCAL_STORAGE_DIR", DATA_DIR / "uploads"))
 
-# Scheduler
-CRON_TAB_FILE = Path(Env.get_from_env("CRON_TAB_FILE", DATA_DIR / "cron.tab"))
-
 # App Config
 APP_CONFIG_FILE = DATA_DIR / "api_config.json"
 
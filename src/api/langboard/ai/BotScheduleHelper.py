@@ -1,20 +1,16 @@
-from os import environ
-from subprocess import run as subprocess_run
+from time import time_ns
 from typing import Any, Callable, Literal, TypeVar, cast, overload
 from zoneinfo import ZoneInfo
+from core.caching import Cache
 from core.db import BaseSqlModel, DbSession, SqlBuilder
-from core.Env import Env
 from core.schema import Pagination
 from core.types import SafeDateTime, SnowflakeID
 from core.utils.decorators import staticclass
-from crontab import SPECIALS, CronItem, CronTab, OrderedVariableList
+from crontab import SPECIALS, CronItem
 from helpers import ServiceHelper
 from models import Bot, BotSchedule
 from models.bases import BaseBotScheduleModel
 from models.BotSchedule import BotScheduleRunningType, BotScheduleStatus
-from psutil import process_iter
-from sqlalchemy import tuple_
-from ..Constants import CRON_TAB_FILE
 
 
 _TBotScheduleModel = TypeVar("_TBotScheduleModel", bound=BaseBotScheduleModel)
@@ -23,6 +19,9 @@ _TBaseParam = int | str | None
 
 @staticclass
 class BotScheduleHelper:
+    CRON_JOBS_VERSION_CACHE_KEY = "bot_schedule_cron_jobs_version"
+    PENDING_CRON_JOB_PREFIX = "scheduled "
+
     @overload
     @staticmethod
     async def get_all_by_scope(
@@ -108,19 +107,32 @@ class BotScheduleHelper:
         return api_schedules
 
     @staticmethod
-    def reload_cron():
-        if Env.ENVIRONMENT == "local":
-            return
-        try:
-            for process in process_iter(["pid", "name"]):
-                if process.name() != "cron":
-                    continue
-                process.kill()
-            subprocess_run(["crontab", "-r"])
-            subprocess_run(["crontab", str(CRON_TAB_FILE)])
-            subprocess_run(["cron"])
-        except Exception:
-            pass
+    async def get_cron_jobs() -> dict[str, str]:
+        """Returns the interval strings of the cron jobs by their keys.
+
+        The started schedules run on their intervals (keyed by the interval string) and the pending schedules check
+        if they can be started on their intervals (keyed by the interval string with
+        :attr:`PENDING_CRON_JOB_PREFIX`).
+        """
+        with DbSession.use(readonly=True) as db:
+            result = db.exec(
+                SqlBuilder.select.columns(BotSchedule.interval_str, BotSchedule.status)
+                .where(BotSchedule.column("status").in_([BotScheduleStatus.Started, BotScheduleStatus.Pending]))
+                .distinct()
+            )
+            records = result.all()
+
+        jobs: dict[str, str] = {}
+        for interval_str, status in records:
+            if status == BotScheduleStatus.Pending:
+                jobs[f"{BotScheduleHelper.PENDING_CRON_JOB_PREFIX}{interval_str}"] = interval_str
+            else:
+                jobs[interval_str] = interval_str
+        return jobs
+
+    @staticmethod
+    async def get_cron_jobs_version() -> str | None:
+        return await Cache.get(BotScheduleHelper.CRON_JOBS_VERSION_CACHE_KEY)
 
     @staticmethod
     def convert_valid_interval_str(interval_str: str) -> str:
@@ -182,10 +194,6 @@ class BotScheduleHelper:
         if not running_type:
             running_type = BotScheduleRunningType.Infinite
 
-        cron = BotScheduleHelper.__get_cron()
-
-        has_changed = BotScheduleHelper.__create_job(cron, interval_str, running_type)
-
         result = BotScheduleHelper.get_default_status_with_dates(
             running_type=running_type, start_at=start_at, end_at=end_at
         )
@@ -215,8 +223,7 @@ class BotScheduleHelper:
         with DbSession.use(readonly=False) as db:
             db.insert(schedule_model)
 
-        if has_changed:
-            BotScheduleHelper.__save_cron(cron)
+        await BotScheduleHelper.__notify_cron_jobs_changed()
 
         return bot_schedule, schedule_model
 
@@ -239,11 +246,8 @@ class BotScheduleHelper:
             return None
 
         model = {}
-        has_changed = False
-        old_status = bot_schedule.status
         old_interval_str = bot_schedule.interval_str
 
-        cron = None
         if running_type:
             if bot_schedule.running_type != running_type:
                 result = BotScheduleHelper.get_default_status_with_dates(
@@ -260,14 +264,6 @@ class BotScheduleHelper:
                 model["status"] = status.value
                 model["start_at"] = start_at
                 model["end_at"] = end_at
-
-                cron, has_changed = await BotScheduleHelper.change_status(
-                    schedule_model_class,
-                    schedule_model,
-                    status,
-                    no_update=True,
-                    bot_schedule=bot_schedule,
-                )
             else:
                 if bot_schedule.start_at != start_at or bot_schedule.end_at != end_at:
                     result = BotScheduleHelper.get_default_status_with_dates(
@@ -293,30 +289,11 @@ class BotScheduleHelper:
                 bot_schedule.interval_str = interval_str
                 model["interval_str"] = interval_str
 
-                if not cron:
-                    cron = BotScheduleHelper.__get_cron()
-
-                if (
-                    bot_schedule.running_type in BotSchedule.RUNNING_TYPES_WITH_START_AT
-                    and bot_schedule.status == BotScheduleStatus.Pending
-                ):
-                    has_changed = BotScheduleHelper.__create_job(cron, interval_str, running_type) or has_changed
-                else:
-                    has_changed = BotScheduleHelper.__create_job(cron, interval_str) or has_changed
-
         with DbSession.use(readonly=False) as db:
             db.update(bot_schedule)
 
-        has_old_intervals = BotScheduleHelper.__has_interval_schedule(old_interval_str, old_status)
-        if not has_old_intervals:
-            if not cron:
-                cron = BotScheduleHelper.__get_cron()
-            cron.remove_all(
-                comment=f"scheduled {old_interval_str}" if old_status == BotScheduleStatus.Pending else old_interval_str
-            )
-
-        if cron and (has_changed or not has_old_intervals):
-            BotScheduleHelper.__save_cron(cron)
+        if "status" in model or "interval_str" in model:
+            await BotScheduleHelper.__notify_cron_jobs_changed()
 
         return bot_schedule, schedule_model, model
 
@@ -333,27 +310,18 @@ class BotScheduleHelper:
         if not bot_schedule:
             return None
 
-        cron = BotScheduleHelper.__get_cron()
-
-        status = bot_schedule.status
-        interval_str = bot_schedule.interval_str
         with DbSession.use(readonly=False) as db:
             db.delete(bot_schedule)
 
-        has_interval = BotScheduleHelper.__has_interval_schedule(interval_str, status)
-        if not has_interval:
-            cron.remove_all(
-                comment=f"scheduled {interval_str}" if status == BotScheduleStatus.Pending else interval_str
-            )
-            BotScheduleHelper.__save_cron(cron)
+        await BotScheduleHelper.__notify_cron_jobs_changed()
         return bot_schedule, schedule_model
 
     @staticmethod
     async def unschedule_by_scope(schedule_model_class: type[_TBotScheduleModel], scope_model: BaseSqlModel) -> None:
-        old_schedules: list[tuple[SnowflakeID, str, BotScheduleStatus]] = []
+        old_schedule_ids: list[SnowflakeID] = []
         with DbSession.use(readonly=True) as db:
             query = (
-                SqlBuilder.select.columns(BotSchedule.id, BotSchedule.interval_str, BotSchedule.status)
+                SqlBuilder.select.column(BotSchedule.id)
                 .join(
                     schedule_model_class,
                     BotSchedule.column("id") == schedule_model_class.column("bot_schedule_id"),
@@ -361,195 +329,45 @@ class BotScheduleHelper:
                 .where(schedule_model_class.column(f"{scope_model.__tablename__}_id") == scope_model.id)
             )
             result = db.exec(query)
-            old_schedules = cast(Any, result.all())
+            old_schedule_ids = cast(Any, result.all())
 
-        with DbSession.use(readonly=False) as db:
-            db.exec(
-                SqlBuilder.delete.table(BotSchedule).where(
-                    BotSchedule.column("id").in_([old_schedule[0] for old_schedule in old_schedules])
-                )
-            )
+        if not old_schedule_ids:
+            return
 
-        cron = BotScheduleHelper.__get_cron()
-        schedule_id_has_schedules = BotScheduleHelper.__has_interval_schedule(
-            [(old_schedule[1], old_schedule[2]) for old_schedule in old_schedules]
-        )
-        schedule_id_has_schedules = set(schedule_id_has_schedules)
-
-        for old_schedule_id, old_interval_str, old_status in old_schedules:
-            if old_schedule_id not in schedule_id_has_schedules:
-                cron.remove_all(
-                    comment=f"scheduled {old_interval_str}"
-                    if old_status == BotScheduleStatus.Pending
-                    else old_interval_str
-                )
+        with DbSession.use(readonly=False) as db:
+            db.exec(SqlBuilder.delete.table(BotSchedule).where(BotSchedule.column("id").in_(old_schedule_ids)))
 
-        BotScheduleHelper.__save_cron(cron)
+        await BotScheduleHelper.__notify_cron_jobs_changed()
 
-    @overload
-    @staticmethod
-    async def change_status(
-        schedule_model_class: type[_TBotScheduleModel],
-        schedule_model: _TBotScheduleModel | _TBaseParam,
-        status: BotScheduleStatus,
-        no_update: None = None,
-        bot_schedule: BotSchedule | None = None,
-    ) -> BotSchedule | None: ...
-    @overload
     @staticmethod
     async def change_status(
         schedule_model_class: type[_TBotScheduleModel],
         schedule_model: _TBotScheduleModel | _TBaseParam,
         status: BotScheduleStatus,
-        no_update: Literal[False],
         bot_schedule: BotSchedule | None = None,
-    ) -> BotSchedule | None: ...
-    @overload
-    @staticmethod
-    async def change_status(
-        schedule_model_class: type[_TBotScheduleModel],
-        schedule_model: _TBotScheduleModel | _TBaseParam,
-        status: BotScheduleStatus,
-        no_update: Literal[True],
-        bot_schedule: BotSchedule | None = None,
-    ) -> tuple[CronTab, bool]: ...
-    @staticmethod
-    async def change_status(
-        schedule_model_class: type[_TBotScheduleModel],
-        schedule_model: _TBotScheduleModel | _TBaseParam,
-        status: BotScheduleStatus,
-        no_update: bool | None = None,
-        bot_schedule: BotSchedule | None = None,
-    ) -> BotSchedule | tuple[CronTab, bool] | None:
+    ) -> BotSchedule | None:
         schedule_model = ServiceHelper.get_by_param(schedule_model_class, schedule_model)
-        cron = BotScheduleHelper.__get_cron()
         if not schedule_model:
-            return None if not no_update else (cron, False)
+            return None
 
         if not bot_schedule:
             bot_schedule = ServiceHelper.get_by_param(BotSchedule, schedule_model.bot_schedule_id)
             if not bot_schedule:
-                return None if not no_update else (cron, False)
+                return None
 
         old_status = bot_schedule.status
         bot_schedule.status = status
-        if not no_update:
-            with DbSession.use(readonly=False) as db:
-                db.update(bot_schedule)
-
-        has_changed = False
-        has_old_intervals = True
-        old_comment = bot_schedule.interval_str
-        if old_status == BotScheduleStatus.Pending and status == BotScheduleStatus.Started:
-            has_changed = BotScheduleHelper.__create_job(cron, bot_schedule.interval_str)
-            has_old_intervals = BotScheduleHelper.__has_interval_schedule(bot_schedule.interval_str, old_status)
-            old_comment = f"scheduled {bot_schedule.interval_str}"
-        elif old_status == BotScheduleStatus.Started and status == BotScheduleStatus.Pending:
-            has_changed = BotScheduleHelper.__create_job(cron, bot_schedule.interval_str, bot_schedule.running_type)
-            has_old_intervals = BotScheduleHelper.__has_interval_schedule(bot_schedule.interval_str, old_status)
-        elif old_status == BotScheduleStatus.Started and status == BotScheduleStatus.Stopped:
-            has_old_intervals = BotScheduleHelper.__has_interval_schedule(bot_schedule.interval_str, old_status)
-        elif old_status == BotScheduleStatus.Stopped and status == BotScheduleStatus.Started:
-            has_changed = BotScheduleHelper.__create_job(cron, bot_schedule.interval_str)
-        elif old_status == BotScheduleStatus.Pending and status == BotScheduleStatus.Stopped:
-            has_old_intervals = BotScheduleHelper.__has_interval_schedule(bot_schedule.interval_str, old_status)
-            old_comment = f"scheduled {bot_schedule.interval_str}"
-        elif old_status == BotScheduleStatus.Stopped and status == BotScheduleStatus.Pending:
-            has_changed = BotScheduleHelper.__create_job(cron, bot_schedule.interval_str, bot_schedule.running_type)
-
-        if not has_old_intervals:
-            cron.remove_all(comment=old_comment)
-
-        if has_changed or not has_old_intervals:
-            BotScheduleHelper.__save_cron(cron)
-        return bot_schedule if not no_update else (cron, has_changed)
-
-    @staticmethod
-    def __get_cron():
-        if not CRON_TAB_FILE.exists():
-            CRON_TAB_FILE.parent.mkdir(parents=True, exist_ok=True)
-            CRON_TAB_FILE.touch()
-        cron = CronTab(user=False, tabfile=str(CRON_TAB_FILE))
-        if Env.ENVIRONMENT != "local":
-            if cron.env is None:
-                cron.env = OrderedVariableList()
-            cron.env.update(environ)
-
-        if Env.ENVIRONMENT == "local":
-            cron.env = OrderedVariableList()
-
-        return cron
-
-    @staticmethod
-    def __create_job(
-        cron: CronTab,
-        interval_str: str,
-        running_type: BotScheduleRunningType | None = None,
-    ) -> bool:
-        comment = None
-        if running_type:
-            if BotSchedule.RUNNING_TYPES_WITH_START_AT.count(running_type) > 0:
-                comment = f"scheduled {interval_str}"
-        if comment is None:
-            comment = interval_str
-
-        has_job = False
-        for job in cron.find_comment(comment):
-            has_job = True
-            break
-
-        if has_job:
-            return False
-
-        job = cron.new(
-            command=f"/app/scripts/run_bot_cron.sh '{comment}'",
-            comment=comment,
-            user="/bin/bash",
-        )
-        job.setall(interval_str)
-        return True
+        with DbSession.use(readonly=False) as db:
+            db.update(bot_schedule)
 
-    @staticmethod
-    def __save_cron(cron: CronTab):
-        if Env.ENVIRONMENT == "local":
-            return
-        cron.write()
-        BotScheduleHelper.reload_cron()
+        if old_status != status:
+            await BotScheduleHelper.__notify_cron_jobs_changed()
+        return bot_schedule
 
-    @overload
-    @staticmethod
-    def __has_interval_schedule(interval_str: str, status: BotScheduleStatus) -> bool: ...
-    @overload
     @staticmethod
-    def __has_interval_schedule(
-        interval_str: list[tuple[str, BotScheduleStatus]],
-    ) -> list[SnowflakeID]: ...
-    @staticmethod
-    def __has_interval_schedule(
-        interval_str: str | list[tuple[str, BotScheduleStatus]],
-        status: BotScheduleStatus | None = None,
-    ) -> bool | list[SnowflakeID]:
-        if status is None:
-            interval_str = cast(list[tuple[str, BotScheduleStatus]], interval_str)
-            query = SqlBuilder.select.column(BotSchedule.id).where(
-                tuple_(BotSchedule.column("interval_str"), BotSchedule.column("status")).in_(interval_str)
-            )
-        else:
-            interval_str = cast(str, interval_str)
-            query = (
-                SqlBuilder.select.table(BotSchedule)
-                .where((BotSchedule.column("interval_str") == interval_str) & (BotSchedule.column("status") == status))
-                .limit(1)
-            )
-
-        result = False
-        with DbSession.use(readonly=True) as db:
-            result = db.exec(query)
-            if status is None:
-                result = cast(list[SnowflakeID], result.all())
-            else:
-                result = bool(result.first())
-        return result
+    async def __notify_cron_jobs_changed() -> None:
+        # The cron scheduler in the broker reloads the jobs when the version changes.
+        await Cache.set(BotScheduleHelper.CRON_JOBS_VERSION_CACHE_KEY, str(time_ns()))
 
     @staticmethod
     def __adjust_interval_for_utc(interval_str: str, tz: str | float) -> str:
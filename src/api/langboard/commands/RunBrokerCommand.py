@@ -1,6 +1,8 @@
 from core.bootstrap import BaseCommand, BaseCommandOptions
+from core.db import DbEngine
 from ..core.broker import Broker
 from ..Loader import ModuleLoader
+from ..tasks.bot import BotScheduleTask
 
 
 class RunBrokerCommandOptions(BaseCommandOptions):
@@ -37,6 +39,8 @@ class RunBrokerCommand(BaseCommand):
         return bool
 
     def execute(self, _: RunBrokerCommandOptions) -> None:
+        DbEngine.set_role("broker")
         ModuleLoader.load("tasks", "Task")
 
+        BotScheduleTask.create_cron_scheduler().start()
         Broker.start()
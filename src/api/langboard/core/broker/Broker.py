@@ -8,6 +8,8 @@ from celery.app.task import Task
 from celery.apps import worker
 from celery.apps.worker import Worker
 from celery.signals import celeryd_after_setup, setup_logging
+from core.caching import Cache
+from core.db import DbEngine
 from core.Env import Env
 from core.utils.decorators import class_instance
 from ...Constants import SCHEMA_DIR
@@ -41,6 +43,21 @@ def _(sender: str, instance: Worker, **kwargs) -> None:
 worker.safe_say = lambda _, __: None
 
 
+def _run_async_task(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Runs the task in a new event loop and releases the loop-bound resources it opened before the loop closes."""
+
+    async def run_and_release() -> Any:
+        try:
+            return await coro
+        finally:
+            logger.debug("Database pools after the task: %s", DbEngine.get_pool_stats())
+            logger.debug("Cache after the task: %s", Cache.stats())
+            await DbEngine.dispose_async_engines()
+            await Cache.close_loop_resources()
+
+    return run_async(run_and_release())
+
+
 @class_instance()
 class Broker:
     _schemas = {}
@@ -80,13 +97,13 @@ class Broker:
         if Env.ENVIRONMENT == "local":
 
             def local_task(*args: _TParams.args, **kwargs: _TParams.kwargs):
-                return Thread(target=run_async, args=(func(*args, **kwargs),)).start()
+                return Thread(target=_run_async_task, args=(func(*args, **kwargs),)).start()
 
             return local_task
 
         def task(*args: _TParams.args, **kwargs: _TParams.kwargs) -> Any:
             new_args, new_kwargs = self.__unpack_task_parameters(func, *args, **kwargs)
-            return run_async(func(*new_args, **new_kwargs))
+            return _run_async_task(func(*new_args, **new_kwargs))
 
         task.__module__ = func.__module__
         task.__name__ = func.__name__
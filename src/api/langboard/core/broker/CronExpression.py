@@ -0,0 +1,87 @@
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from crontab import SPECIALS, CronItem, CronSlice
+
+
+class CronExpression:
+    """A cron interval string expanded to the values of its fields, to compute its fire times in UTC.
+
+    ``@reboot`` never fires by itself; the scheduler fires it once when the job is added.
+
+    :param interval_str: The cron interval string (five fields or a special such as ``@hourly``).
+    """
+
+    REBOOT = "@reboot"
+    MAX_SEARCH_YEARS = 5
+
+    def __init__(self, interval_str: str):
+        self.interval_str = interval_str
+        self.is_reboot = SPECIALS.get(interval_str.replace("@", ""), interval_str) == CronExpression.REBOOT
+        if self.is_reboot:
+            return
+
+        cron_item = CronItem()
+        cron_item.setall(interval_str)
+        minute, hour, day, month, weekday = cron_item.slices
+        self._minutes = CronExpression.__expand(minute)
+        self._hours = CronExpression.__expand(hour)
+        self._days = set(CronExpression.__expand(day))
+        self._months = set(CronExpression.__expand(month))
+        self._weekdays = {value % 7 for value in CronExpression.__expand(weekday)}
+        # As in cron, the day matches either field if both are restricted, otherwise the restricted one.
+        self._is_day_restricted = not day.render().startswith("*")
+        self._is_weekday_restricted = not weekday.render().startswith("*")
+
+    def next_after(self, after: datetime) -> datetime | None:
+        """Returns the first fire time strictly after the given time, or None if there is none within
+        :attr:`MAX_SEARCH_YEARS` years (e.g. ``0 0 30 2 *``).
+
+        :param after: The aware (or UTC) time to search from.
+        """
+        if self.is_reboot:
+            return None
+
+        if after.tzinfo is not None:
+            after = after.astimezone(timezone.utc).replace(tzinfo=None)
+        current = datetime(after.year, after.month, after.day, after.hour, after.minute) + timedelta(minutes=1)
+        max_year = current.year + CronExpression.MAX_SEARCH_YEARS
+        while current.year <= max_year:
+            if current.month not in self._months:
+                current = (current.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+                continue
+
+            if not self.__matches_day(current):
+                current = current.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+
+            hour_index = bisect_left(self._hours, current.hour)
+            if hour_index == len(self._hours):
+                current = current.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if self._hours[hour_index] != current.hour:
+                current = current.replace(hour=self._hours[hour_index], minute=0)
+
+            minute_index = bisect_left(self._minutes, current.minute)
+            if minute_index == len(self._minutes):
+                current = current.replace(minute=0) + timedelta(hours=1)
+                continue
+
+            return current.replace(minute=self._minutes[minute_index], tzinfo=timezone.utc)
+        return None
+
+    def __matches_day(self, date: datetime) -> bool:
+        matches_day = date.day in self._days
+        matches_weekday = (date.weekday() + 1) % 7 in self._weekdays
+        if self._is_day_restricted and self._is_weekday_restricted:
+            return matches_day or matches_weekday
+        return matches_day and matches_weekday
+
+    @staticmethod
+    def __expand(cron_slice: CronSlice) -> list[int]:
+        values: set[int] = set()
+        for part in cron_slice.parts:
+            if hasattr(part, "range"):
+                values.update(part.range())
+            else:
+                values.add(int(part))
+        return sorted(values)
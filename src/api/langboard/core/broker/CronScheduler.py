@@ -0,0 +1,195 @@
+from asyncio import Task, create_task, gather
+from asyncio import run as run_async
+from asyncio import sleep as async_sleep
+from datetime import datetime, timezone
+from heapq import heappop, heappush
+from threading import Thread
+from time import monotonic, time
+from typing import Any, Awaitable, Callable
+from ..logger import Logger
+from .CronExpression import CronExpression
+
+
+logger = Logger.use("CronScheduler")
+
+
+class CronScheduler:
+    """Fires cron jobs from a heap of their next fire times in a long-running loop.
+
+    The jobs are reloaded when the value returned by ``get_version`` changes (checked every :attr:`POLL_INTERVAL`
+    seconds) and at least every :attr:`RELOAD_INTERVAL` seconds, so schedule writes from other processes are picked
+    up without restarting anything.
+
+    The clock and the sleep function can be replaced (e.g. with a fake clock) to drive the scheduler and measure its
+    drift (how late a job fires after its fire time) and latency (how long a fired job takes).
+
+    :param load_jobs: Returns the interval strings of the jobs to schedule by their keys.
+    :param on_fire: Called with the key of a job when it fires.
+    :param get_version: Returns a value changing whenever the jobs change.
+    :param clock: Returns the current POSIX timestamp.
+    :param sleep: Sleeps for the given seconds.
+    """
+
+    POLL_INTERVAL = 1.0
+    RELOAD_INTERVAL = 60.0
+
+    def __init__(
+        self,
+        load_jobs: Callable[[], Awaitable[dict[str, str]]],
+        on_fire: Callable[[str], Awaitable[Any]],
+        get_version: Callable[[], Awaitable[Any]] | None = None,
+        clock: Callable[[], float] = time,
+        sleep: Callable[[float], Awaitable[Any]] = async_sleep,
+    ):
+        self._load_jobs = load_jobs
+        self._on_fire = on_fire
+        self._get_version = get_version
+        self._clock = clock
+        self._sleep = sleep
+        self._expressions: dict[str, CronExpression] = {}
+        self._fire_times: dict[str, float] = {}
+        self._heap: list[tuple[float, str]] = []
+        self._running_tasks: set[Task] = set()
+        self._version: Any = None
+        self._reloaded_at = float("-inf")
+        self._is_running = False
+        self.fired_count = 0
+        self.total_drift = 0.0
+        self.max_drift = 0.0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    @property
+    def average_drift(self) -> float:
+        return self.total_drift / self.fired_count if self.fired_count else 0.0
+
+    @property
+    def average_latency(self) -> float:
+        return self.total_latency / self.fired_count if self.fired_count else 0.0
+
+    def get_next_fire_time(self, key: str) -> float | None:
+        return self._fire_times.get(key)
+
+    def start(self) -> Thread:
+        """Runs the scheduler in a daemon thread with its own event loop."""
+        thread = Thread(target=run_async, args=(self.run(),), name="CronScheduler", daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self) -> None:
+        self._is_running = False
+
+    async def run(self) -> None:
+        self._is_running = True
+        while self._is_running:
+            try:
+                await self.reload(force=False)
+            except Exception as e:
+                logger.error("Failed to reload the cron jobs: %s", e)
+
+            now = self._clock()
+            self.fire_due(now)
+            next_fire_time = self._heap[0][0] if self._heap else now + CronScheduler.POLL_INTERVAL
+            await self._sleep(max(min(next_fire_time, now + CronScheduler.POLL_INTERVAL) - now, 0.0))
+
+    async def reload(self, force: bool = True) -> None:
+        """Reloads the jobs if they have changed (or unconditionally if ``force`` is set).
+
+        :param force: Whether to reload the jobs even if the version has not changed.
+        """
+        now = self._clock()
+        is_expired = now - self._reloaded_at >= CronScheduler.RELOAD_INTERVAL
+        if self._get_version is not None:
+            version = await self._get_version()
+            if version != self._version:
+                self._version = version
+                is_expired = True
+
+        if not force and not is_expired:
+            return
+
+        self.set_jobs(await self._load_jobs())
+        self._reloaded_at = now
+
+    def set_jobs(self, jobs: dict[str, str]) -> None:
+        """Replaces the scheduled jobs, keeping the next fire times of the unchanged ones.
+
+        :param jobs: The interval strings of the jobs by their keys.
+        """
+        now = self._clock()
+        for key in list(self._expressions):
+            if key not in jobs:
+                self._expressions.pop(key)
+                self._fire_times.pop(key, None)
+
+        for key, interval_str in jobs.items():
+            expression = self._expressions.get(key)
+            if expression is not None and expression.interval_str == interval_str:
+                continue
+
+            expression = CronExpression(interval_str)
+            self._expressions[key] = expression
+            self.__schedule(key, now if expression.is_reboot else self.__get_next_fire_time(expression, now))
+
+        # Drops the stale entries once they outnumber the live ones, so the heap does not grow with the reloads.
+        if len(self._heap) > 2 * len(self._fire_times) + 16:
+            self._heap = [(fire_time, key) for key, fire_time in self._fire_times.items()]
+            self._heap.sort()
+
+    def fire_due(self, now: float) -> list[str]:
+        """Fires the jobs due at the given time and schedules their next fire times.
+
+        :param now: The current POSIX timestamp.
+        :return list[str]: The keys of the fired jobs.
+        """
+        fired_keys: list[str] = []
+        while self._heap and self._heap[0][0] <= now:
+            fire_time, key = heappop(self._heap)
+            if self._fire_times.get(key) != fire_time:
+                continue
+
+            drift = now - fire_time
+            self.fired_count += 1
+            self.total_drift += drift
+            self.max_drift = max(self.max_drift, drift)
+            fired_keys.append(key)
+
+            # Missed fire times are skipped instead of being fired one after another.
+            self._fire_times.pop(key)
+            self.__schedule(key, self.__get_next_fire_time(self._expressions[key], now))
+            self.__dispatch(key)
+        return fired_keys
+
+    async def wait_until_idle(self) -> None:
+        """Waits for the fired jobs to finish."""
+        # The finished tasks are discarded by their done callbacks, which only run once the loop gets control back.
+        while running_tasks := [task for task in self._running_tasks if not task.done()]:
+            await gather(*running_tasks)
+
+    def __schedule(self, key: str, fire_time: float | None) -> None:
+        if fire_time is None:
+            self._fire_times.pop(key, None)
+            return
+        self._fire_times[key] = fire_time
+        heappush(self._heap, (fire_time, key))
+
+    def __dispatch(self, key: str) -> None:
+        async def fire():
+            started_at = monotonic()
+            try:
+                await self._on_fire(key)
+            except Exception as e:
+                logger.error("Failed to run the cron job %s: %s", key, e)
+            finally:
+                latency = monotonic() - started_at
+                self.total_latency += latency
+                self.max_latency = max(self.max_latency, latency)
+
+        task = create_task(fire())
+        self._running_tasks.add(task)
+        task.add_done_callback(self._running_tasks.discard)
+
+    @staticmethod
+    def __get_next_fire_time(expression: CronExpression, now: float) -> float | None:
+        next_fire_at = expression.next_after(datetime.fromtimestamp(now, timezone.utc))
+        return next_fire_at.timestamp() if next_fire_at is not None else None
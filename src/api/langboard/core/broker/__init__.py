@@ -1,6 +1,10 @@
 from .Broker import Broker
+from .CronExpression import CronExpression
+from .CronScheduler import CronScheduler
 
 
 __all__ = [
     "Broker",
+    "CronExpression",
+    "CronScheduler",
 ]
@@ -0,0 +1,34 @@
+from core.caching import Cache
+from core.Env import Env
+from core.routing import BaseMiddleware
+from starlette.types import Message, Send
+
+
+class CacheStatsMiddleware(BaseMiddleware):
+    """Reports the hit/miss counters of each cache tier of the process outside production.
+
+    The counters are added to a ``Server-Timing`` response header (``cache-l1;desc="..."`` and
+    ``cache-l2;desc="..."``) for profiling. They are cumulative since the process started, not per request.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or Env.ENVIRONMENT == "production":
+            await self.app(scope, receive, send)
+            return
+
+        await self.app(scope, receive, self.__create_send_with_stats(send))
+
+    def __create_send_with_stats(self, send: Send) -> Send:
+        async def send_with_stats(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                server_timings = []
+                for tier, tier_stats in Cache.stats().items():
+                    description = f"{tier_stats['hits']} hits, {tier_stats['misses']} misses"
+                    if "size" in tier_stats:
+                        description = f"{description}, {tier_stats['size']} entries"
+                    server_timings.append(f'cache-{tier};desc="{description}"')
+                server_timing = ", ".join(server_timings)
+                message["headers"] = [*message.get("headers", []), (b"server-timing", server_timing.encode())]
+            await send(message)
+
+        return send_with_stats
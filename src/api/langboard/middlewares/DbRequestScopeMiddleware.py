@@ -0,0 +1,54 @@
+from core.db import DbEngine, DbRequestScope
+from core.Env import Env
+from core.routing import BaseMiddleware
+from starlette.types import Message, Send
+from ..core.logger import Logger
+
+
+logger = Logger.use("db")
+
+
+class DbRequestScopeMiddleware(BaseMiddleware):
+    """Shares one readonly database connection per driver between every session opened while handling the request.
+
+    The connections checked out and the statements executed by each request are logged at debug level and, outside
+    production, reported in a ``Server-Timing`` response header (``db;desc="<connections> connections, <queries>
+    queries"``) for profiling, followed by the state of each connection pool of the process
+    (``db-pool-<engine>;dur=<average checkout wait in ms>;desc="..."``).
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async with DbRequestScope.use() as db_scope:
+            if Env.ENVIRONMENT != "production":
+                send = self.__create_send_with_stats(db_scope, send)
+
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                logger.debug(
+                    f"{scope['method']} {scope['path']}: "
+                    f"{db_scope.connections} connection(s), {db_scope.queries} quer(ies)"
+                )
+
+    def __create_send_with_stats(self, db_scope: DbRequestScope, send: Send) -> Send:
+        async def send_with_stats(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                stats = db_scope.stats()
+                server_timings = [f'db;desc="{stats["connections"]} connections, {stats["queries"]} queries"']
+                for name, pool_stats in DbEngine.get_pool_stats().items():
+                    description = (
+                        f"{pool_stats['checked_out']}/{pool_stats['size']} checked out, "
+                        f"{pool_stats['overflow']} overflow, {pool_stats['checkouts']} checkouts, "
+                        f"max wait {pool_stats['max_wait_ms']:.2f}ms"
+                    )
+                    metric_name = f"db-pool-{name.replace('_', '-')}"
+                    server_timings.append(f'{metric_name};dur={pool_stats["avg_wait_ms"]:.2f};desc="{description}"')
+                server_timing = ", ".join(server_timings)
+                message["headers"] = [*message.get("headers", []), (b"server-timing", server_timing.encode())]
+            await send(message)
+
+        return send_with_stats
@@ -30,7 +30,7 @@ async def update_profile(
     user: User = Auth.scope("api_user"),
     service: Service = Service.scope(),
 ) -> JsonResponse:
-    file_model = Storage.upload(avatar, StorageName.Avatar) if avatar else None
+    file_model = await Storage.upload_async(avatar, StorageName.Avatar) if avatar else None
     form_dict = form.model_dump()
     if file_model:
         form_dict["avatar"] = file_model
@@ -29,7 +29,7 @@ async def signup(
     if user:
         return JsonResponse(content=ApiErrorCode.EX1003, status_code=status.HTTP_409_CONFLICT)
 
-    file_model = Storage.upload(avatar, StorageName.Avatar) if avatar else None
+    file_model = await Storage.upload_async(avatar, StorageName.Avatar) if avatar else None
     user, _ = await service.user.create(form.model_dump(), avatar=file_model)
 
     cache_key = service.user.create_cache_name("signup", user.email)
@@ -1,17 +1,46 @@
-from json import dumps as json_dumps
-from json import loads as json_loads
+from asyncio import Semaphore, Task, create_task, gather
+from time import perf_counter
 from typing import cast
+from core.Env import Env
 from core.filter import AuthFilter
-from core.routing import AppExceptionHandlingRoute, AppRouter, JsonResponse
-from core.utils.Converter import json_default
+from core.routing import AppExceptionHandlingRoute, AppRouter
+from core.serialization import JsonCodec
 from fastapi import Request, status
+from fastapi.responses import Response
 from models import Bot, User
 from starlette.types import Message
 from ...security import Auth
-from .BatchForm import BatchForm
+from .BatchForm import BatchForm, BatchFormRequestSchema
 
 
 _cached_apis: dict[str, str] = {}
+_API_METHODS = {"GET", "POST", "PUT", "DELETE"}
+_MAX_CONCURRENT_REQUESTS = 8
+# The sub-requests have their own uncompressed bodies, and their responses are spliced into the batch response as is.
+_DROPPED_SUB_REQUEST_HEADERS = {b"accept-encoding", b"content-encoding", b"content-length"}
+
+
+class _BatchResponse:
+    """Collects the response of a request in the batch as raw bytes, so it is spliced into the batch response as is."""
+
+    def __init__(self):
+        self.status = status.HTTP_200_OK
+        self.is_json = True
+        self.chunks: list[bytes] = []
+        self.duration = 0.0
+
+    def fail(self) -> None:
+        self.status = status.HTTP_500_INTERNAL_SERVER_ERROR
+        self.is_json = True
+        self.chunks = [b'{"error":"Internal server error"}']
+
+    def render(self) -> bytes:
+        body = b"".join(self.chunks)
+        if not body:
+            body = b"{}"
+        elif not self.is_json:
+            body = b'{"error":"Invalid JSON response"}'
+        return b'{"status":%d,"body":%s}' % (self.status, body)
 
 
 @AppRouter.schema(form=BatchForm)
@@ -21,74 +50,118 @@ _cached_apis: dict[str, str] = {}
     description="Batch API for processing multiple requests in a single call. The response will be a list of responses corresponding to each request schema provided in the form.",
 )
 @AuthFilter.add()
-async def batch_apis(request: Request, form: BatchForm, user_or_bot: User | Bot = Auth.scope("api")):
+async def batch_apis(request: Request, form: BatchForm, user_or_bot: User | Bot = Auth.scope("api")) -> Response:
     if not _cached_apis:
         _set_cache_apis()
 
-    API_METHODS = {"GET", "POST", "PUT", "DELETE"}
-    responses = []
-    for request_schema in form.request_schemas:
-        if request_schema.method.upper() not in API_METHODS:
-            responses.append(_batch_response({}, status.HTTP_400_BAD_REQUEST))
+    responses = [_BatchResponse() for _ in form.request_schemas]
+    semaphore = Semaphore(_MAX_CONCURRENT_REQUESTS)
+    concurrent_tasks: list[tuple[Task, _BatchResponse]] = []
+    for request_schema, response in zip(form.request_schemas, responses):
+        method = request_schema.method.upper()
+        if method not in _API_METHODS:
+            response.status = status.HTTP_400_BAD_REQUEST
             continue
 
-        if request_schema.path_or_api_name in _cached_apis:
-            request_schema.path_or_api_name = _cached_apis[request_schema.path_or_api_name]
-            try:
-                request_schema.path_or_api_name = request_schema.path_or_api_name.format(
-                    **{**(request_schema.form or {}), **(request_schema.query or {})}
-                )
-            except Exception:
-                pass
-
-        query_string = _query_dict_to_bytes(request_schema.query or {})
-        scope = {
-            "type": "http",
-            "method": request_schema.method,
-            "path": request_schema.path_or_api_name,
-            "query_string": query_string,
-            "headers": request.headers.raw,
-            "auth": user_or_bot,
-            "is_batch": True,
-        }
-
-        response = {}
-        responses.append(response)
-
-        async def receive():
-            message = b""
-            if request_schema.form:
-                message = json_dumps(request_schema.form, default=json_default).encode()
-            return {"type": "http.request", "body": message, "more_body": False}
-
-        async def send(message: Message):
-            message_type = message.get("type")
-            if message_type == "http.response.start":
-                response["status"] = message.get("status", status.HTTP_200_OK)
-                return
-
-            if message_type != "http.response.body":
-                return
-
-            body = message.get("body", b"{}")
-            try:
-                response["body"] = json_loads(body) if body else {}
-            except Exception:
-                response["body"] = {"error": "Invalid JSON response"}
-
-        await AppRouter.get_app()(scope, receive, send)
-
-    return JsonResponse(content=responses, status_code=status.HTTP_200_OK)
+        if form.concurrent and method == "GET":
+            task = create_task(_process_request_concurrently(semaphore, request, user_or_bot, request_schema, response))
+            concurrent_tasks.append((task, response))
+            continue
+
+        # The other requests may depend on the ones before them, so the GET requests in progress must finish first.
+        await _wait_for_concurrent_tasks(concurrent_tasks)
+        await _process_request(request, user_or_bot, request_schema, response)
+
+    await _wait_for_concurrent_tasks(concurrent_tasks)
+
+    headers = {}
+    if Env.ENVIRONMENT != "production":
+        headers["Server-Timing"] = ", ".join(
+            f"batch-{i};dur={response.duration * 1000:.1f}" for i, response in enumerate(responses)
+        )
+
+    content = b"[" + b",".join(response.render() for response in responses) + b"]"
+    return Response(content=content, status_code=status.HTTP_200_OK, headers=headers, media_type="application/json")
+
+
+async def _wait_for_concurrent_tasks(concurrent_tasks: list[tuple[Task, _BatchResponse]]) -> None:
+    """Waits for all the concurrent requests, so a failing one neither aborts nor orphans the others.
+
+    The failed requests are rendered as 500 entries in their slots.
+    """
+    results = await gather(*(task for task, _ in concurrent_tasks), return_exceptions=True)
+    for (_, response), result in zip(concurrent_tasks, results):
+        if isinstance(result, BaseException):
+            response.fail()
+    concurrent_tasks.clear()
+
+
+async def _process_request_concurrently(
+    semaphore: Semaphore,
+    request: Request,
+    user_or_bot: User | Bot,
+    request_schema: BatchFormRequestSchema,
+    response: _BatchResponse,
+) -> None:
+    async with semaphore:
+        await _process_request(request, user_or_bot, request_schema, response)
+
+
+async def _process_request(
+    request: Request, user_or_bot: User | Bot, request_schema: BatchFormRequestSchema, response: _BatchResponse
+) -> None:
+    path = request_schema.path_or_api_name
+    if path in _cached_apis:
+        path = _cached_apis[path]
+        try:
+            path = path.format(**{**(request_schema.form or {}), **(request_schema.query or {})})
+        except Exception:
+            pass
+
+    query_string = _query_dict_to_bytes(request_schema.query or {})
+    scope = {
+        "type": "http",
+        "method": request_schema.method,
+        "path": path,
+        "query_string": query_string,
+        "headers": [
+            (name, value) for name, value in request.headers.raw if name.lower() not in _DROPPED_SUB_REQUEST_HEADERS
+        ],
+        "auth": user_or_bot,
+        "is_batch": True,
+    }
+
+    body = b""
+    if request_schema.form:
+        body = JsonCodec.dumps(request_schema.form)
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: Message):
+        message_type = message.get("type")
+        if message_type == "http.response.start":
+            response.status = message.get("status", status.HTTP_200_OK)
+            for name, value in message.get("headers", []):
+                name = name.lower()
+                if name == b"content-type":
+                    response.is_json = response.is_json and value.startswith(b"application/json")
+                elif name == b"content-encoding":
+                    response.is_json = False
+            return
+
+        if message_type == "http.response.body":
+            response.chunks.append(message.get("body", b""))
+
+    started_at = perf_counter()
+    await AppRouter.get_app()(scope, receive, send)
+    response.duration = perf_counter() - started_at
 
 
 def _query_dict_to_bytes(query: dict) -> bytes:
     return b"&".join(f"{key}={value}".encode() for key, value in query.items() if value is not None)
 
 
-def _batch_response(content: dict, status_code: int = status.HTTP_200_OK) -> dict:
-    return {"status": status_code, "body": content}
-
-
 def _set_cache_apis():
     for route in AppRouter.get_app().routes:
         route = cast(AppExceptionHandlingRoute, route)
@@ -32,3 +32,8 @@ class BatchForm(BaseFormModel):
         }
     ]""",
     )
+    concurrent: bool = Field(
+        default=False,
+        title="Concurrent",
+        description="If true, consecutive GET requests are processed concurrently. The other requests are still processed in order, after every request before them has finished.",
+    )
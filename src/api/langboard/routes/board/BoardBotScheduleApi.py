@@ -213,7 +213,7 @@ async def reschedule_bot_crons(
     if not target_model_class:
         return JsonResponse(content=ApiErrorCode.VA3003, status_code=status.HTTP_400_BAD_REQUEST)
 
-    bot_schedule = ServiceHelper.get_by_param(target_model_class, schedule_uid)
+    bot_schedule = await ServiceHelper.get_by_param_async(target_model_class, schedule_uid)
     if not bot_schedule:
         return JsonResponse(content=ApiErrorCode.NF2015, status_code=status.HTTP_404_NOT_FOUND)
 
@@ -65,7 +65,7 @@ async def toggle_bot_trigger_condition(
     if not scope_model_class:
         return JsonResponse(content=ApiErrorCode.VA3003, status_code=status.HTTP_400_BAD_REQUEST)
 
-    bot_scope = ServiceHelper.get_by_param(scope_model_class, bot_scope_uid)
+    bot_scope = await ServiceHelper.get_by_param_async(scope_model_class, bot_scope_uid)
     if not bot_scope:
         return JsonResponse(content=ApiErrorCode.NF2020, status_code=status.HTTP_404_NOT_FOUND)
 
@@ -99,7 +99,7 @@ async def delete_bot_scope(
     if not scope_model_class:
         return JsonResponse(content=ApiErrorCode.VA3003, status_code=status.HTTP_400_BAD_REQUEST)
 
-    bot_scope = ServiceHelper.get_by_param(scope_model_class, bot_scope_uid)
+    bot_scope = await ServiceHelper.get_by_param_async(scope_model_class, bot_scope_uid)
     if not bot_scope:
         return JsonResponse(content=ApiErrorCode.NF2020, status_code=status.HTTP_404_NOT_FOUND)
 
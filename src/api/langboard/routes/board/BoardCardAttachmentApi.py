@@ -41,7 +41,7 @@ async def upload_card_attachment(
     if not attachment:
         raise MissingException("body", "attachment")
 
-    file_model = Storage.upload(attachment, StorageName.CardAttachment)
+    file_model = await Storage.upload_async(attachment, StorageName.CardAttachment)
     if not file_model:
         return JsonResponse(content=ApiErrorCode.OP1002, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
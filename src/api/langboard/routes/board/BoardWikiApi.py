@@ -329,7 +329,7 @@ async def upload_wiki_attachment(
     if not attachment:
         raise MissingException("body", "attachment")
 
-    file_model = Storage.upload(attachment, StorageName.Wiki)
+    file_model = await Storage.upload_async(attachment, StorageName.Wiki)
     if not file_model:
         return JsonResponse(
             content=ApiErrorCode.OP1002,
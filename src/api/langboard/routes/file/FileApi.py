@@ -1,17 +1,95 @@
+from email.utils import formatdate, parsedate_to_datetime
 from mimetypes import guess_type
 from core.routing import AppRouter, JsonResponse
-from fastapi import Path, Response, status
+from core.storage import StorageStream
+from fastapi import Path, Request, Response, status
+from fastapi.responses import FileResponse, StreamingResponse
 from ...core.storage import Storage
 
 
 @AppRouter.api.get("/file/{storage_type}/{storage_name}/{filename}", tags=["General"])
-def get_file(storage_type: str = Path(), storage_name: str = Path(), filename: str = Path()) -> Response:
+def get_file(
+    request: Request, storage_type: str = Path(), storage_name: str = Path(), filename: str = Path()
+) -> Response:
     media_type, _ = guess_type(filename)
     if media_type is None:
         return JsonResponse(status_code=status.HTTP_404_NOT_FOUND)
 
-    file = Storage.get(storage_type, storage_name, filename)
-    if file is None:
+    stream = Storage.open_stream(storage_type, storage_name, filename)
+    if stream is None:
         return JsonResponse(status_code=status.HTTP_404_NOT_FOUND)
 
-    return Response(content=file, media_type=media_type)
+    headers = {
+        "etag": stream.etag,
+        "last-modified": formatdate(stream.last_modified, usegmt=True),
+        "accept-ranges": "bytes",
+    }
+    if _is_not_modified(request, stream):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    # Local files are read in chunks by the server, which also answers the range requests itself.
+    if stream.local_path is not None:
+        return FileResponse(stream.local_path, media_type=media_type, headers=headers)
+
+    byte_range = _get_byte_range(request, stream, headers)
+    if byte_range is None:
+        headers["content-length"] = str(stream.size)
+        return StreamingResponse(stream.iter_chunks(), media_type=media_type, headers=headers)
+
+    start, end = byte_range
+    if start > end:
+        return Response(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={"content-range": f"bytes */{stream.size}"},
+        )
+
+    headers["content-range"] = f"bytes {start}-{end}/{stream.size}"
+    headers["content-length"] = str(end - start + 1)
+    return StreamingResponse(
+        stream.iter_chunks(start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=media_type,
+        headers=headers,
+    )
+
+
+def _is_not_modified(request: Request, stream: StorageStream) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etags = [etag.strip().removeprefix("W/") for etag in if_none_match.split(",")]
+        return "*" in etags or stream.etag in etags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+
+    try:
+        return int(stream.last_modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+
+
+def _get_byte_range(request: Request, stream: StorageStream, headers: dict[str, str]) -> tuple[int, int] | None:
+    """Parses a single ``bytes`` range of the request; multiple ranges are answered with the whole file.
+
+    :return tuple[int, int]: The first and last offsets of the range (the first is greater if it is unsatisfiable).
+    :return None: If the whole file should be sent.
+    """
+    range_header = request.headers.get("range")
+    if not range_header or not range_header.startswith("bytes=") or "," in range_header:
+        return None
+
+    if_range = request.headers.get("if-range")
+    if if_range is not None and if_range not in (headers["etag"], headers["last-modified"]):
+        return None
+
+    start, _, end = range_header.removeprefix("bytes=").strip().partition("-")
+    try:
+        if not start:
+            suffix_length = int(end)
+            return max(stream.size - suffix_length, 0), stream.size - 1
+        if not end:
+            return int(start), stream.size - 1
+        return int(start), min(int(end), stream.size - 1)
+    except ValueError:
+        return None
@@ -1,28 +1,33 @@
+from hashlib import md5
 from json import dumps as json_dumps
 from re import findall as re_findall
 from typing import Any, Literal, cast
 from core.routing import AppExceptionHandlingRoute, AppRouter, JsonResponse
 from core.schema import OpenApiSchema
+from core.serialization import JsonCodec
 from core.utils.datamodel.parser.jsonschema import JsonSchemaParser
-from fastapi import Query, status
+from fastapi import Query, Request, Response, status
 
 
 PATH_PARAM_PATTERN = r"\{([^}]+)\}"
 
+# The routes are fixed once the app is created, so the routes with a schema are indexed by api name on first use and
+# each schema is generated once and kept as encoded JSON.
+_schema_routes: dict[str, AppExceptionHandlingRoute] = {}
+_cached_schemas: dict[str, bytes] = {}
+_cached_api_list: bytes = b""
+
 
 @AppRouter.api.get(
     "/schema/api", tags=["Schema"], responses=OpenApiSchema().suc({"apis": {"<name>": "<description>"}}).get()
 )
-async def get_api_list():
-    apis: dict[str, str] = {}
-    for route in AppRouter.api.routes:
-        route = cast(AppExceptionHandlingRoute, route)
-        if not hasattr(route.endpoint, "_schema"):
-            continue
-        api_name = route.endpoint.__name__
-        apis[api_name] = route.description
+async def get_api_list(request: Request):
+    global _cached_api_list
+    if not _cached_api_list:
+        apis = {api_name: route.description for api_name, route in _get_schema_routes().items()}
+        _cached_api_list = JsonCodec.dumps({"apis": apis})
 
-    return JsonResponse(content={"apis": apis})
+    return _create_cached_response(request, _cached_api_list)
 
 
 @AppRouter.api.get(
@@ -46,17 +51,12 @@ async def get_api_list():
     )
     .get(),
 )
-async def get_api_schema(api_name: str):
-    for route in AppRouter.api.routes:
-        route = cast(AppExceptionHandlingRoute, route)
-        name = route.endpoint.__name__
-        if not hasattr(route.endpoint, "_schema") or name != api_name:
-            continue
+async def get_api_schema(request: Request, api_name: str):
+    schema = _get_cached_schema(api_name)
+    if schema is None:
+        return JsonResponse(status_code=status.HTTP_404_NOT_FOUND)
 
-        schema = _get_schema(route)
-
-        return JsonResponse(content={"schema": schema})
-    return JsonResponse(status_code=status.HTTP_404_NOT_FOUND)
+    return _create_cached_response(request, b'{"schema":%s}' % schema)
 
 
 @AppRouter.api.get(
@@ -82,19 +82,47 @@ async def get_api_schema(api_name: str):
     )
     .get(),
 )
-async def get_api_schema_list(api_names: str = Query(...)):
-    schemas = {}
-    api_name_list = api_names.split(",")
-    for route in AppRouter.api.routes:
-        route = cast(AppExceptionHandlingRoute, route)
-        name = route.endpoint.__name__
-        if not hasattr(route.endpoint, "_schema") or name not in api_name_list:
+async def get_api_schema_list(request: Request, api_names: str = Query(...)):
+    api_name_list = set(api_names.split(","))
+    schemas: list[bytes] = []
+    for api_name in _get_schema_routes():
+        if api_name not in api_name_list:
             continue
 
-        schema = _get_schema(route)
-        schemas[name] = schema
+        schema = cast(bytes, _get_cached_schema(api_name))
+        schemas.append(JsonCodec.dumps(api_name) + b":" + schema)
+
+    return _create_cached_response(request, b'{"schemas":{%s}}' % b",".join(schemas))
+
+
+def _get_schema_routes() -> dict[str, AppExceptionHandlingRoute]:
+    if not _schema_routes:
+        for route in AppRouter.api.routes:
+            route = cast(AppExceptionHandlingRoute, route)
+            if hasattr(route.endpoint, "_schema"):
+                _schema_routes.setdefault(route.endpoint.__name__, route)
+    return _schema_routes
+
+
+def _get_cached_schema(api_name: str) -> bytes | None:
+    if api_name not in _cached_schemas:
+        route = _get_schema_routes().get(api_name)
+        if route is None:
+            return None
+        _cached_schemas[api_name] = JsonCodec.dumps(_get_schema(route))
+    return _cached_schemas[api_name]
+
+
+def _create_cached_response(request: Request, content: bytes) -> Response:
+    etag = f'"{md5(content, usedforsecurity=False).hexdigest()}"'
+    headers = {"etag": etag, "cache-control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        if "*" in etags or etag in etags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-    return JsonResponse(content={"schemas": schemas})
+    return Response(content=content, headers=headers, media_type="application/json")
 
 
 def _get_schema(route: AppExceptionHandlingRoute):
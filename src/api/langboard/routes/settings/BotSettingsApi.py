@@ -29,7 +29,7 @@ async def create_bot(
     service: Service = Service.scope(),
 ) -> JsonResponse:
     uploaded_avatar = None
-    file_model = Storage.upload(avatar, StorageName.BotAvatar) if avatar else None
+    file_model = await Storage.upload_async(avatar, StorageName.BotAvatar) if avatar else None
     if file_model:
         uploaded_avatar = file_model
 
@@ -101,7 +101,7 @@ async def update_bot(
     if "ip_whitelist" in form_dict:
         form_dict.pop("ip_whitelist")
 
-    file_model = Storage.upload(avatar, StorageName.BotAvatar) if avatar else None
+    file_model = await Storage.upload_async(avatar, StorageName.BotAvatar) if avatar else None
     if file_model:
         form_dict["avatar"] = file_model
 
@@ -33,7 +33,7 @@ async def create_internal_bot(
     if is_invalid:
         return JsonResponse(content=ApiErrorCode.VA0000, status_code=status.HTTP_400_BAD_REQUEST)
 
-    file_model = Storage.upload(avatar, StorageName.InternalBot) if avatar else None
+    file_model = await Storage.upload_async(avatar, StorageName.InternalBot) if avatar else None
     internal_bot = await service.internal_bot.create(
         form.bot_type,
         form.display_name,
@@ -68,7 +68,7 @@ async def update_internal_bot(
         return JsonResponse(content=ApiErrorCode.NF3004, status_code=status.HTTP_404_NOT_FOUND)
 
     form_dict = form.model_dump()
-    file_model = Storage.upload(avatar, StorageName.InternalBot) if avatar else None
+    file_model = await Storage.upload_async(avatar, StorageName.InternalBot) if avatar else None
     if file_model:
         form_dict["avatar"] = file_model
 
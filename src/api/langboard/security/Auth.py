@@ -1,6 +1,6 @@
 from typing import Any, Literal, cast, overload
 from core.caching import Cache
-from core.db import DbSession, SqlBuilder
+from core.db import AsyncDbSession, SqlBuilder
 from core.Env import Env
 from core.security import AuthSecurity
 from core.utils.decorators import staticclass
@@ -88,8 +88,8 @@ class Auth:
 
         try:
             user = None
-            with DbSession.use(readonly=True) as db:
-                result = db.exec(SqlBuilder.select.table(User).where(User.column("id") == user_id).limit(1))
+            async with AsyncDbSession.use(readonly=True) as db:
+                result = await db.exec(SqlBuilder.select.table(User).where(User.column("id") == user_id).limit(1))
                 user = result.first()
             if not user:
                 return InvalidTokenError("Invalid token")
@@ -123,8 +123,10 @@ class Auth:
 
         try:
             bot = None
-            with DbSession.use(readonly=True) as db:
-                result = db.exec(SqlBuilder.select.table(Bot).where(Bot.column("app_api_token") == api_token).limit(1))
+            async with AsyncDbSession.use(readonly=True) as db:
+                result = await db.exec(
+                    SqlBuilder.select.table(Bot).where(Bot.column("app_api_token") == api_token).limit(1)
+                )
                 bot = result.first()
             if not bot:
                 return None
@@ -144,6 +146,8 @@ class Auth:
         if user.is_new():
             return
 
+        AuthSecurity.forget_user_tokens(user.id)
+
         cache_key = f"auth-user-{user.id}"
         await Cache.delete(cache_key)
 
@@ -231,13 +235,11 @@ class Auth:
             return bot
 
         ip = cast(str, ip)
-        if isinstance(bot.ip_whitelist, str):
-            bot.ip_whitelist = bot.ip_whitelist.split(",")
-
-        if ALLOWED_ALL_IPS in bot.ip_whitelist:
+        ip_whitelist = bot.ip_whitelist.split(",") if isinstance(bot.ip_whitelist, str) else bot.ip_whitelist
+        if ALLOWED_ALL_IPS in ip_whitelist:
             return bot
 
-        for ip_range in bot.ip_whitelist:
+        for ip_range in ip_whitelist:
             if ip_range.endswith(".0/24"):
                 if is_ipv4_in_range(ip, ip_range):
                     return bot
@@ -261,14 +263,8 @@ class Auth:
         except Exception:
             return status.HTTP_401_UNAUTHORIZED
 
-        try:
-            user = None
-            with DbSession.use(readonly=True) as db:
-                result = db.exec(SqlBuilder.select.table(User).where(User.column("id") == user_id).limit(1))
-                user = result.first()
-            if not user:
-                return status.HTTP_401_UNAUTHORIZED
-        except Exception:
+        user = await Auth.get_user_by_id(user_id)
+        if not isinstance(user, User):
             return status.HTTP_401_UNAUTHORIZED
 
         return user
@@ -15,8 +15,12 @@ def project(
     )
 
     if isinstance(project_uid, (set, list)):
-        query = query.where(Project.column("id").in_(SnowflakeID.from_short_code(uid) for uid in project_uid))
+        query = query.where(Project.column("id").in_(SnowflakeID.decode_many(project_uid)))
     else:
         query = query.where(Project.column("id") == SnowflakeID.from_short_code(project_uid) if project_uid else None)  # type: ignore
 
     return query
+
+
+# Only the project decides the role, so the other path parameters are left out of the cache key of RoleSecurity.
+project.scope_params = ("project_uid",)  # type: ignore
@@ -1,5 +1,7 @@
 from typing import Any, TypeVar, cast
-from core.db import DbSession, SqlBuilder
+from core.caching import Cache
+from core.db import AsyncDbSession, SqlBuilder
+from core.types import SnowflakeID
 from models.bases import BaseRoleModel
 from sqlmodel.sql.expression import SelectOfScalar
 from ..filter.RoleFilter import _RoleFinderFunc
@@ -9,9 +11,44 @@ _TRoleModel = TypeVar("_TRoleModel", bound=BaseRoleModel)
 
 
 class RoleSecurity:
+    """Checks the role of a user with the given role finder.
+
+    The granted actions found for (role model, user, scope) are cached in :class:`Cache`, so the role query only runs
+    on a miss. The scope is the path parameters listed in the role finder's ``scope_params`` (every path parameter if it
+    has none).
+
+    Every cache key contains a generation of the role model, and :meth:`invalidate` replaces it, so writing roles drops
+    the cached decisions of every worker at once.
+    """
+
+    CACHE_TTL = 60 * 5
+    # A generation that expires is replaced by a new one, which only drops the cached decisions once more.
+    GENERATION_TTL = 60 * 60 * 24
+    _hits = 0
+    _misses = 0
+
     def __init__(self, model_class: type[_TRoleModel]):
         self._model_class = model_class
 
+    @staticmethod
+    async def invalidate(model_class: type[BaseRoleModel]) -> None:
+        """Drops the cached decisions of the role model; it must be called after writing its rows.
+
+        :param model_class: The role model class whose rows have been written.
+        """
+        await Cache.set(RoleSecurity.__get_generation_key(model_class), int(SnowflakeID()), RoleSecurity.GENERATION_TTL)
+
+    @staticmethod
+    def stats() -> dict[str, int | float]:
+        """Returns the cache hits and misses; every hit saves one role query."""
+        total = RoleSecurity._hits + RoleSecurity._misses
+        return {
+            "hits": RoleSecurity._hits,
+            "misses": RoleSecurity._misses,
+            "hit_rate": RoleSecurity._hits / total if total else 0.0,
+            "saved_queries": RoleSecurity._hits,
+        }
+
     async def is_authorized(
         self,
         user_id: int,
@@ -19,15 +56,65 @@ class RoleSecurity:
         actions: list[str],
         role_finder: _RoleFinderFunc[_TRoleModel],
     ) -> bool:
+        cache_key = None
+        granted_actions = None
+        try:
+            cache_key = await self.__get_cache_key(user_id, path_params, role_finder)
+            granted_actions = await Cache.get(cache_key, list)
+        except Exception:
+            pass
+
+        if granted_actions is None:
+            RoleSecurity._misses += 1
+            granted_actions = await self.__find_granted_actions(user_id, path_params, role_finder)
+            try:
+                if cache_key:
+                    await Cache.set(cache_key, granted_actions, RoleSecurity.CACHE_TTL)
+            except Exception:
+                pass
+        else:
+            RoleSecurity._hits += 1
+
+        if not granted_actions:
+            return False
+        return self._model_class.check_granted(granted_actions, actions)
+
+    async def __find_granted_actions(
+        self, user_id: int, path_params: dict[str, Any], role_finder: _RoleFinderFunc[_TRoleModel]
+    ) -> list[str]:
         query = SqlBuilder.select.table(self._model_class).where(self._model_class.column("user_id") == user_id)
 
         query = role_finder(cast(SelectOfScalar[_TRoleModel], query), path_params, user_id)
 
         role = None
-        with DbSession.use(readonly=True) as db:
-            result = db.exec(query.limit(1))
+        async with AsyncDbSession.use(readonly=True) as db:
+            result = await db.exec(query.limit(1))
             role = result.first()
 
         if not role or not role.actions:
-            return False
-        return role.is_granted(actions)
+            return []
+        return list(role.actions)
+
+    async def __get_cache_key(
+        self, user_id: int, path_params: dict[str, Any], role_finder: _RoleFinderFunc[_TRoleModel]
+    ) -> str:
+        generation_key = RoleSecurity.__get_generation_key(self._model_class)
+        generation = await Cache.get(generation_key, int)
+        if generation is None:
+            generation = int(SnowflakeID())
+            await Cache.set(generation_key, generation, RoleSecurity.GENERATION_TTL)
+
+        scope_params = getattr(role_finder, "scope_params", None) or sorted(path_params.keys())
+        scope = []
+        for name in scope_params:
+            value = path_params.get(name, None)
+            if isinstance(value, (set, list)):
+                value = ",".join(sorted(value))
+            scope.append(f"{name}={value}")
+
+        finder_name = f"{role_finder.__module__}.{role_finder.__qualname__}"
+        return f"role-security-{self._model_class.__tablename__}-{generation}-{user_id}-{finder_name}-{'&'.join(scope)}"
+
+    @staticmethod
+    def __get_generation_key(model_class: type[BaseRoleModel]) -> str:
+        return f"role-security-{model_class.__tablename__}-generation"
@@ -61,20 +61,7 @@ class ActivityService(BaseService):
             return await self.__count_new_records(UserActivity, refer_time, user_id=user.id)
 
         activities, count_new_records = await self.__get_list(UserActivity, pagination, refer_time, user_id=user.id)
-        api_activties = []
-        cached_dict = await self.__get_cached_references(activities)
-        for activity in activities:
-            if not activity.refer_activity_id or not activity.refer_activity_table:
-                continue
-
-            if activity.id not in cached_dict:
-                continue
-
-            api_activity = {
-                **activity.api_response(),
-                **cached_dict[activity.id],
-            }
-            api_activties.append(api_activity)
+        api_activties = await self.__convert_api_response(activities)
 
         return api_activties, count_new_records, user
 
@@ -124,7 +111,7 @@ class ActivityService(BaseService):
         if activity_class is UserActivity:
             api_activities = await self.__convert_api_response(cast(Any, activities))
         else:
-            api_activities = [activity.api_response() for activity in activities]
+            api_activities = activity_class.api_response_list(activities)
 
         return (
             api_activities,
@@ -182,7 +169,7 @@ class ActivityService(BaseService):
         if activity_class is UserActivity:
             api_activities = await self.__convert_api_response(cast(Any, activities))
         else:
-            api_activities = [activity.api_response() for activity in activities]
+            api_activities = activity_class.api_response_list(activities)
 
         return (
             api_activities,
@@ -241,7 +228,7 @@ class ActivityService(BaseService):
         if activity_class is UserActivity:
             api_activities = await self.__convert_api_response(cast(Any, activities))
         else:
-            api_activities = [activity.api_response() for activity in activities]
+            api_activities = activity_class.api_response_list(activities)
 
         return (
             api_activities,
@@ -300,7 +287,7 @@ class ActivityService(BaseService):
         if activity_class is UserActivity:
             api_activities = await self.__convert_api_response(cast(Any, activities))
         else:
-            api_activities = [activity.api_response() for activity in activities]
+            api_activities = activity_class.api_response_list(activities)
 
         return (
             api_activities,
@@ -463,20 +450,16 @@ class ActivityService(BaseService):
         return query
 
     async def __convert_api_response(self, activities: list[UserActivity]) -> list[dict[str, Any]]:
-        api_activties = []
         cached_dict = await self.__get_cached_references(activities)
-        for activity in activities:
-            if not activity.refer_activity_id or not activity.refer_activity_table:
-                continue
-
-            if activity.id not in cached_dict:
-                continue
-
-            api_activity = {
-                **activity.api_response(),
-                **cached_dict[activity.id],
-            }
-            api_activties.append(api_activity)
+        activities = [
+            activity
+            for activity in activities
+            if activity.refer_activity_id and activity.refer_activity_table and activity.id in cached_dict
+        ]
+
+        api_activties = UserActivity.api_response_list(activities)
+        for activity, api_activity in zip(activities, api_activties):
+            api_activity.update(cached_dict[activity.id])
         return api_activties
 
     async def __get_cached_references(self, activities: list[UserActivity]):
@@ -124,7 +124,7 @@ class AppSettingService(BaseService):
         return True
 
     async def delete_selected(self, uids: list[str]) -> bool:
-        ids: list[SnowflakeID] = [SnowflakeID.from_short_code(uid) for uid in uids]
+        ids: list[SnowflakeID] = SnowflakeID.decode_many(uids)
 
         with DbSession.use(readonly=False) as db:
             db.exec(SqlBuilder.delete.table(AppSetting).where(AppSetting.column("id").in_(ids)))
@@ -199,7 +199,7 @@ class AppSettingService(BaseService):
         return True
 
     async def delete_selected_global_relationships(self, uids: list[str]) -> bool:
-        ids: list[SnowflakeID] = [SnowflakeID.from_short_code(uid) for uid in uids]
+        ids: list[SnowflakeID] = SnowflakeID.decode_many(uids)
 
         with DbSession.use(readonly=False) as db:
             db.exec(
@@ -22,7 +22,7 @@ class BotService(BaseService):
         return "bot"
 
     async def get_by_uid(self, uid: str) -> Bot | None:
-        return ServiceHelper.get_by_param(Bot, uid)
+        return await ServiceHelper.get_by_param_async(Bot, uid)
 
     @overload
     async def get_list(self, as_api: Literal[False], is_setting: bool = False) -> list[Bot]: ...
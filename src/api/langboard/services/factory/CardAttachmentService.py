@@ -17,7 +17,7 @@ class CardAttachmentService(BaseService):
         return "card_attachment"
 
     async def get_by_uid(self, uid: str) -> CardAttachment | None:
-        return ServiceHelper.get_by_param(CardAttachment, uid)
+        return await ServiceHelper.get_by_param_async(CardAttachment, uid)
 
     async def get_board_list(self, card: TCardParam) -> list[dict[str, Any]]:
         card = ServiceHelper.get_by_param(Card, card)
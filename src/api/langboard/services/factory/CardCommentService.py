@@ -18,7 +18,7 @@ class CardCommentService(BaseService):
         return "card_comment"
 
     async def get_by_uid(self, uid: str) -> CardComment | None:
-        return ServiceHelper.get_by_param(CardComment, uid)
+        return await ServiceHelper.get_by_param_async(CardComment, uid)
 
     async def get_board_list(self, card: TCardParam) -> list[dict[str, Any]]:
         card = ServiceHelper.get_by_param(Card, card)
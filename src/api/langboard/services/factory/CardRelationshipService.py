@@ -51,7 +51,7 @@ class CardRelationshipService(BaseService):
         if not as_api:
             return raw_relationships
 
-        relationships = [relationship.api_response() for relationship, _ in raw_relationships]
+        relationships = CardRelationship.api_response_list(relationship for relationship, _ in raw_relationships)
         return relationships
 
     @overload
@@ -87,7 +87,7 @@ class CardRelationshipService(BaseService):
         if not as_api:
             return raw_relationships
 
-        relationships = [relationship.api_response() for relationship, _ in raw_relationships]
+        relationships = CardRelationship.api_response_list(relationship for relationship, _ in raw_relationships)
         return relationships
 
     async def get_by_card_with_type(
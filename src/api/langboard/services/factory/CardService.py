@@ -44,7 +44,7 @@ class CardService(BaseService):
         return "card"
 
     async def get_by_uid(self, uid: str) -> Card | None:
-        return ServiceHelper.get_by_param(Card, uid)
+        return await ServiceHelper.get_by_param_async(Card, uid)
 
     async def get_details(self, project: TProjectParam, card: TCardParam) -> dict[str, Any] | None:
         params = ServiceHelper.get_records_with_foreign_by_params((Project, project), (Card, card))
@@ -106,24 +106,26 @@ class CardService(BaseService):
             members[card_assigned_user.card_id].append(user.get_uid())
 
         raw_relationships = await card_relationship_service.get_all_by_project(project, as_api=False)
+        api_relationships = CardRelationship.api_response_list(relationship for relationship, _ in raw_relationships)
         relationships: dict[int, list[dict[str, Any]]] = {}
-        for relationship, _ in raw_relationships:
+        for (relationship, _), api_relationship in zip(raw_relationships, api_relationships):
             if relationship.card_id_parent not in relationships:
                 relationships[relationship.card_id_parent] = []
             if relationship.card_id_child not in relationships:
                 relationships[relationship.card_id_child] = []
-            relationships[relationship.card_id_parent].append(relationship.api_response())
-            relationships[relationship.card_id_child].append(relationship.api_response())
+            relationships[relationship.card_id_parent].append(api_relationship)
+            relationships[relationship.card_id_child].append({**api_relationship})
 
         raw_labels = await project_label_service.get_all_card_labels_by_project(project)
+        api_labels = ProjectLabel.api_response_list(label for label, _ in raw_labels)
         labels: dict[int, list[dict[str, Any]]] = {}
-        for label, card_label in raw_labels:
+        for (_, card_label), api_label in zip(raw_labels, api_labels):
             if card_label.card_id not in labels:
                 labels[card_label.card_id] = []
-            labels[card_label.card_id].append(label.api_response())
+            labels[card_label.card_id].append(api_label)
 
-        for card, count_comment in raw_cards:
-            api_card = card.api_response()
+        api_cards = Card.api_response_list(card for card, _ in raw_cards)
+        for (card, count_comment), api_card in zip(raw_cards, api_cards):
             api_card["count_comment"] = count_comment
             api_card["member_uids"] = members.get(card.id, [])
             api_card["relationships"] = relationships.get(card.id, [])
@@ -371,19 +373,21 @@ class CardService(BaseService):
             raw_users = await project_service.get_assigned_users(
                 project.id,
                 as_api=False,
-                where_user_ids_in=[SnowflakeID.from_short_code(uid) for uid in assign_user_uids],
+                where_user_ids_in=SnowflakeID.decode_many(assign_user_uids),
             )
 
+            assigned_users = []
             for assign_user, project_assigned_user in raw_users:
-                with DbSession.use(readonly=False) as db:
-                    users.append(assign_user)
-                    db.insert(
-                        CardAssignedUser(
-                            project_assigned_id=project_assigned_user.id,
-                            card_id=card.id,
-                            user_id=assign_user.id,
-                        )
+                users.append(assign_user)
+                assigned_users.append(
+                    CardAssignedUser(
+                        project_assigned_id=project_assigned_user.id,
+                        card_id=card.id,
+                        user_id=assign_user.id,
                     )
+                )
+            with DbSession.use(readonly=False) as db:
+                db.bulk_insert(assigned_users)
 
         api_card = card.board_api_response(0, [user.get_uid() for user in users], [], [])
         model = {"card": api_card}
@@ -556,23 +560,25 @@ class CardService(BaseService):
 
         raw_users = []
         if assign_user_uids:
-            assign_user_ids = [SnowflakeID.from_short_code(uid) for uid in assign_user_uids]
+            assign_user_ids = SnowflakeID.decode_many(assign_user_uids)
             project_service = self._get_service(ProjectService)
             raw_users = await project_service.get_assigned_users(
                 project, as_api=False, where_user_ids_in=assign_user_ids
             )
 
         if raw_users:
+            assigned_users = []
             for user, project_assigned_user in raw_users:
-                with DbSession.use(readonly=False) as db:
-                    db.insert(
-                        CardAssignedUser(
-                            project_assigned_id=project_assigned_user.id,
-                            card_id=card.id,
-                            user_id=user.id,
-                        )
+                assigned_users.append(
+                    CardAssignedUser(
+                        project_assigned_id=project_assigned_user.id,
+                        card_id=card.id,
+                        user_id=user.id,
                     )
-                    users.append(user)
+                )
+                users.append(user)
+            with DbSession.use(readonly=False) as db:
+                db.bulk_insert(assigned_users)
 
         await CardPublisher.assigned_users_updated(project, card, users)
 
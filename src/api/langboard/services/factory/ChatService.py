@@ -15,7 +15,7 @@ class ChatService(BaseService):
         return "chat"
 
     async def get_session_by_uid(self, uid: str) -> ChatSession | None:
-        return ServiceHelper.get_by_param(ChatSession, uid)
+        return await ServiceHelper.get_by_param_async(ChatSession, uid)
 
     async def get_session_list(
         self,
@@ -33,7 +33,7 @@ class CheckitemService(BaseService):
         return "checkitem"
 
     async def get_by_uid(self, uid: str) -> Checkitem | None:
-        return ServiceHelper.get_by_param(Checkitem, uid)
+        return await ServiceHelper.get_by_param_async(Checkitem, uid)
 
     @overload
     async def get_list(
@@ -216,7 +216,7 @@ class ChecklistService(BaseService):
         assigned_users = await project_service.get_assigned_users(
             project,
             as_api=False,
-            where_user_ids_in=[SnowflakeID.from_short_code(user_uid) for user_uid in user_uids],
+            where_user_ids_in=SnowflakeID.decode_many(user_uids),
         )
 
         for user, _ in assigned_users:
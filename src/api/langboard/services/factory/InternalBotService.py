@@ -17,7 +17,7 @@ class InternalBotService(BaseService):
         return "internal_bot"
 
     async def get_by_uid(self, uid: str) -> InternalBot | None:
-        return ServiceHelper.get_by_param(InternalBot, uid)
+        return await ServiceHelper.get_by_param_async(InternalBot, uid)
 
     @overload
     async def get_list(self, as_api: Literal[False], is_setting: bool) -> list[InternalBot]: ...
@@ -69,7 +69,8 @@ class NotificationService(BaseService):
                 references.append((table_name, record_id))
         cached_dict = ServiceHelper.get_references(references, as_type="notification")
 
-        notifications = []
+        listed_notifications: list[UserNotification] = []
+        notification_extras: list[dict[str, Any]] = []
         notification_ids_should_delete = []
         for notification in raw_notifications:
             notification_records = {}
@@ -90,13 +91,8 @@ class NotificationService(BaseService):
             if not notifier:
                 continue
 
-            notifications.append(
-                {
-                    **notification.api_response(),
-                    notifier_key: notifier,
-                    "records": notification_records,
-                }
-            )
+            listed_notifications.append(notification)
+            notification_extras.append({notifier_key: notifier, "records": notification_records})
 
         if notification_ids_should_delete:
             with DbSession.use(readonly=False) as db:
@@ -106,7 +102,12 @@ class NotificationService(BaseService):
                     )
                 )
 
-        return notifications
+        return [
+            {**api_response, **extra}
+            for api_response, extra in zip(
+                UserNotification.api_response_list(listed_notifications), notification_extras
+            )
+        ]
 
     async def convert_to_api_response(
         self,
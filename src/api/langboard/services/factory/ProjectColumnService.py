@@ -28,7 +28,7 @@ class ProjectColumnService(BaseService):
         return "project_column"
 
     async def get_by_uid(self, uid: str) -> ProjectColumn | None:
-        return ServiceHelper.get_by_param(ProjectColumn, uid)
+        return await ServiceHelper.get_by_param_async(ProjectColumn, uid)
 
     @overload
     async def get_all_by_project(
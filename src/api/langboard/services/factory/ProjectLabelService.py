@@ -34,7 +34,7 @@ class ProjectLabelService(BaseService):
             raw_labels = result.all()
         if not as_api:
             return raw_labels
-        return [label.api_response() for label in raw_labels]
+        return ProjectLabel.api_response_list(raw_labels)
 
     async def get_all_bot(self, project: TProjectParam) -> list[ProjectLabel]:
         project = ServiceHelper.get_by_param(Project, project)
@@ -73,7 +73,7 @@ class ProjectLabelService(BaseService):
             raw_labels = result.all()
         if not as_api:
             return raw_labels
-        return [label.api_response() for label in raw_labels]
+        return ProjectLabel.api_response_list(raw_labels)
 
     async def get_all_card_labels_by_project(
         self, project: TProjectParam
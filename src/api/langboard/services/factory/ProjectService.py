@@ -22,6 +22,7 @@ from models.ProjectRole import ProjectRoleAction
 from publishers import ProjectPublisher
 from sqlalchemy.orm import aliased
 from sqlalchemy.orm.attributes import InstrumentedAttribute
+from ...security import RoleSecurity
 from ...tasks.activities import ProjectActivityTask
 from .InternalBotService import InternalBotService
 from .ProjectColumnService import ProjectColumnService
@@ -38,7 +39,7 @@ class ProjectService(BaseService):
         return "project"
 
     async def get_by_uid(self, uid: str) -> Project | None:
-        return ServiceHelper.get_by_param(Project, uid)
+        return await ServiceHelper.get_by_param_async(Project, uid)
 
     async def get_one_actions(self, user: User, project: Project) -> list[str]:
         if user.is_admin:
@@ -363,10 +364,11 @@ class ProjectService(BaseService):
         internal_bot_service = self._get_service(InternalBotService)
         internal_bots = await internal_bot_service.get_list_by_default()
 
-        for internal_bot in internal_bots:
-            assigned_internal_bot = ProjectAssignedInternalBot(project_id=project.id, internal_bot_id=internal_bot.id)
-            with DbSession.use(readonly=False) as db:
-                db.insert(assigned_internal_bot)
+        with DbSession.use(readonly=False) as db:
+            db.bulk_insert(
+                ProjectAssignedInternalBot(project_id=project.id, internal_bot_id=internal_bot.id)
+                for internal_bot in internal_bots
+            )
 
         ProjectActivityTask.project_created(user, project)
 
@@ -428,6 +430,7 @@ class ProjectService(BaseService):
                     & (ProjectRole.column("user_id") != None)  # noqa
                 )
             )
+        await RoleSecurity.invalidate(ProjectRole)
 
         with DbSession.use(readonly=False) as db:
             db.exec(
@@ -635,6 +638,9 @@ class ProjectService(BaseService):
         with DbSession.use(readonly=False) as db:
             db.delete(project)
 
+        # Roles of deleted projects are not found anymore.
+        await RoleSecurity.invalidate(ProjectRole)
+
         await ProjectPublisher.deleted(project)
         ProjectActivityTask.project_deleted(user, project)
 
@@ -28,7 +28,7 @@ class ProjectWikiService(BaseService):
         return "project_wiki"
 
     async def get_by_uid(self, uid: str) -> ProjectWiki | None:
-        return ServiceHelper.get_by_param(ProjectWiki, uid)
+        return await ServiceHelper.get_by_param_async(ProjectWiki, uid)
 
     async def get_all_by_project(self, project: TProjectParam) -> list[ProjectWiki]:
         project = ServiceHelper.get_by_param(Project, project)
@@ -287,22 +287,24 @@ class ProjectWikiService(BaseService):
 
         target_users: list[User] = []
         if assign_user_uids:
-            assignee_ids = [SnowflakeID.from_short_code(uid) for uid in assign_user_uids]
+            assignee_ids = SnowflakeID.decode_many(assign_user_uids)
             project_service = self._get_service(ProjectService)
             raw_users = await project_service.get_assigned_users(
                 project.id, as_api=False, where_user_ids_in=assignee_ids
             )
 
+            assigned_users = []
             for target_user, project_assigned_user in raw_users:
-                with DbSession.use(readonly=False) as db:
-                    db.insert(
-                        ProjectWikiAssignedUser(
-                            project_assigned_id=project_assigned_user.id,
-                            project_wiki_id=wiki.id,
-                            user_id=target_user.id,
-                        )
+                assigned_users.append(
+                    ProjectWikiAssignedUser(
+                        project_assigned_id=project_assigned_user.id,
+                        project_wiki_id=wiki.id,
+                        user_id=target_user.id,
                     )
+                )
                 target_users.append(target_user)
+            with DbSession.use(readonly=False) as db:
+                db.bulk_insert(assigned_users)
 
         await ProjectWikiPublisher.assignees_updated(project, wiki, target_users)
         ProjectWikiActivityTask.project_wiki_assignees_updated(
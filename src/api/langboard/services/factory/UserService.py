@@ -65,7 +65,7 @@ class UserService(BaseService):
         return records, count
 
     async def get_by_uid(self, uid: str) -> User | None:
-        return ServiceHelper.get_by_param(User, uid)
+        return await ServiceHelper.get_by_param_async(User, uid)
 
     async def get_by_email(self, email: str | None) -> tuple[User, UserEmail | None] | tuple[None, None]:
         user = ServiceHelper.get_by(User, "email", email)
@@ -306,7 +306,7 @@ class UserService(BaseService):
         await UserPublisher.deleted(user)
 
     async def delete_selected(self, uids: list[str]) -> None:
-        user_ids = [SnowflakeID.from_short_code(uid) for uid in uids]
+        user_ids = SnowflakeID.decode_many(uids)
 
         with DbSession.use(readonly=False) as db:
             db.exec(SqlBuilder.delete.table(User).where(User.column("id").in_(user_ids)))
@@ -2,6 +2,7 @@ from abc import ABC
 from typing import Generic, TypeVar
 from core.db import DbSession, SqlBuilder
 from models.bases import BaseRoleModel
+from ....security import RoleSecurity
 
 
 _TRoleModel = TypeVar("_TRoleModel", bound=BaseRoleModel)
@@ -66,6 +67,8 @@ class BaseRoleService(ABC, Generic[_TRoleModel]):
             else:
                 db.update(role)
 
+        await RoleSecurity.invalidate(self._model_class)
+
         return role
 
     async def grant_all(self, **kwargs) -> _TRoleModel:
@@ -84,6 +87,8 @@ class BaseRoleService(ABC, Generic[_TRoleModel]):
             else:
                 db.update(role)
 
+        await RoleSecurity.invalidate(self._model_class)
+
         return role
 
     async def grant_default(self, **kwargs) -> _TRoleModel:
@@ -102,6 +107,8 @@ class BaseRoleService(ABC, Generic[_TRoleModel]):
             else:
                 db.update(role)
 
+        await RoleSecurity.invalidate(self._model_class)
+
         return role
 
     async def withdraw(self, **kwargs) -> _TRoleModel | None:
@@ -118,6 +125,8 @@ class BaseRoleService(ABC, Generic[_TRoleModel]):
         with DbSession.use(readonly=False) as db:
             db.delete(role)
 
+        await RoleSecurity.invalidate(self._model_class)
+
         return role
 
     async def _get_or_create_role(self, **kwargs) -> _TRoleModel:
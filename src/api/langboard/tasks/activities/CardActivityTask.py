@@ -2,7 +2,6 @@ from typing import Any
 from models import Bot, Card, Project, ProjectActivity, ProjectColumn, User
 from models.ProjectActivity import ProjectActivityType
 from ...core.broker import Broker
-from .UserActivityTask import record_project_activity
 from .utils import ActivityHistoryHelper, ActivityTaskHelper
 
 
@@ -10,10 +9,7 @@ from .utils import ActivityHistoryHelper, ActivityTaskHelper
 async def card_created(user_or_bot: User | Bot, project: Project, card: Card):
     helper = ActivityTaskHelper(ProjectActivity)
     activity_history = helper.create_project_default_history(project, card)
-    activity = helper.record(
-        user_or_bot, activity_history, **_get_activity_params(ProjectActivityType.CardCreated, project, card)
-    )
-    record_project_activity(user_or_bot, activity)
+    helper.record(user_or_bot, activity_history, **_get_activity_params(ProjectActivityType.CardCreated, project, card))
 
 
 @Broker.wrap_async_task_decorator
@@ -23,10 +19,7 @@ async def card_updated(user_or_bot: User | Bot, project: Project, old_dict: dict
         **helper.create_project_default_history(project, card),
         **ActivityHistoryHelper.create_changes(old_dict, card),
     }
-    activity = helper.record(
-        user_or_bot, activity_history, **_get_activity_params(ProjectActivityType.CardUpdated, project, card)
-    )
-    record_project_activity(user_or_bot, activity)
+    helper.record(user_or_bot, activity_history, **_get_activity_params(ProjectActivityType.CardUpdated, project, card))
 
 
 @Broker.wrap_async_task_decorator
@@ -41,10 +34,7 @@ async def card_moved(
         **helper.create_project_default_history(project, card),
         "from_column": ActivityHistoryHelper.create_project_column_history(from_column),
     }
-    activity = helper.record(
-        user_or_bot, activity_history, **_get_activity_params(ProjectActivityType.CardMoved, project, card)
-    )
-    record_project_activity(user_or_bot, activity)
+    helper.record(user_or_bot, activity_history, **_get_activity_params(ProjectActivityType.CardMoved, project, card))
 
 
 @Broker.wrap_async_task_decorator
@@ -61,12 +51,11 @@ async def card_assigned_users_updated(
         "removed_users": removed_users,
         "added_users": added_users,
     }
-    activity = helper.record(
+    helper.record(
         user_or_bot,
         activity_history,
         **_get_activity_params(ProjectActivityType.CardAssignedUsersUpdated, project, card),
     )
-    record_project_activity(user_or_bot, activity)
 
 
 @Broker.wrap_async_task_decorator
@@ -83,20 +72,16 @@ async def card_labels_updated(
         "removed_labels": removed_labels,
         "added_labels": added_labels,
     }
-    activity = helper.record(
+    helper.record(
         user_or_bot, activity_history, **_get_activity_params(ProjectActivityType.CardLabelsUpdated, project, card)
     )
-    record_project_activity(user_or_bot, activity)
 
 
 @Broker.wrap_async_task_decorator
 async def card_deleted(user_or_bot: User | Bot, project: Project, card: Card):
     helper = ActivityTaskHelper(ProjectActivity)
     activity_history = helper.create_project_default_history(project, card)
-    activity = helper.record(
-        user_or_bot, activity_history, **_get_activity_params(ProjectActivityType.CardDeleted, project, card)
-    )
-    record_project_activity(user_or_bot, activity)
+    helper.record(user_or_bot, activity_history, **_get_activity_params(ProjectActivityType.CardDeleted, project, card))
 
 
 def _get_activity_params(activity_type: ProjectActivityType, project: Project, card: Card):
@@ -1,7 +1,6 @@
 from models import Bot, Card, CardAttachment, Project, ProjectActivity, User
 from models.ProjectActivity import ProjectActivityType
 from ...core.broker import Broker
-from .UserActivityTask import record_project_activity
 from .utils import ActivityHistoryHelper, ActivityTaskHelper
 
 
@@ -9,12 +8,11 @@ from .utils import ActivityHistoryHelper, ActivityTaskHelper
 async def card_attachment_uploaded(user_or_bot: User | Bot, project: Project, card: Card, attachment: CardAttachment):
     helper = ActivityTaskHelper(ProjectActivity)
     activity_history = _get_default_history(helper, project, card, attachment)
-    activity = helper.record(
+    helper.record(
         user_or_bot,
         activity_history,
         **_get_activity_params(ProjectActivityType.CardAttachmentUploaded, project, card),
     )
-    record_project_activity(user_or_bot, activity)
 
 
 @Broker.wrap_async_task_decorator
@@ -26,24 +24,22 @@ async def card_attachment_name_changed(
         **_get_default_history(helper, project, card, attachment),
         "changes": {"before": {"name": old_name}, "after": {"name": attachment.filename}},
     }
-    activity = helper.record(
+    helper.record(
         user_or_bot,
         activity_history,
         **_get_activity_params(ProjectActivityType.CardAttachmentNameChanged, project, card),
     )
-    record_project_activity(user_or_bot, activity)
 
 
 @Broker.wrap_async_task_decorator
 async def card_attachment_deleted(user_or_bot: User | Bot, project: Project, card: Card, attachment: CardAttachment):
     helper = ActivityTaskHelper(ProjectActivity)
     activity_history = _get_default_history(helper, project, card, attachment)
-    activity = helper.record(
+    helper.record(
         user_or_bot,
         activity_history,
         **_get_activity_params(ProjectActivityType.ProjectLabelDeleted, project, card),
     )
-    record_project_activity(user_or_bot, activity)
 
 
 def _get_default_history(helper: ActivityTaskHelper, project: Project, card: Card, attachment: CardAttachment):
@@ -1,7 +1,6 @@
 from models import Bot, Card, Checklist, Project, ProjectActivity, User
 from models.ProjectActivity import ProjectActivityType
 from ...core.broker import Broker
-from .UserActivityTask import record_project_activity
 from .utils import ActivityHistoryHelper, ActivityTaskHelper
 
 
@@ -9,12 +8,11 @@ from .utils import ActivityHistoryHelper, ActivityTaskHelper
 async def card_checklist_created(user_or_bot: User | Bot, project: Project, card: Card, checklist: Checklist):
     helper = ActivityTaskHelper(ProjectActivity)
     activity_history = _get_default_history(helper, project, card, checklist)
-    activity = helper.record(
+    helper.record(
         user_or_bot,
         activity_history,
         **_get_activity_params(ProjectActivityType.CardChecklistCreated, project, card),
     )
-    record_project_activity(user_or_bot, activity)
 
 
 @Broker.wrap_async_task_decorator
@@ -26,48 +24,44 @@ async def card_checklist_title_changed(
         **_get_default_history(helper, project, card, checklist),
         "changes": {"before": {"title": old_title}, "after": {"title": checklist.title}},
     }
-    activity = helper.record(
+    helper.record(
         user_or_bot,
         activity_history,
         **_get_activity_params(ProjectActivityType.CardChecklistTitleChanged, project, card),
     )
-    record_project_activity(user_or_bot, activity)
 
 
 @Broker.wrap_async_task_decorator
 async def card_checklist_checked(user_or_bot: User | Bot, project: Project, card: Card, checklist: Checklist):
     helper = ActivityTaskHelper(ProjectActivity)
     activity_history = _get_default_history(helper, project, card, checklist)
-    activity = helper.record(
+    helper.record(
         user_or_bot,
         activity_history,
         **_get_activity_params(ProjectActivityType.CardChecklistChecked, project, card),
     )
-    record_project_activity(user_or_bot, activity)
 
 
 @Broker.wrap_async_task_decorator
 async def card_checklist_unchecked(user_or_bot: User | Bot, project: Project, card: Card, checklist: Checklist):
     helper = ActivityTaskHelper(ProjectActivity)
     activity_history = _get_default_history(helper, project, card, checklist)
-    activity = helper.record(
+    helper.record(
         user_or_bot,
         activity_history,
         **_get_activity_params(ProjectActivityType.CardChecklistUnchecked, project, card),
     )
-    record_project_activity(user_or_bot, activity)
 
 
 @Broker.wrap_async_task_decorator
 async def card_checklist_deleted(user_or_bot: User | Bot, project: Project, card: Card, checklist: Checklist):
     helper = ActivityTaskHelper(ProjectActivity)
     activity_history = _get_default_history(helper, project, card, checklist)
-    activity = helper.record(
+    helper.record(
         user_or_bot,
         activity_history,
         **_get_activity_params(ProjectActivityType.CardChecklistDeleted, project, card),
     )
-    record_project_activity(user_or_bot, activity)
 
 
 def _get_default_history(helper: ActivityTaskHelper, project: Project, card: Card, checklist: Checklist):
@@ -3,7 +3,6 @@ from core.db import DbSession, EditorContentModel, SqlBuilder
 from models import Bot, Card, CardComment, Project, ProjectActivity, User
 from models.ProjectActivity import ProjectActivityType
 from ...core.broker import Broker
-from .UserActivityTask import record_project_activity
 from .utils import ActivityHistoryHelper, ActivityTaskHelper
 
 
@@ -11,12 +10,11 @@ from .utils import ActivityHistoryHelper, ActivityTaskHelper
 async def card_comment_added(user_or_bot: User | Bot, project: Project, card: Card, comment: CardComment):
     helper = ActivityTaskHelper(ProjectActivity)
     activity_history = _get_default_history(helper, project, card, comment)
-    activity = helper.record(
+    helper.record(
         user_or_bot,
         activity_history,
         **_get_activity_params(ProjectActivityType.CardCommentAdded, project, card),
     )
-    record_project_activity(user_or_bot, activity)
 
 
 @Broker.wrap_async_task_decorator
@@ -31,22 +29,20 @@ async def card_comment_updated(
             "after": {"content": ActivityHistoryHelper.convert_to_python(comment.content)},
         },
     }
-    activity = helper.record(
+    helper.record(
         user_or_bot, activity_history, **_get_activity_params(ProjectActivityType.CardCommentUpdated, project, card)
     )
-    record_project_activity(user_or_bot, activity)
 
 
 @Broker.wrap_async_task_decorator
 async def card_comment_deleted(user_or_bot: User | Bot, project: Project, card: Card, comment: CardComment):
     helper = ActivityTaskHelper(ProjectActivity)
     activity_history = _get_default_history(helper, project, card, comment)
-    activity = helper.record(
+    helper.record(
         user_or_bot,
         activity_history,
         **_get_activity_params(ProjectActivityType.CardCommentDeleted, project, card),
     )
-    record_project_activity(user_or_bot, activity)
 
 
 @Broker.wrap_async_task_decorator
@@ -58,12 +54,11 @@ async def card_comment_reacted(
         **_get_default_history(helper, project, card, comment),
         "reaction_type": reaction_type,
     }
-    activity = helper.record(
+    helper.record(
         user_or_bot,
         activity_history,
         **_get_activity_params(ProjectActivityType.CardCommentReacted, project, card),
     )
-    record_project_activity(user_or_bot, activity)
 
 
 @Broker.wrap_async_task_decorator
@@ -75,12 +70,11 @@ async def card_comment_unreacted(
         **_get_default_history(helper, project, card, comment),
         "reaction_type": reaction_type,
     }
-    activity = helper.record(
+    helper.record(
         user_or_bot,
         activity_history,
         **_get_activity_params(ProjectActivityType.CardCommentUnreacted, project, card),
     )
-    record_project_activity(user_or_bot, activity)
 
 
 def _get_default_history(helper: ActivityTaskHelper, project: Project, card: Card, comment: CardComment):
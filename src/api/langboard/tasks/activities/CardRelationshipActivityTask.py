@@ -1,7 +1,6 @@
 from models import Bot, Card, Project, ProjectActivity, User
 from models.ProjectActivity import ProjectActivityType
 from ...core.broker import Broker
-from .UserActivityTask import record_project_activity
 from .utils import ActivityTaskHelper
 
 
@@ -26,12 +25,11 @@ async def card_relationship_updated(
         "removed_relationships": removed_relationships,
         "added_relationships": added_relationships,
     }
-    activity = helper.record(
+    helper.record(
         user_or_bot,
         activity_history,
         **_get_activity_params(ProjectActivityType.CardRelationshipsUpdated, project, card),
     )
-    record_project_activity(user_or_bot, activity)
 
 
 def _get_activity_params(activity_type: ProjectActivityType, project: Project, card: Card):
@@ -2,7 +2,6 @@ from typing import Any
 from models import Bot, Project, ProjectActivity, User
 from models.ProjectActivity import ProjectActivityType
 from ...core.broker import Broker
-from .UserActivityTask import record_project_activity
 from .utils import ActivityHistoryHelper, ActivityTaskHelper
 
 
@@ -10,10 +9,7 @@ from .utils import ActivityHistoryHelper, ActivityTaskHelper
 async def project_created(user: User, project: Project):
     helper = ActivityTaskHelper(ProjectActivity)
     activity_history = helper.create_project_default_history(project)
-    activity = helper.record(
-        user, activity_history, **_get_activity_params(ProjectActivityType.ProjectCreated, project)
-    )
-    record_project_activity(user, activity)
+    helper.record(user, activity_history, **_get_activity_params(ProjectActivityType.ProjectCreated, project))
 
 
 @Broker.wrap_async_task_decorator
@@ -23,10 +19,7 @@ async def project_updated(user_or_bot: User | Bot, old_dict: dict[str, Any], pro
         **helper.create_project_default_history(project),
         **ActivityHistoryHelper.create_changes(old_dict, project),
     }
-    activity = helper.record(
-        user_or_bot, activity_history, **_get_activity_params(ProjectActivityType.ProjectUpdated, project)
-    )
-    record_project_activity(user_or_bot, activity)
+    helper.record(user_or_bot, activity_history, **_get_activity_params(ProjectActivityType.ProjectUpdated, project))
 
 
 @Broker.wrap_async_task_decorator
@@ -43,32 +36,27 @@ async def project_assigned_users_updated(
         "removed_users": removed_users,
         "added_users": added_users,
     }
-    activity = helper.record(
+    helper.record(
         user, activity_history, **_get_activity_params(ProjectActivityType.ProjectAssignedUsersUpdated, project)
     )
-    record_project_activity(user, activity)
 
 
 @Broker.wrap_async_task_decorator
 async def project_invited_user_accepted(user: User, project: Project):
     helper = ActivityTaskHelper(ProjectActivity)
     activity_history = helper.create_project_default_history(project)
-    activity = helper.record(
+    helper.record(
         user,
         activity_history,
         **_get_activity_params(ProjectActivityType.ProjectInvitedUserAccepted, project),
     )
-    record_project_activity(user, activity)
 
 
 @Broker.wrap_async_task_decorator
 async def project_deleted(user: User, project: Project):
     helper = ActivityTaskHelper(ProjectActivity)
     activity_history = helper.create_project_default_history(project)
-    activity = helper.record(
-        user, activity_history, **_get_activity_params(ProjectActivityType.ProjectDeleted, project)
-    )
-    record_project_activity(user, activity)
+    helper.record(user, activity_history, **_get_activity_params(ProjectActivityType.ProjectDeleted, project))
 
 
 def _get_activity_params(activity_type: ProjectActivityType, project: Project):
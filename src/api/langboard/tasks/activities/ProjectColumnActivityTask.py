@@ -1,7 +1,6 @@
 from models import Bot, Project, ProjectActivity, ProjectColumn, User
 from models.ProjectActivity import ProjectActivityType
 from ...core.broker import Broker
-from .UserActivityTask import record_project_activity
 from .utils import ActivityHistoryHelper, ActivityTaskHelper
 
 
@@ -9,10 +8,9 @@ from .utils import ActivityHistoryHelper, ActivityTaskHelper
 async def project_column_created(user_or_bot: User | Bot, project: Project, column: ProjectColumn):
     helper = ActivityTaskHelper(ProjectActivity)
     activity_history = _get_default_history(helper, project, column)
-    activity = helper.record(
+    helper.record(
         user_or_bot, activity_history, **_get_activity_params(ProjectActivityType.ProjectColumnCreated, project, column)
     )
-    record_project_activity(user_or_bot, activity)
 
 
 @Broker.wrap_async_task_decorator
@@ -22,22 +20,20 @@ async def project_column_name_changed(user_or_bot: User | Bot, project: Project,
         **_get_default_history(helper, project, column),
         "changes": {"before": {"name": old_name}, "after": {"name": column.name}},
     }
-    activity = helper.record(
+    helper.record(
         user_or_bot,
         activity_history,
         **_get_activity_params(ProjectActivityType.ProjectColumnNameChanged, project, column),
     )
-    record_project_activity(user_or_bot, activity)
 
 
 @Broker.wrap_async_task_decorator
 async def project_column_deleted(user_or_bot: User | Bot, project: Project, column: ProjectColumn):
     helper = ActivityTaskHelper(ProjectActivity)
     activity_history = _get_default_history(helper, project, column)
-    activity = helper.record(
+    helper.record(
         user_or_bot, activity_history, **_get_activity_params(ProjectActivityType.ProjectColumnDeleted, project, column)
     )
-    record_project_activity(user_or_bot, activity)
 
 
 def _get_default_history(helper: ActivityTaskHelper, project: Project, column: ProjectColumn):
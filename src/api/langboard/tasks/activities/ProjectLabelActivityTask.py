@@ -2,7 +2,6 @@ from typing import Any
 from models import Bot, Project, ProjectActivity, ProjectLabel, User
 from models.ProjectActivity import ProjectActivityType
 from ...core.broker import Broker
-from .UserActivityTask import record_project_activity
 from .utils import ActivityHistoryHelper, ActivityTaskHelper
 
 
@@ -10,10 +9,9 @@ from .utils import ActivityHistoryHelper, ActivityTaskHelper
 async def project_label_created(user_or_bot: User | Bot, project: Project, label: ProjectLabel):
     helper = ActivityTaskHelper(ProjectActivity)
     activity_history = _get_default_history(helper, project, label)
-    activity = helper.record(
+    helper.record(
         user_or_bot, activity_history, **_get_activity_params(ProjectActivityType.ProjectLabelCreated, project)
     )
-    record_project_activity(user_or_bot, activity)
 
 
 @Broker.wrap_async_task_decorator
@@ -25,20 +23,18 @@ async def project_label_updated(
         **_get_default_history(helper, project, label),
         **ActivityHistoryHelper.create_changes(old_dict, label),
     }
-    activity = helper.record(
+    helper.record(
         user_or_bot, activity_history, **_get_activity_params(ProjectActivityType.ProjectLabelUpdated, project)
     )
-    record_project_activity(user_or_bot, activity)
 
 
 @Broker.wrap_async_task_decorator
 async def project_label_deleted(user_or_bot: User | Bot, project: Project, label: ProjectLabel):
     helper = ActivityTaskHelper(ProjectActivity)
     activity_history = _get_default_history(helper, project, label)
-    activity = helper.record(
+    helper.record(
         user_or_bot, activity_history, **_get_activity_params(ProjectActivityType.ProjectLabelDeleted, project)
     )
-    record_project_activity(user_or_bot, activity)
 
 
 def _get_default_history(helper: ActivityTaskHelper, project: Project, label: ProjectLabel):
@@ -2,7 +2,6 @@ from typing import Any
 from models import Bot, Project, ProjectWiki, ProjectWikiActivity, User
 from models.ProjectWikiActivity import ProjectWikiActivityType
 from ...core.broker import Broker
-from .UserActivityTask import record_wiki_activity
 from .utils import ActivityHistoryHelper, ActivityTaskHelper
 
 
@@ -10,10 +9,9 @@ from .utils import ActivityHistoryHelper, ActivityTaskHelper
 async def project_wiki_created(user_or_bot: User | Bot, project: Project, wiki: ProjectWiki):
     helper = ActivityTaskHelper(ProjectWikiActivity)
     activity_history = _get_default_history(helper, project, wiki)
-    activity = helper.record(
+    helper.record(
         user_or_bot, activity_history, **_get_activity_params(ProjectWikiActivityType.WikiCreated, project, wiki)
     )
-    record_wiki_activity(user_or_bot, activity)
 
 
 @Broker.wrap_async_task_decorator
@@ -23,10 +21,9 @@ async def project_wiki_updated(user_or_bot: User | Bot, project: Project, old_di
         **_get_default_history(helper, project, wiki),
         **ActivityHistoryHelper.create_changes(old_dict, wiki),
     }
-    activity = helper.record(
+    helper.record(
         user_or_bot, activity_history, **_get_activity_params(ProjectWikiActivityType.WikiUpdated, project, wiki)
     )
-    record_wiki_activity(user_or_bot, activity)
 
 
 @Broker.wrap_async_task_decorator
@@ -39,12 +36,11 @@ async def project_wiki_publicity_changed(
         "was_public": was_public,
         "is_public": wiki.is_public,
     }
-    activity = helper.record(
+    helper.record(
         user_or_bot,
         activity_history,
         **_get_activity_params(ProjectWikiActivityType.WikiPublicityChanged, project, wiki),
     )
-    record_wiki_activity(user_or_bot, activity)
 
 
 @Broker.wrap_async_task_decorator
@@ -65,22 +61,20 @@ async def project_wiki_assignees_updated(
         activity_history["removed_users"] = removed_users
         activity_history["added_users"] = added_users
 
-    activity = helper.record(
+    helper.record(
         user,
         activity_history,
         **_get_activity_params(ProjectWikiActivityType.WikiAssigneesUpdated, project, wiki),
     )
-    record_wiki_activity(user, activity)
 
 
 @Broker.wrap_async_task_decorator
 async def project_wiki_deleted(user_or_bot: User | Bot, project: Project, wiki: ProjectWiki):
     helper = ActivityTaskHelper(ProjectWikiActivity)
     activity_history = _get_default_history(helper, project, wiki)
-    activity = helper.record(
+    helper.record(
         user_or_bot, activity_history, **_get_activity_params(ProjectWikiActivityType.WikiDeleted, project, wiki)
     )
-    record_wiki_activity(user_or_bot, activity)
 
 
 def _get_default_history(helper: ActivityTaskHelper, project: Project, wiki: ProjectWiki):
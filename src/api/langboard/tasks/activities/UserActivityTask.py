@@ -1,5 +1,4 @@
-from models import Bot, Project, ProjectActivity, ProjectWikiActivity, User, UserActivity
-from models.bases import BaseActivityModel
+from models import Project, User, UserActivity
 from models.UserActivity import UserActivityType
 from ...core.broker import Broker
 from .utils import ActivityHistoryHelper, ActivityTaskHelper
@@ -21,20 +20,3 @@ async def declined_project_invitation(user: User, project: Project):
         "project_title": project.title,
     }
     helper.record(user, activity_history, activity_type=UserActivityType.DeclinedProjectInvitation)
-
-
-def record_project_activity(user_or_bot: User | Bot, activity: ProjectActivity):
-    helper = ActivityTaskHelper(UserActivity)
-    helper.record(user_or_bot, {}, **_refer_activity(activity))
-
-
-def record_wiki_activity(user_or_bot: User | Bot, activity: ProjectWikiActivity):
-    helper = ActivityTaskHelper(UserActivity)
-    helper.record(user_or_bot, {}, **_refer_activity(activity))
-
-
-def _refer_activity(activity: BaseActivityModel):
-    return {
-        "refer_activity_table": activity.__tablename__,
-        "refer_activity_id": activity.id,
-    }
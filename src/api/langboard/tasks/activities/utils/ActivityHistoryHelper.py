@@ -125,7 +125,7 @@ class ActivityHistoryHelper:
         if isinstance(data, EditorContentModel) or (isinstance(data, dict) and "content" in data):
             new_data = data if isinstance(data, EditorContentModel) else EditorContentModel(**data)
             user_or_bot_uids, _ = find_mentioned(new_data)
-            user_or_bot_ids = [SnowflakeID.from_short_code(uid) for uid in user_or_bot_uids]
+            user_or_bot_ids = SnowflakeID.decode_many(user_or_bot_uids)
             mentionables: list[Bot | User] = []
             with DbSession.use(readonly=True) as db:
                 result = db.exec(SqlBuilder.select.table(User).where(User.column("id").in_(user_or_bot_ids)))
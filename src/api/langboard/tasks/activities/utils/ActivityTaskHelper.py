@@ -10,12 +10,14 @@ from models import (
     ProjectColumn,
     ProjectLabel,
     User,
+    UserActivity,
 )
 from models.bases import BaseActivityModel
 from .ActivityHistoryHelper import ActivityHistoryHelper
 
 
 _TActivityModel = TypeVar("_TActivityModel", bound=BaseActivityModel)
+_TAnyActivityModel = TypeVar("_TAnyActivityModel", bound=BaseActivityModel)
 _TBaseModel = TypeVar("_TBaseModel", bound=BaseSqlModel)
 
 
@@ -24,22 +26,25 @@ class ActivityTaskHelper(Generic[_TActivityModel]):
         self._model_class = model_class
 
     def record(self, user_or_bot: User | Bot, activity_history: dict[str, Any], **kwargs) -> _TActivityModel:
-        activity_history["recorder"] = ActivityHistoryHelper.create_user_or_bot_history(user_or_bot)
+        """Records an activity of a user or bot.
 
-        model = {
-            "activity_history": activity_history,
-            **kwargs,
-        }
-
-        if isinstance(user_or_bot, User):
-            model["user_id"] = user_or_bot.id
-        else:
-            model["bot_id"] = user_or_bot.id
-
-        activity = self._model_class(**model)
+        Project and wiki activities are also referred to by a :class:`UserActivity` of the user or bot, which is
+        inserted in the same session.
+        """
+        activity = self.__create(self._model_class, user_or_bot, activity_history, **kwargs)
 
         with DbSession.use(readonly=False) as db:
-            db.insert(activity)
+            db.bulk_insert([activity])
+            if self._model_class is not UserActivity:
+                # The ID of the activity is allocated by the insert above.
+                user_activity = self.__create(
+                    UserActivity,
+                    user_or_bot,
+                    {},
+                    refer_activity_table=activity.__tablename__,
+                    refer_activity_id=activity.id,
+                )
+                db.bulk_insert([user_activity])
 
         return activity
 
@@ -129,3 +134,24 @@ class ActivityTaskHelper(Generic[_TActivityModel]):
                 added_models[target_model.id] = target_model_dict
 
         return removed_models, added_models
+
+    def __create(
+        self,
+        model_class: type[_TAnyActivityModel],
+        user_or_bot: User | Bot,
+        activity_history: dict[str, Any],
+        **kwargs,
+    ) -> _TAnyActivityModel:
+        activity_history["recorder"] = ActivityHistoryHelper.create_user_or_bot_history(user_or_bot)
+
+        model = {
+            "activity_history": activity_history,
+            **kwargs,
+        }
+
+        if isinstance(user_or_bot, User):
+            model["user_id"] = user_or_bot.id
+        else:
+            model["bot_id"] = user_or_bot.id
+
+        return model_class(**model)
@@ -1,16 +1,23 @@
+from asyncio import to_thread
+from functools import lru_cache
+from typing import Any
 from core.db import BaseSqlModel, DbSession, SqlBuilder
-from core.types import SafeDateTime
+from core.types import SafeDateTime, SnowflakeID
 from helpers import BotHelper, ModelHelper
 from models import Bot, Card, Project, ProjectColumn
 from models.bases import BaseBotScheduleModel
 from models.BotSchedule import BotSchedule, BotScheduleRunningType, BotScheduleStatus
 from publishers import ProjectBotPublisher
 from ...ai import BotDefaultTrigger, BotScheduleHelper
-from ...core.broker import Broker
+from ...core.broker import Broker, CronScheduler
 from .utils import BotTaskDataHelper, BotTaskHelper
 from .utils.BotTaskHelper import logger
 
 
+_TScheduleRecord = tuple[BaseBotScheduleModel, BotSchedule, Bot]
+_TScheduleTarget = tuple[BaseSqlModel, Project, dict[str, Any]]
+
+
 @BotTaskDataHelper.schema(
     BotDefaultTrigger.BotCronScheduled,
     {
@@ -21,63 +28,87 @@ from .utils.BotTaskHelper import logger
     },
 )
 @Broker.wrap_async_task_decorator
-async def bot_cron_scheduled(bot: Bot, bot_schedule: BotSchedule, schedule_model: BaseBotScheduleModel):
-    await _run_scheduler(bot, bot_schedule, schedule_model)
+async def bot_cron_scheduled(schedule_table: str, schedule_model_id: int, should_start: bool):
+    """Runs the bot of a fired schedule.
 
+    :param schedule_table: The table name of the schedule model.
+    :param schedule_model_id: The ID of the schedule model.
+    :param should_start: Whether the schedule was pending and has to be started before running.
+    """
+    model_class = ModelHelper.get_model_by_table_name(schedule_table)
+    if not model_class:
+        return
 
-async def run_scheduled_bots_cron(interval_str: str):
-    if interval_str.startswith("scheduled "):
-        await _check_bot_schedule_runnable(interval_str.removeprefix("scheduled "))
+    records = _get_schedule_records(model_class.column("id") == schedule_model_id)
+    if not records:
         return
 
+    schedule_model, bot_schedule, bot = records[0]
+    target = _get_schedule_targets(records).get(_get_target_key(schedule_model))
+    if should_start:
+        if bot_schedule.status == BotScheduleStatus.Stopped:
+            return
+
+        await BotScheduleHelper.change_status(
+            schedule_model.__class__,
+            schedule_model,
+            BotScheduleStatus.Started,
+            bot_schedule=bot_schedule,
+        )
+        if not target:
+            return
+
+        await ProjectBotPublisher.rescheduled(target[1], schedule_model, {"status": bot_schedule.status.value})
+
+    await _run_scheduler(bot, bot_schedule, schedule_model, target)
+
+
+def create_cron_scheduler() -> CronScheduler:
+    return CronScheduler(
+        load_jobs=BotScheduleHelper.get_cron_jobs,
+        on_fire=run_scheduled_bots_cron,
+        get_version=BotScheduleHelper.get_cron_jobs_version,
+    )
+
+
+async def run_scheduled_bots_cron(interval_str: str):
+    """Dispatches :func:`bot_cron_scheduled` for each schedule due on the fired job.
+
+    The schedules are looked up in a worker thread, so the bots never run on the scheduler's event loop.
+    """
+    for schedule_model, should_start in await to_thread(_get_due_schedules, interval_str):
+        bot_cron_scheduled(schedule_model.__tablename__, int(schedule_model.id), should_start)
+
+
+def _get_due_schedules(interval_str: str) -> list[tuple[BaseBotScheduleModel, bool]]:
+    if interval_str.startswith(BotScheduleHelper.PENDING_CRON_JOB_PREFIX):
+        return [
+            (schedule_model, True)
+            for schedule_model in _get_runnable_pending_schedules(
+                interval_str.removeprefix(BotScheduleHelper.PENDING_CRON_JOB_PREFIX)
+            )
+        ]
+
     interval_str = BotScheduleHelper.convert_valid_interval_str(interval_str)
     if not interval_str:
         logger.error(f"Invalid interval string: {interval_str}")
-        return
-
-    model_classes = ModelHelper.get_models_by_base_class(BaseBotScheduleModel)
-    records: list[tuple[BaseBotScheduleModel, BotSchedule, Bot]] = []
-    with DbSession.use(readonly=True) as db:
-        for model_class in model_classes:
-            result = db.exec(
-                SqlBuilder.select.tables(model_class, BotSchedule, Bot)
-                .join(
-                    BotSchedule,
-                    model_class.column("bot_schedule_id") == BotSchedule.column("id"),
-                )
-                .join(Bot, BotSchedule.column("bot_id") == Bot.column("id"))
-                .where(
-                    (BotSchedule.column("interval_str") == interval_str)
-                    & (BotSchedule.column("status") == BotScheduleStatus.Started)
-                    & (BotSchedule.column("running_type") != BotScheduleRunningType.Onetime)
-                )
-            )
-            records.extend(result.all())
+        return []
 
-    for schedule_model, bot_schedule, bot in records:
-        await _run_scheduler(bot, bot_schedule, schedule_model)
+    records = _get_schedule_records(
+        (BotSchedule.column("interval_str") == interval_str)
+        & (BotSchedule.column("status") == BotScheduleStatus.Started)
+        & (BotSchedule.column("running_type") != BotScheduleRunningType.Onetime)
+    )
+    return [(schedule_model, False) for schedule_model, _, _ in records]
 
 
-async def _check_bot_schedule_runnable(interval_str: str):
+def _get_runnable_pending_schedules(interval_str: str) -> list[BaseBotScheduleModel]:
     current_time = SafeDateTime.now()
-    model_classes = ModelHelper.get_models_by_base_class(BaseBotScheduleModel)
-    records: list[tuple[BaseBotScheduleModel, BotSchedule, Bot]] = []
-    with DbSession.use(readonly=True) as db:
-        for model_class in model_classes:
-            result = db.exec(
-                SqlBuilder.select.tables(model_class, BotSchedule, Bot)
-                .join(
-                    BotSchedule,
-                    model_class.column("bot_schedule_id") == BotSchedule.column("id"),
-                )
-                .join(Bot, BotSchedule.column("bot_id") == Bot.column("id"))
-                .where(
-                    (BotSchedule.column("status") == BotScheduleStatus.Pending)
-                    & (BotSchedule.column("start_at") <= current_time)
-                    & (BotSchedule.column("interval_str") == interval_str)
-                )
-            )
-            records.extend(result.all())
+    records = _get_schedule_records(
+        (BotSchedule.column("status") == BotScheduleStatus.Pending)
+        & (BotSchedule.column("start_at") <= current_time)
+        & (BotSchedule.column("interval_str") == interval_str)
+    )
 
     with DbSession.use(readonly=False) as db:
         db.exec(
@@ -91,7 +122,8 @@ async def _check_bot_schedule_runnable(interval_str: str):
             )
         )
 
-    for schedule_model, bot_schedule, bot in records:
+    schedule_models: list[BaseBotScheduleModel] = []
+    for schedule_model, bot_schedule, _ in records:
         if bot_schedule.running_type == BotScheduleRunningType.Duration:
             if (
                 not bot_schedule.start_at
@@ -100,83 +132,135 @@ async def _check_bot_schedule_runnable(interval_str: str):
                 or bot_schedule.end_at < current_time
             ):
                 continue
+        schedule_models.append(schedule_model)
+    return schedule_models
 
-        await BotScheduleHelper.change_status(
-            schedule_model.__class__,
-            schedule_model,
-            BotScheduleStatus.Started,
-            bot_schedule=bot_schedule,
-        )
 
-        model = BotHelper.get_target_model_by_bot_model("schedule", schedule_model)
-        if not model:
-            continue
+def _get_schedule_records(condition: Any) -> list[_TScheduleRecord]:
+    """Gets the schedules matching the condition with their bots and scope models in one query.
 
-        project = None
-        if isinstance(model, ProjectColumn) or isinstance(model, Card):
-            with DbSession.use(readonly=True) as db:
-                result = db.exec(SqlBuilder.select.table(Project).where(Project.column("id") == model.project_id))
-                project = result.first()
+    The scope models are outer joined, so each row has the scope model of its schedule and None for the others.
+    """
+    model_classes = ModelHelper.get_models_by_base_class(BaseBotScheduleModel)
+    query = SqlBuilder.select.tables(BotSchedule, Bot, *model_classes).join(
+        Bot, BotSchedule.column("bot_id") == Bot.column("id")
+    )
+    for model_class in model_classes:
+        query = query.outerjoin(model_class, model_class.column("bot_schedule_id") == BotSchedule.column("id"))
+    query = query.where(condition)
 
-        if project:
-            await ProjectBotPublisher.rescheduled(project, schedule_model, {"status": bot_schedule.status.value})
+    records: list[_TScheduleRecord] = []
+    record_keys: set[tuple[type[BaseBotScheduleModel], SnowflakeID]] = set()
+    with DbSession.use(readonly=True) as db:
+        result = db.exec(query)
+        for bot_schedule, bot, *schedule_models in result.all():
+            for schedule_model in schedule_models:
+                if schedule_model is None:
+                    continue
+                record_key = (schedule_model.__class__, schedule_model.id)
+                if record_key in record_keys:
+                    continue
+                record_keys.add(record_key)
+                records.append((schedule_model, bot_schedule, bot))
+    return records
 
-        await _run_scheduler(bot, bot_schedule, schedule_model, model)
 
+def _get_target_key(schedule_model: BaseBotScheduleModel) -> tuple[str, SnowflakeID] | None:
+    target_table = _get_target_table(schedule_model.__class__)
+    if not target_table:
+        return None
+    return target_table, getattr(schedule_model, f"{target_table}_id")
 
-async def _run_scheduler(
-    bot: Bot,
-    bot_schedule: BotSchedule,
-    schedule_model: BaseBotScheduleModel,
-    model: BaseSqlModel | None = None,
-):
-    if bot_schedule.status != BotScheduleStatus.Started:
-        return
 
-    if not model:
-        model = BotHelper.get_target_model_by_bot_model("schedule", schedule_model)
-        if not model:
-            return
+@lru_cache(maxsize=None)
+def _get_target_table(schedule_model_class: type[BaseBotScheduleModel]) -> str | None:
+    # The table names are declared attributes, which are evaluated on every access.
+    return BotHelper.get_target_table_by_bot_model("schedule", schedule_model_class)
+
+
+def _get_schedule_targets(records: list[_TScheduleRecord]) -> dict[tuple[str, SnowflakeID], _TScheduleTarget]:
+    """Prefetches the target models of the schedules with their columns and projects, and the data of their runs."""
+    target_ids: dict[str, set[SnowflakeID]] = {ProjectColumn.__tablename__: set(), Card.__tablename__: set()}
+    for schedule_model, _, _ in records:
+        target_key = _get_target_key(schedule_model)
+        if target_key and target_key[0] in target_ids:
+            target_ids[target_key[0]].add(target_key[1])
 
-    project = None
-    data = {}
+    columns: dict[SnowflakeID, ProjectColumn] = {}
+    cards: list[Card] = []
+    projects: dict[SnowflakeID, Project] = {}
     with DbSession.use(readonly=True) as db:
-        if isinstance(model, ProjectColumn):
-            result = db.exec(SqlBuilder.select.table(Project).where(Project.column("id") == model.project_id))
-            project = result.first()
-            if not project:
-                return
-            data = {
-                "project_column_uid": model.get_uid(),
+        column_ids = target_ids[ProjectColumn.__tablename__]
+        if target_ids[Card.__tablename__]:
+            result = db.exec(SqlBuilder.select.table(Card).where(Card.column("id").in_(target_ids[Card.__tablename__])))
+            cards = list(result.all())
+            column_ids = column_ids | {card.project_column_id for card in cards}
+
+        if column_ids:
+            result = db.exec(SqlBuilder.select.table(ProjectColumn).where(ProjectColumn.column("id").in_(column_ids)))
+            columns = {column.id: column for column in result.all()}
+
+        project_ids = {column.project_id for column in columns.values()}
+        if project_ids:
+            result = db.exec(SqlBuilder.select.table(Project).where(Project.column("id").in_(project_ids)))
+            projects = {project.id: project for project in result.all()}
+
+    targets: dict[tuple[str, SnowflakeID], _TScheduleTarget] = {}
+    for column_id in target_ids[ProjectColumn.__tablename__]:
+        column = columns.get(column_id)
+        project = projects.get(column.project_id) if column else None
+        if not column or not project:
+            continue
+        targets[(ProjectColumn.__tablename__, column_id)] = (
+            column,
+            project,
+            {
+                "project_column_uid": column.get_uid(),
                 "project_uid": project.get_uid(),
                 "scope": ProjectColumn.__tablename__,
-            }
-        elif isinstance(model, Card):
-            result = db.exec(
-                SqlBuilder.select.tables(ProjectColumn, Project)
-                .join(Project, ProjectColumn.column("project_id") == Project.column("id"))
-                .where(ProjectColumn.column("id") == model.project_column_id)
-            )
-            column, project = result.first() or (None, None)
-            if not column or not project:
-                return
-            data = {
+            },
+        )
+
+    for card in cards:
+        column = columns.get(card.project_column_id)
+        project = projects.get(column.project_id) if column else None
+        if not column or not project:
+            continue
+        targets[(Card.__tablename__, card.id)] = (
+            card,
+            project,
+            {
                 "project_column_uid": column.get_uid(),
-                "card_uid": model.get_uid(),
+                "card_uid": card.get_uid(),
                 "project_uid": project.get_uid(),
                 "scope": Card.__tablename__,
-            }
-        else:
-            return
+            },
+        )
+    return targets
+
+
+async def _run_scheduler(
+    bot: Bot,
+    bot_schedule: BotSchedule,
+    schedule_model: BaseBotScheduleModel,
+    target: _TScheduleTarget | None,
+):
+    if bot_schedule.status != BotScheduleStatus.Started or not target:
+        return
 
+    model, project, data = target
     await BotTaskHelper.run(bot, BotDefaultTrigger.BotCronScheduled, data, project, model)
 
     old_status = bot_schedule.status
     if bot_schedule.running_type == BotScheduleRunningType.Onetime:
-        await BotScheduleHelper.change_status(schedule_model.__class__, schedule_model, BotScheduleStatus.Stopped)
+        await BotScheduleHelper.change_status(
+            schedule_model.__class__, schedule_model, BotScheduleStatus.Stopped, bot_schedule=bot_schedule
+        )
     elif bot_schedule.running_type == BotScheduleRunningType.Duration:
         if bot_schedule.end_at and bot_schedule.end_at < SafeDateTime.now():
-            await BotScheduleHelper.change_status(schedule_model.__class__, schedule_model, BotScheduleStatus.Stopped)
+            await BotScheduleHelper.change_status(
+                schedule_model.__class__, schedule_model, BotScheduleStatus.Stopped, bot_schedule=bot_schedule
+            )
 
-    if project and bot_schedule.status != old_status:
+    if bot_schedule.status != old_status:
         await ProjectBotPublisher.rescheduled(project, schedule_model, {"status": bot_schedule.status.value})
@@ -0,0 +1,27 @@
+from os import environ
+from pathlib import Path
+from tempfile import mkdtemp
+from pytest import fixture
+
+
+# The tests run on their own SQLite database and in-memory cache whatever the .env of the checkout says, so they are
+# set before the first import of core.Env (which does not override variables that are already set).
+_TEST_DATA_DIR = Path(mkdtemp(prefix="langboard-tests-"))
+environ.setdefault("PROJECT_NAME", "langboard")
+environ["ENVIRONMENT"] = "local"
+environ["CACHE_TYPE"] = "in-memory"
+environ["CACHE_LOCAL_TIER_SIZE"] = "1024"
+environ["MAIN_DATABASE_URL"] = f"sqlite:///{_TEST_DATA_DIR / 'langboard.db'}"
+environ["READONLY_DATABASE_URL"] = environ["MAIN_DATABASE_URL"]
+
+
+@fixture(scope="session")
+def db_engine():
+    """Creates the tables of all models in the test database and returns its engine."""
+    import models  # noqa: F401
+    from core.db import DbEngine
+    from core.db.Models import default_registry
+
+    engine = DbEngine.get_main_engine()
+    default_registry.metadata.create_all(engine)
+    return engine
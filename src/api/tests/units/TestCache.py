@@ -0,0 +1,61 @@
+from asyncio import sleep
+from pathlib import Path
+from core.caching import Cache
+from core.caching.InMemoryCache import InMemoryCache
+from core.caching.LocalCache import LocalCache
+from langboard.middlewares.CacheStatsMiddleware import CacheStatsMiddleware
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+
+def _cast_dict(value: dict) -> dict:
+    return dict(value)
+
+
+async def test_in_memory_cache_returns_remaining_ttl(tmp_path: Path):
+    cache = InMemoryCache()
+    cache.set_cache_dir(tmp_path)
+    await cache.set("key", {"value": 1}, ttl=30)
+
+    value, ttl = await cache.get_with_ttl("key", _cast_dict)
+
+    assert value == {"value": 1}
+    assert ttl is not None and 28 < ttl <= 30
+    assert await cache.get_with_ttl("missing") == (None, None)
+
+
+def test_local_cache_keeps_the_shorter_ttl():
+    local = LocalCache(10, 60)
+    local.set("shared", _cast_dict, {"value": 1}, ttl=0)
+    local.set("local", _cast_dict, {"value": 2}, ttl=None)
+
+    assert local.get("shared", _cast_dict) == (False, None)
+    assert local.get("local", _cast_dict) == (True, {"value": 2})
+
+
+async def test_local_tier_expires_with_shared_tier(tmp_path: Path):
+    Cache.set_cache_dir(tmp_path)
+    await Cache.set("expiring", {"value": 1}, ttl=2)
+
+    assert await Cache.get("expiring", _cast_dict) == {"value": 1}
+    assert await Cache.get("expiring", _cast_dict) == {"value": 1}
+    stats = Cache.stats()
+    assert stats["l1"]["hits"] >= 1 and stats["l1"]["size"] >= 1
+
+    await sleep(2.1)
+    assert await Cache.get("expiring", _cast_dict) is None
+
+
+def test_middleware_reports_cache_stats():
+    async def index(request):
+        return PlainTextResponse("ok")
+
+    app = Starlette(routes=[Route("/", index)])
+    app.add_middleware(CacheStatsMiddleware)
+    response = TestClient(app).get("/")
+
+    server_timing = response.headers["server-timing"]
+    assert 'cache-l2;desc="' in server_timing
+    assert 'cache-l1;desc="' in server_timing and " entries" in server_timing
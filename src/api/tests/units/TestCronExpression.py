@@ -0,0 +1,128 @@
+from datetime import datetime, timedelta, timezone
+from random import Random
+from langboard.core.broker import CronExpression
+
+
+SEARCH_MINUTES = 60 * 24 * 62
+STARTS_PER_EXPRESSION = 6
+EXPRESSIONS = [
+    "* * * * *",
+    "*/15 * * * *",
+    "5-50/9 * * * *",
+    "0 9-17 * * 1-5",
+    "30 2 1,15 * *",
+    "0 0 13 * 5",
+    "0 12 * * 7",
+    "45 23 * * 0,6",
+    "0 0 31 * *",
+    "10 */6 * jan,mar-may,jul,sep-nov *",
+    "0 4 * * sun",
+    "@hourly",
+    "@daily",
+    "@weekly",
+    "@monthly",
+]
+SPECIALS = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+}
+NAMES = {name: value for value, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])} | {
+    name: value + 1
+    for value, name in enumerate(["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"])
+}
+
+
+def _parse_value(value: str) -> int:
+    return NAMES[value] if value in NAMES else int(value)
+
+
+def _expand_field(field: str, min_value: int, max_value: int) -> set[int]:
+    values: set[int] = set()
+    for part in field.split(","):
+        part, _, step = part.partition("/")
+        if part == "*":
+            start, end = min_value, max_value
+        elif "-" in part:
+            start, end = (_parse_value(value) for value in part.split("-"))
+        else:
+            start = end = _parse_value(part)
+        values.update(range(start, end + 1, int(step) if step else 1))
+    return values
+
+
+def _create_matcher(interval_str: str):
+    """Matches the times of a cron expression field by field, independently of :class:`CronExpression`."""
+    minute, hour, day, month, weekday = SPECIALS.get(interval_str, interval_str).split()
+    minutes = _expand_field(minute, 0, 59)
+    hours = _expand_field(hour, 0, 23)
+    days = _expand_field(day, 1, 31)
+    months = _expand_field(month, 1, 12)
+    weekdays = {value % 7 for value in _expand_field(weekday, 0, 7)}
+
+    def matches(time: datetime) -> bool:
+        if time.minute not in minutes or time.hour not in hours or time.month not in months:
+            return False
+        matches_day = time.day in days
+        matches_weekday = time.isoweekday() % 7 in weekdays
+        if day != "*" and weekday != "*":
+            return matches_day or matches_weekday
+        return matches_day and matches_weekday
+
+    return matches
+
+
+def _find_next_by_brute_force(interval_str: str, after: datetime) -> datetime | None:
+    matches = _create_matcher(interval_str)
+    time = after.replace(second=0, microsecond=0)
+    for _ in range(SEARCH_MINUTES):
+        time += timedelta(minutes=1)
+        if matches(time):
+            return time
+    return None
+
+
+def test_next_after_matches_brute_force():
+    random = Random(20260101)
+    for interval_str in EXPRESSIONS:
+        expression = CronExpression(interval_str)
+        for _ in range(STARTS_PER_EXPRESSION):
+            after = datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(
+                seconds=random.randrange(60 * 60 * 24 * 366 * 2)
+            )
+            # Each fire time is found again from itself, so the expression is walked through several fire times.
+            for _ in range(3):
+                expected = _find_next_by_brute_force(interval_str, after)
+                assert expected is not None
+                assert expression.next_after(after) == expected, f"{interval_str} after {after.isoformat()}"
+                after = expected
+
+
+def test_next_after_converts_to_utc():
+    expression = CronExpression("0 12 * * *")
+    after = datetime(2026, 3, 1, 20, 30, tzinfo=timezone(timedelta(hours=9)))
+
+    assert expression.next_after(after) == datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+    assert expression.next_after(after.astimezone(timezone.utc).replace(tzinfo=None)) == datetime(
+        2026, 3, 1, 12, 0, tzinfo=timezone.utc
+    )
+
+
+def test_next_after_returns_none_for_impossible_dates():
+    assert CronExpression("0 0 30 2 *").next_after(datetime(2026, 1, 1, tzinfo=timezone.utc)) is None
+
+
+def test_next_after_finds_leap_days():
+    expression = CronExpression("0 0 29 2 *")
+
+    assert expression.next_after(datetime(2026, 1, 1, tzinfo=timezone.utc)) == datetime(
+        2028, 2, 29, tzinfo=timezone.utc
+    )
+
+
+def test_reboot_never_fires_by_itself():
+    expression = CronExpression("@reboot")
+
+    assert expression.is_reboot
+    assert expression.next_after(datetime(2026, 1, 1, tzinfo=timezone.utc)) is None
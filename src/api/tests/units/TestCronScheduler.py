@@ -0,0 +1,175 @@
+from asyncio import sleep as async_sleep
+from datetime import datetime, timezone
+from logging import INFO, getLogger
+from langboard.core.broker import CronScheduler
+from pytest import approx
+
+
+logger = getLogger(__name__)
+logger.setLevel(INFO)
+
+START_TIME = datetime(2026, 1, 1, 0, 0, 30, tzinfo=timezone.utc).timestamp()
+OVERSLEEP = 0.3
+JOB_LATENCY = 0.01
+
+
+class FakeClock:
+    """A clock which only moves when the scheduler sleeps, oversleeping every sleep by a fixed time."""
+
+    def __init__(self, now: float, oversleep: float = 0.0):
+        self.now = now
+        self.oversleep = oversleep
+        self.sleep_count = 0
+
+    def time(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleep_count += 1
+        # Lets the fired jobs start before the clock moves.
+        await async_sleep(0)
+        self.now += seconds + self.oversleep
+
+
+def _create_jobs(jobs: dict[str, str]):
+    async def load_jobs() -> dict[str, str]:
+        return dict(jobs)
+
+    return load_jobs
+
+
+async def test_fire_due_fires_due_jobs_once():
+    clock = FakeClock(START_TIME)
+    fired_keys: list[str] = []
+
+    async def on_fire(key: str):
+        fired_keys.append(key)
+
+    scheduler = CronScheduler(_create_jobs({}), on_fire, clock=clock.time, sleep=clock.sleep)
+    scheduler.set_jobs({"every-5-minutes": "*/5 * * * *", "hourly": "0 * * * *"})
+
+    assert scheduler.get_next_fire_time("every-5-minutes") == START_TIME + 270
+    assert scheduler.get_next_fire_time("hourly") == START_TIME + 3570
+
+    assert scheduler.fire_due(START_TIME + 269) == []
+    assert scheduler.fire_due(START_TIME + 270) == ["every-5-minutes"]
+    assert scheduler.get_next_fire_time("every-5-minutes") == START_TIME + 570
+
+    # Missed fire times are skipped, so each job fires once however late the scheduler is.
+    assert sorted(scheduler.fire_due(START_TIME + 3570)) == ["every-5-minutes", "hourly"]
+    assert scheduler.get_next_fire_time("every-5-minutes") == START_TIME + 3870
+    assert scheduler.get_next_fire_time("hourly") == START_TIME + 7170
+
+    await scheduler.wait_until_idle()
+    assert sorted(fired_keys) == ["every-5-minutes", "every-5-minutes", "hourly"]
+    assert scheduler.fired_count == 3
+    assert scheduler.max_drift == 3000
+
+
+async def test_set_jobs_keeps_unchanged_and_drops_removed_jobs():
+    clock = FakeClock(START_TIME)
+
+    async def on_fire(key: str):
+        pass
+
+    scheduler = CronScheduler(_create_jobs({}), on_fire, clock=clock.time, sleep=clock.sleep)
+    scheduler.set_jobs({"kept": "*/5 * * * *", "removed": "* * * * *", "changed": "0 * * * *"})
+    clock.now = START_TIME + 120
+    scheduler.set_jobs({"kept": "*/5 * * * *", "changed": "30 * * * *", "reboot": "@reboot"})
+
+    assert scheduler.get_next_fire_time("kept") == START_TIME + 270
+    assert scheduler.get_next_fire_time("removed") is None
+    assert scheduler.get_next_fire_time("changed") == START_TIME + 1770
+    assert scheduler.get_next_fire_time("reboot") == START_TIME + 120
+
+    assert scheduler.fire_due(START_TIME + 120) == ["reboot"]
+    assert scheduler.get_next_fire_time("reboot") is None
+    assert scheduler.fire_due(START_TIME + 86400 * 2) == ["kept", "changed"]
+    await scheduler.wait_until_idle()
+
+
+async def test_run_measures_drift_and_latency():
+    clock = FakeClock(START_TIME, oversleep=OVERSLEEP)
+    fired_times: list[float] = []
+
+    async def on_fire(key: str):
+        fired_times.append(clock.now)
+        if len(fired_times) == 5:
+            scheduler.stop()
+        await async_sleep(JOB_LATENCY)
+
+    scheduler = CronScheduler(_create_jobs({"every-minute": "* * * * *"}), on_fire, clock=clock.time, sleep=clock.sleep)
+    await scheduler.run()
+    await scheduler.wait_until_idle()
+
+    logger.info(
+        "%d fires in %d sleeps: drift %.3fs average, %.3fs max / latency %.4fs average, %.4fs max",
+        scheduler.fired_count,
+        clock.sleep_count,
+        scheduler.average_drift,
+        scheduler.max_drift,
+        scheduler.average_latency,
+        scheduler.max_latency,
+    )
+
+    assert scheduler.fired_count == 5
+    # A fire is only late by the oversleep of the sleep before it, however many polls come in between.
+    assert 0 < scheduler.average_drift <= scheduler.max_drift
+    assert scheduler.max_drift <= OVERSLEEP + 1e-6
+    for i, fired_time in enumerate(fired_times):
+        assert 30 + 60 * i <= fired_time - START_TIME <= 30 + 60 * i + OVERSLEEP + 1e-6
+    assert scheduler.average_latency >= JOB_LATENCY
+    assert scheduler.max_latency >= scheduler.average_latency
+
+
+async def test_run_reloads_jobs_when_version_changes():
+    clock = FakeClock(START_TIME)
+    jobs = {"every-minute": "* * * * *"}
+    version = ["v1"]
+    load_count = [0]
+    fired_keys: list[str] = []
+    fired_times: list[float] = []
+
+    async def load_jobs() -> dict[str, str]:
+        load_count[0] += 1
+        return dict(jobs)
+
+    async def get_version() -> str:
+        return version[0]
+
+    async def on_fire(key: str):
+        fired_keys.append(key)
+        fired_times.append(clock.now)
+        if key == "every-minute":
+            jobs.pop("every-minute")
+            jobs["hourly"] = "0 * * * *"
+            version[0] = "v2"
+        elif key == "hourly":
+            scheduler.stop()
+
+    scheduler = CronScheduler(load_jobs, on_fire, get_version=get_version, clock=clock.time, sleep=clock.sleep)
+    await scheduler.run()
+    await scheduler.wait_until_idle()
+
+    assert fired_keys == ["every-minute", "hourly"]
+    # The hourly job is picked up by the reload on the version change.
+    assert fired_times[1] - START_TIME == approx(3570)
+    assert load_count[0] >= 2
+
+
+async def test_run_survives_failing_jobs():
+    clock = FakeClock(START_TIME)
+    fired_count = [0]
+
+    async def on_fire(key: str):
+        fired_count[0] += 1
+        if fired_count[0] == 2:
+            scheduler.stop()
+        raise RuntimeError("The job failed")
+
+    scheduler = CronScheduler(_create_jobs({"every-minute": "* * * * *"}), on_fire, clock=clock.time, sleep=clock.sleep)
+    await scheduler.run()
+    await scheduler.wait_until_idle()
+
+    assert fired_count[0] == 2
+    assert scheduler.fired_count == 2
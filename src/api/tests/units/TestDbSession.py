@@ -0,0 +1,135 @@
+from logging import INFO, getLogger
+from time import perf_counter
+from typing import cast
+from core.db import DbSession, SqlBuilder
+from core.types import SafeDateTime, SnowflakeID
+from langboard.tasks.activities.utils import ActivityTaskHelper
+from models import Project, ProjectLabel, ProjectWikiActivity, User, UserActivity
+from models.ProjectWikiActivity import ProjectWikiActivityType
+
+
+logger = getLogger(__name__)
+logger.setLevel(INFO)
+
+ROW_COUNT = 10000
+
+
+def _create_labels(project_id: SnowflakeID, name: str) -> list[ProjectLabel]:
+    return [
+        ProjectLabel(project_id=project_id, name=f"{name} {i}", color="#FFFFFF", description=name, order=i)
+        for i in range(ROW_COUNT)
+    ]
+
+
+def _get_labels(project_id: SnowflakeID) -> list[ProjectLabel]:
+    with DbSession.use(readonly=True) as db:
+        result = db.exec(
+            SqlBuilder.select.table(ProjectLabel)
+            .where(ProjectLabel.column("project_id") == project_id)
+            .order_by(ProjectLabel.column("order"))
+        )
+    return result.all()
+
+
+def _log_throughput(name: str, elapsed: float) -> float:
+    logger.info("%s: %d rows in %.3fs (%.0f rows/s)", name, ROW_COUNT, elapsed, ROW_COUNT / elapsed)
+    return elapsed
+
+
+def _measure_inserts(labels: list[ProjectLabel], is_bulk: bool) -> float:
+    started_at = perf_counter()
+    with DbSession.use(readonly=False) as db:
+        if is_bulk:
+            db.bulk_insert(labels)
+        else:
+            db.insert_all(labels)
+    return _log_throughput("bulk_insert" if is_bulk else "insert_all", perf_counter() - started_at)
+
+
+def _measure_updates(labels: list[ProjectLabel], is_bulk: bool) -> float:
+    for label in labels:
+        label.order += ROW_COUNT
+    started_at = perf_counter()
+    with DbSession.use(readonly=False) as db:
+        if is_bulk:
+            db.bulk_update(labels, ["order"])
+        else:
+            for label in labels:
+                db.update(label)
+    return _log_throughput("bulk_update" if is_bulk else "update", perf_counter() - started_at)
+
+
+def test_bulk_insert_and_update_are_faster_than_orm(db_engine):
+    orm_project_id, bulk_project_id = SnowflakeID(), SnowflakeID()
+    bulk_labels = _create_labels(bulk_project_id, "Bulk")
+
+    orm_insert_elapsed = _measure_inserts(_create_labels(orm_project_id, "ORM"), is_bulk=False)
+    bulk_insert_elapsed = _measure_inserts(bulk_labels, is_bulk=True)
+
+    assert all(not label.is_new() and label.updated_at == label.created_at for label in bulk_labels)
+    assert len({label.id for label in bulk_labels}) == ROW_COUNT
+    assert [label.id for label in _get_labels(bulk_project_id)] == [label.id for label in bulk_labels]
+
+    updated_since = SafeDateTime.now()
+    orm_update_elapsed = _measure_updates(_get_labels(orm_project_id), is_bulk=False)
+    bulk_update_elapsed = _measure_updates(bulk_labels, is_bulk=True)
+
+    assert all(label.updated_at >= updated_since and not label.has_changes() for label in bulk_labels)
+    stored_labels = _get_labels(bulk_project_id)
+    assert [label.order for label in stored_labels] == [label.order for label in bulk_labels]
+    # SQLite does not store the time zone.
+    assert [label.updated_at.replace(tzinfo=None) for label in stored_labels] == [
+        label.updated_at.replace(tzinfo=None) for label in bulk_labels
+    ]
+
+    assert bulk_insert_elapsed < orm_insert_elapsed
+    assert bulk_update_elapsed < orm_update_elapsed
+
+
+def test_insert_all_inserts_mixed_models(db_engine):
+    project = Project(owner_id=SnowflakeID(), title="Project", project_type="Other")
+    label = ProjectLabel(project_id=SnowflakeID(), name="Label", color="#FFFFFF", description="Label")
+
+    with DbSession.use(readonly=False) as db:
+        db.insert_all([label, project])
+
+    with DbSession.use(readonly=True) as db:
+        stored_project = db.exec(SqlBuilder.select.table(Project).where(Project.column("id") == project.id)).first()
+        stored_label = db.exec(
+            SqlBuilder.select.table(ProjectLabel).where(ProjectLabel.column("id") == label.id)
+        ).first()
+
+    assert stored_project and stored_project.title == "Project"
+    assert stored_label and stored_label.name == "Label"
+
+
+def test_record_refers_to_activity_from_user_activity(db_engine):
+    user = User(
+        id=SnowflakeID(),
+        firstname="Test",
+        lastname="User",
+        email="test@example.com",
+        username="test",
+        password="password",
+    )
+    helper = ActivityTaskHelper(ProjectWikiActivity)
+
+    activity = helper.record(
+        user,
+        {},
+        project_id=SnowflakeID(),
+        project_wiki_id=SnowflakeID(),
+        activity_type=ProjectWikiActivityType.WikiCreated,
+    )
+
+    with DbSession.use(readonly=True) as db:
+        result = db.exec(
+            SqlBuilder.select.table(UserActivity).where(UserActivity.column("refer_activity_id") == activity.id)
+        )
+        user_activities = cast(list[UserActivity], result.all())
+
+    assert not activity.is_new()
+    assert len(user_activities) == 1
+    assert user_activities[0].user_id == user.id
+    assert user_activities[0].refer_activity_table == ProjectWikiActivity.__tablename__
+    assert user_activities[0].activity_history["recorder"] == activity.activity_history["recorder"]
@@ -0,0 +1,135 @@
+from importlib import import_module
+from threading import Event
+from time import monotonic, sleep
+from typing import Any, Callable
+from core.broadcast.kafka import KafkaDispatcherQueue
+from core.Env import Env
+from core.serialization import JsonCodec
+from kafka.errors import KafkaError
+from kafka.future import Future
+from pytest import LogCaptureFixture, MonkeyPatch, fixture
+
+
+class StandInKafkaProducer:
+    """Stands in for the Kafka broker behind :class:`KafkaProducer`.
+
+    Sent messages are acknowledged (or failed, for ``failing_topics``) when the producer is flushed, as the real
+    producer does once the broker answers. ``gate`` holds every flush until it is set.
+    """
+
+    def __init__(self, value_serializer: Callable[[Any], bytes], **_: Any):
+        self.value_serializer = value_serializer
+        self.messages: list[tuple[str, Any]] = []
+        self.failing_topics: set[str] = set()
+        self.gate = Event()
+        self.gate.set()
+        self.is_flushing = Event()
+        self.is_closed = False
+        self._pending: list[tuple[str, bytes, Future]] = []
+
+    def send(self, topic: str, value: Any) -> Future:
+        future = Future()
+        self._pending.append((topic, self.value_serializer(value), future))
+        return future
+
+    def flush(self, timeout: float | None = None) -> None:
+        self.is_flushing.set()
+        self.gate.wait()
+        pending, self._pending = self._pending, []
+        for topic, value, future in pending:
+            if topic in self.failing_topics:
+                future.failure(KafkaError(f"{topic} is not available"))
+                continue
+            self.messages.append((topic, JsonCodec.loads(value)))
+            future.success(None)
+
+    def close(self) -> None:
+        self.is_closed = True
+
+
+def _set_env(monkeypatch: MonkeyPatch, **values: Any) -> None:
+    for name, value in values.items():
+        monkeypatch.setattr(type(Env), name, property(lambda _, value=value: value))
+
+
+@fixture(autouse=True)
+def stand_in_broker(monkeypatch: MonkeyPatch):
+    module = import_module("core.broadcast.kafka.KafkaDispatcherQueue")
+    monkeypatch.setattr(module, "KafkaProducer", StandInKafkaProducer)
+    _set_env(monkeypatch, BROADCAST_URLS=["localhost:9092"], BROADCAST_COMPRESSION="none")
+
+
+def _wait_for(event: Event) -> None:
+    assert event.wait(5)
+
+
+async def test_put_waits_for_the_broker_by_default(monkeypatch: MonkeyPatch):
+    _set_env(monkeypatch, BROADCAST_ASYNC=False)
+    queue = KafkaDispatcherQueue()
+    producer: StandInKafkaProducer = queue.producer
+
+    await queue.put("card:created", {"uid": "abc"})
+
+    assert producer.messages == [("card:created", {"data": {"uid": "abc"}})]
+
+
+async def test_async_put_sends_every_event_and_reports_metrics(monkeypatch: MonkeyPatch, caplog: LogCaptureFixture):
+    _set_env(monkeypatch, BROADCAST_ASYNC=True, BROADCAST_BATCH_SIZE=10, BROADCAST_LINGER_MS=5)
+    queue = KafkaDispatcherQueue()
+    producer: StandInKafkaProducer = queue.producer
+    producer.failing_topics.add("card:failed")
+    caplog.set_level("INFO")
+
+    for i in range(25):
+        await queue.put("card:updated", {"order": i})
+    await queue.put("card:failed", {})
+    queue.close()
+
+    assert [value["data"]["order"] for _, value in producer.messages] == list(range(25))
+    assert producer.is_closed
+    assert queue.get_metrics() == {"enqueued": 26, "sent": 25, "failed": 1, "dropped": 0, "buffered": 0}
+    assert "Broadcast metrics: 26 enqueued, 25 sent, 1 failed, 0 dropped, 0 buffered (1 events lost" in caplog.text
+
+
+async def test_async_put_drops_events_when_the_buffer_is_full(monkeypatch: MonkeyPatch, caplog: LogCaptureFixture):
+    _set_env(
+        monkeypatch,
+        BROADCAST_ASYNC=True,
+        BROADCAST_BATCH_SIZE=1,
+        BROADCAST_LINGER_MS=0,
+        BROADCAST_BACKPRESSURE="drop",
+        BROADCAST_BUFFER_SIZE=1,
+    )
+    queue = KafkaDispatcherQueue()
+    producer: StandInKafkaProducer = queue.producer
+    producer.gate.clear()
+
+    await queue.put("card:updated", {"order": 0})
+    _wait_for(producer.is_flushing)
+    await queue.put("card:updated", {"order": 1})
+    await queue.put("card:updated", {"order": 2})
+
+    assert queue.get_metrics() == {"enqueued": 2, "sent": 0, "failed": 0, "dropped": 1, "buffered": 1}
+
+    producer.gate.set()
+    queue.close()
+
+    assert [value["data"]["order"] for _, value in producer.messages] == [0, 1]
+    assert queue.get_metrics()["sent"] == 2
+    assert "Dropped event: card:updated" in caplog.text
+    assert "(1 events lost since the last report)" in caplog.text
+
+
+async def test_sender_reports_metrics_periodically(monkeypatch: MonkeyPatch, caplog: LogCaptureFixture):
+    _set_env(monkeypatch, BROADCAST_ASYNC=True, BROADCAST_BATCH_SIZE=1, BROADCAST_LINGER_MS=0)
+    monkeypatch.setattr(KafkaDispatcherQueue, "METRICS_LOG_INTERVAL", 0)
+    caplog.set_level("INFO")
+    queue = KafkaDispatcherQueue()
+
+    await queue.put("card:updated", {})
+    deadline = monotonic() + 5
+    while "Broadcast metrics" not in caplog.text and monotonic() < deadline:
+        sleep(0.01)
+    queue.close()
+
+    assert "Broadcast metrics: 1 enqueued, 1 sent" in caplog.text
@@ -0,0 +1,113 @@
+from asyncio import get_running_loop
+from importlib import import_module
+from threading import Event
+from typing import Any
+from core.caching.RedisCache import RedisCache
+from fakeredis import FakeAsyncRedis, FakeRedis, FakeServer
+from pytest import MonkeyPatch, fixture
+
+
+@fixture
+def server(monkeypatch: MonkeyPatch) -> FakeServer:
+    """Points every connection opened by :class:`RedisCache` at one in-process fakeredis server."""
+    server = FakeServer()
+    module = import_module("core.caching.RedisCache")
+
+    class StandInConnectionPool:
+        @staticmethod
+        def from_url(url: str, **kwargs: Any):
+            return FakeAsyncRedis(server=server, **kwargs).connection_pool
+
+    class StandInSyncRedis:
+        @staticmethod
+        def from_url(url: str, **kwargs: Any):
+            return FakeRedis(server=server, **kwargs)
+
+    monkeypatch.setattr(module, "ConnectionPool", StandInConnectionPool)
+    monkeypatch.setattr(module, "SyncRedis", StandInSyncRedis)
+    return server
+
+
+def _cast_dict(value: dict) -> dict:
+    return dict(value)
+
+
+async def test_set_get_has_and_delete(server: FakeServer):
+    cache = RedisCache()
+
+    await cache.set("key", {"value": 1})
+    assert await cache.has("key")
+    assert await cache.get("key") == {"value": 1}
+    assert await cache.get("key", _cast_dict) == {"value": 1}
+    assert await cache.get("key", int) is None
+
+    await cache.delete("key")
+    assert not await cache.has("key")
+    assert await cache.get("key") is None
+
+    await cache.set("other", "value")
+    await cache.clear()
+    assert await cache.get("other") is None
+    await cache.close_loop_resources()
+
+
+async def test_get_with_ttl_returns_remaining_ttl(server: FakeServer):
+    cache = RedisCache()
+    await cache.set("expiring", {"value": 1}, ttl=30)
+    await cache.set("persistent", {"value": 2})
+
+    value, ttl = await cache.get_with_ttl("expiring", _cast_dict)
+    assert value == {"value": 1}
+    assert ttl is not None and 29 < ttl <= 30
+    assert await cache.get_with_ttl("persistent") == ({"value": 2}, None)
+    assert await cache.get_with_ttl("missing") == (None, None)
+    await cache.close_loop_resources()
+
+
+async def test_batch_operations(server: FakeServer):
+    cache = RedisCache()
+
+    await cache.set_many({"a": 1, "b": {"value": 2}}, ttl=30)
+    assert await cache.get_many(["a", "b", "missing"]) == {"a": 1, "b": {"value": 2}, "missing": None}
+    assert (await cache.get_with_ttl("a"))[1] is not None
+
+    await cache.delete_many(["a", "missing"])
+    assert await cache.get_many(["a", "b"]) == {"a": None, "b": {"value": 2}}
+    assert await cache.get_many([]) == {}
+    await cache.close_loop_resources()
+
+
+async def test_invalidations_reach_other_processes_only(server: FakeServer):
+    publisher, subscriber = RedisCache(), RedisCache()
+    received: list[list[str] | None] = []
+    has_received = Event()
+
+    def on_invalidation(keys: list[str] | None) -> None:
+        received.append(keys)
+        has_received.set()
+
+    subscriber.subscribe_invalidation(on_invalidation)
+    # Its own invalidations are ignored, so only the publisher's reach the callback.
+    await subscriber.publish_invalidation(["own"])
+    await publisher.publish_invalidation(["key"])
+    assert has_received.wait(5)
+    has_received.clear()
+    await publisher.publish_invalidation(None)
+    assert has_received.wait(5)
+
+    assert received == [["key"], None]
+    await publisher.close_loop_resources()
+    await subscriber.close_loop_resources()
+
+
+async def test_close_loop_resources_drops_the_client_of_the_loop(server: FakeServer):
+    cache = RedisCache()
+    await cache.set("key", "value")
+    loop = get_running_loop()
+    assert loop in cache._clients
+
+    await cache.close_loop_resources()
+    assert loop not in cache._clients
+    # A new client is opened on the next call.
+    assert await cache.get("key") == "value"
+    await cache.close_loop_resources()
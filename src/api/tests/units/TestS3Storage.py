@@ -0,0 +1,262 @@
+from email.utils import formatdate
+from hashlib import md5
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from threading import Lock, Thread
+from time import time
+from typing import Any
+from urllib.parse import parse_qs, unquote, urlparse
+from uuid import uuid4
+from core.Env import Env
+from core.storage.S3Storage import S3Storage
+from core.storage.StorageName import StorageName
+from pytest import MonkeyPatch, fixture
+
+
+BUCKET_NAME = "langboard-tests"
+LARGE_FILE_SIZE = S3Storage.TRANSFER_CONFIG.multipart_threshold + 1024 * 1024
+
+
+class StandInS3Server(ThreadingHTTPServer):
+    """A local S3-compatible server handling the path-style object and multipart upload calls of :class:`S3Storage`.
+
+    It records the requests and the client ports they came from, so connection reuse can be checked.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StandInS3Handler)
+        self.lock = Lock()
+        self.objects: dict[str, tuple[bytes, float]] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.requests: list[tuple[str, str]] = []
+        self.client_ports: set[int] = set()
+
+    @property
+    def endpoint_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StandInS3Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: StandInS3Server
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_HEAD(self):
+        self.__record()
+        stored = self.server.objects.get(self.__get_key())
+        if stored is None:
+            self.__respond(404)
+            return
+        self.__respond(200, headers=self.__get_object_headers(*stored), body_length=len(stored[0]))
+
+    def do_GET(self):
+        self.__record()
+        stored = self.server.objects.get(self.__get_key())
+        if stored is None:
+            self.__respond(404, b"<Error><Code>NoSuchKey</Code></Error>")
+            return
+
+        body, _ = stored
+        headers = self.__get_object_headers(*stored)
+        range_header = self.headers.get("Range")
+        if not range_header:
+            self.__respond(200, body, headers)
+            return
+
+        start_str, _, end_str = range_header.removeprefix("bytes=").partition("-")
+        start = int(start_str)
+        end = min(int(end_str), len(body) - 1) if end_str else len(body) - 1
+        headers["Content-Range"] = f"bytes {start}-{end}/{len(body)}"
+        self.__respond(206, body[start : end + 1], headers)
+
+    def do_PUT(self):
+        self.__record()
+        body = self.__read_body()
+        query = self.__get_query()
+        if "uploadId" in query:
+            with self.server.lock:
+                self.server.uploads[query["uploadId"]][int(query["partNumber"])] = body
+        else:
+            with self.server.lock:
+                self.server.objects[self.__get_key()] = (body, _get_now())
+        self.__respond(200, headers={"ETag": _get_etag(body)})
+
+    def do_POST(self):
+        self.__record()
+        self.__read_body()
+        query = self.__get_query()
+        key = self.__get_key()
+        if "uploads" in query:
+            upload_id = uuid4().hex
+            with self.server.lock:
+                self.server.uploads[upload_id] = {}
+            self.__respond(
+                200,
+                (
+                    f"<InitiateMultipartUploadResult><Bucket>{BUCKET_NAME}</Bucket><Key>{key}</Key>"
+                    f"<UploadId>{upload_id}</UploadId></InitiateMultipartUploadResult>"
+                ).encode(),
+            )
+            return
+
+        with self.server.lock:
+            parts = self.server.uploads.pop(query["uploadId"])
+            body = b"".join(parts[part_number] for part_number in sorted(parts))
+            self.server.objects[key] = (body, _get_now())
+        self.__respond(
+            200,
+            (
+                f"<CompleteMultipartUploadResult><Bucket>{BUCKET_NAME}</Bucket><Key>{key}</Key>"
+                f"<ETag>{_get_etag(body)}</ETag></CompleteMultipartUploadResult>"
+            ).encode(),
+        )
+
+    def do_DELETE(self):
+        self.__record()
+        with self.server.lock:
+            self.server.objects.pop(self.__get_key(), None)
+        self.__respond(204)
+
+    def __record(self) -> None:
+        with self.server.lock:
+            self.server.requests.append((self.command, self.path))
+            self.server.client_ports.add(self.client_address[1])
+
+    def __get_key(self) -> str:
+        path = unquote(urlparse(self.path).path)
+        bucket_name, _, key = path.lstrip("/").partition("/")
+        assert bucket_name == BUCKET_NAME
+        return key
+
+    def __get_query(self) -> dict[str, str]:
+        query = parse_qs(urlparse(self.path).query, keep_blank_values=True)
+        return {name: values[0] for name, values in query.items()}
+
+    def __read_body(self) -> bytes:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if "aws-chunked" not in self.headers.get("Content-Encoding", ""):
+            return body
+
+        # Payloads sent with a trailing checksum are framed as "<size hex>\r\n<data>\r\n" chunks.
+        decoded = BytesIO()
+        stream = BytesIO(body)
+        while size := int(stream.readline().split(b";")[0].strip() or b"0", 16):
+            decoded.write(stream.read(size))
+            stream.readline()
+        return decoded.getvalue()
+
+    def __get_object_headers(self, body: bytes, modified_at: float) -> dict[str, str]:
+        return {
+            "ETag": _get_etag(body),
+            "Last-Modified": formatdate(modified_at, usegmt=True),
+            "Accept-Ranges": "bytes",
+            "Content-Type": "application/octet-stream",
+        }
+
+    def __respond(
+        self, status: int, body: bytes = b"", headers: dict[str, str] | None = None, body_length: int | None = None
+    ) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body) if body_length is None else body_length))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+
+def _get_etag(body: bytes) -> str:
+    return f'"{md5(body).hexdigest()}"'
+
+
+def _get_now() -> float:
+    return time()
+
+
+def _set_env(monkeypatch: MonkeyPatch, **values: Any) -> None:
+    for name, value in values.items():
+        monkeypatch.setattr(type(Env), name, property(lambda _, value=value: value))
+
+
+@fixture
+def server(monkeypatch: MonkeyPatch):
+    server = StandInS3Server()
+    Thread(target=server.serve_forever, daemon=True).start()
+    _set_env(
+        monkeypatch,
+        S3_ACCESS_KEY_ID="access-key",
+        S3_SECRET_ACCESS_KEY="secret-key",
+        S3_REGION_NAME="us-east-1",
+        S3_BUCKET_NAME=BUCKET_NAME,
+        S3_ENDPOINT_URL=server.endpoint_url,
+    )
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_upload_get_and_delete(server: StandInS3Server):
+    storage = S3Storage()
+    assert storage.is_connectable()
+
+    file_model = storage.upload(BytesIO(b"attachment"), "notes.txt", StorageName.CardAttachment)
+    assert file_model is not None
+    assert file_model.storage_type == S3Storage.storage_type
+    assert file_model.filename.endswith(".txt")
+    assert server.objects[f"card_attachment/{file_model.filename}"][0] == b"attachment"
+
+    assert storage.get(file_model.storage_name, file_model.filename) == b"attachment"
+    assert storage.get(file_model.storage_name, "missing.txt") is None
+
+    assert storage.delete(file_model)
+    assert storage.get(file_model.storage_name, file_model.filename) is None
+
+
+def test_large_files_are_transferred_in_parts(server: StandInS3Server):
+    storage = S3Storage()
+    content = bytes(range(256)) * (LARGE_FILE_SIZE // 256)
+
+    file_model = storage.upload(BytesIO(content), "video.mp4", StorageName.Wiki)
+    assert file_model is not None
+    assert storage.get(file_model.storage_name, file_model.filename) == content
+
+    upload_parts = [path for method, path in server.requests if method == "PUT" and "partNumber=" in path]
+    ranged_gets = [path for method, path in server.requests if method == "GET"]
+    assert len(upload_parts) == 2
+    assert len(ranged_gets) == 2
+
+
+def test_open_stream_reads_ranges(server: StandInS3Server):
+    storage = S3Storage()
+    content = b"0123456789" * 10
+    file_model = storage.upload(BytesIO(content), "numbers.txt", StorageName.CardAttachment)
+    assert file_model is not None
+
+    stream = storage.open_stream(file_model.storage_name, file_model.filename)
+    assert stream is not None
+    assert stream.size == len(content)
+    assert stream.etag == _get_etag(content)
+    assert b"".join(stream.iter_chunks()) == content
+    assert b"".join(stream.iter_chunks(5, 14)) == content[5:15]
+    assert storage.open_stream(file_model.storage_name, "missing.txt") is None
+
+
+def test_client_and_connections_are_reused(server: StandInS3Server, monkeypatch: MonkeyPatch):
+    storage = S3Storage()
+    client = storage._get_client()
+    for i in range(20):
+        file_model = storage.upload(BytesIO(f"file {i}".encode()), "file.txt", StorageName.Avatar)
+        assert file_model is not None
+        assert storage.get(file_model.storage_name, file_model.filename) == f"file {i}".encode()
+
+    assert storage._get_client() is client
+    # Sequential calls keep using the pooled keep-alive connection.
+    assert len(server.requests) >= 40
+    assert len(server.client_ports) <= 2
+
+    _set_env(monkeypatch, S3_ACCESS_KEY_ID="other-access-key")
+    assert storage._get_client() is not client
@@ -0,0 +1,73 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from logging import INFO, getLogger
+from multiprocessing import get_context
+from time import perf_counter
+from core.types import SnowflakeID
+
+
+logger = getLogger(__name__)
+logger.setLevel(INFO)
+
+IDS_PER_WORKER = 20000
+ALLOCATIONS_PER_WORKER = 10
+ALLOCATION_SIZE = 1000
+
+
+def _generate_ids() -> list[int]:
+    ids = [int(SnowflakeID()) for _ in range(IDS_PER_WORKER)]
+    for _ in range(ALLOCATIONS_PER_WORKER):
+        ids.extend(int(id) for id in SnowflakeID.allocate(ALLOCATION_SIZE))
+    return ids
+
+
+def _get_machine_id(id: int) -> int:
+    return (id >> 12) & 0x3FF
+
+
+def _log_throughput(name: str, count: int, elapsed: float) -> None:
+    logger.info("%s: %d IDs in %.3fs (%.0f IDs/s)", name, count, elapsed, count / elapsed)
+
+
+def test_allocate_returns_unique_ids():
+    ids = SnowflakeID.allocate(50000)
+
+    assert len(ids) == 50000
+    assert len(set(ids)) == len(ids)
+    assert all(isinstance(id, SnowflakeID) for id in ids)
+
+
+def test_short_codes_round_trip():
+    ids = SnowflakeID.allocate(1000)
+
+    assert SnowflakeID.decode_many(SnowflakeID.encode_many(ids)) == ids
+    assert all(SnowflakeID.from_short_code(id.to_short_code()) == id for id in ids)
+
+
+def test_ids_are_unique_across_threads():
+    workers = 8
+    started_at = perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(lambda _: _generate_ids(), range(workers)))
+    elapsed = perf_counter() - started_at
+
+    ids = [id for result in results for id in result]
+    _log_throughput(f"{workers} threads", len(ids), elapsed)
+    assert len(set(ids)) == len(ids)
+
+
+def test_ids_are_unique_across_processes():
+    # The processes of one node share the node ID, so only their worker IDs keep them apart.
+    workers = 4
+    started_at = perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("fork")) as executor:
+        results = [executor.submit(_generate_ids) for _ in range(workers)]
+        results = [result.result() for result in results]
+    elapsed = perf_counter() - started_at
+
+    ids = [id for result in results for id in result]
+    _log_throughput(f"{workers} processes", len(ids), elapsed)
+    assert len(set(ids)) == len(ids)
+
+    machine_ids = [{_get_machine_id(id) for id in result} for result in results]
+    assert all(len(ids) == 1 for ids in machine_ids)
+    assert len(set.union(*machine_ids)) == workers
@@ -91,6 +91,66 @@ class Env:
     def DB_TCP_USER_TIMEOUT(self) -> int:
         return int(self.__get_from_cache("DB_TCP_USER_TIMEOUT", "1000"))
 
+    @property
+    def DB_POOL_MODE(self) -> Literal["queue", "null"]:
+        pool_mode = cast(Any, self.__get_from_cache("DB_POOL_MODE", "queue"))
+        _available_pool_modes = {"queue", "null"}
+        if pool_mode not in _available_pool_modes:
+            raise ValueError(f"Invalid DB pool mode: {pool_mode}. Must be one of {_available_pool_modes}")
+        return pool_mode
+
+    @property
+    def DB_POOL_SIZE(self) -> int:
+        return int(self.__get_from_cache("DB_POOL_SIZE", "5"))
+
+    @property
+    def DB_POOL_MAX_OVERFLOW(self) -> int:
+        return int(self.__get_from_cache("DB_POOL_MAX_OVERFLOW", "5"))
+
+    @property
+    def DB_BROKER_POOL_SIZE(self) -> int:
+        return int(self.__get_from_cache("DB_BROKER_POOL_SIZE", "2"))
+
+    @property
+    def DB_BROKER_POOL_MAX_OVERFLOW(self) -> int:
+        return int(self.__get_from_cache("DB_BROKER_POOL_MAX_OVERFLOW", "2"))
+
+    @property
+    def DB_POOL_TIMEOUT(self) -> int:
+        return int(self.__get_from_cache("DB_POOL_TIMEOUT", "30"))
+
+    @property
+    def DB_POOL_RECYCLE(self) -> int:
+        return int(self.__get_from_cache("DB_POOL_RECYCLE", "1800"))
+
+    @property
+    def DB_PGBOUNCER(self) -> Literal["auto", "true", "false"]:
+        pgbouncer = cast(Any, self.__get_from_cache("DB_PGBOUNCER", "auto"))
+        _available_pgbouncer_values = {"auto", "true", "false"}
+        if pgbouncer not in _available_pgbouncer_values:
+            raise ValueError(f"Invalid DB_PGBOUNCER: {pgbouncer}. Must be one of {_available_pgbouncer_values}")
+        return pgbouncer
+
+    @property
+    def SNOWFLAKE_NODE_ID(self) -> int | None:
+        node_id = self.__get_from_cache("SNOWFLAKE_NODE_ID", None)
+        if node_id is None:
+            return None
+        node_id = int(node_id)
+        if not 0 <= node_id < 32:
+            raise ValueError(f"Invalid SNOWFLAKE_NODE_ID: {node_id}. Must be between 0 and 31")
+        return node_id
+
+    @property
+    def SNOWFLAKE_WORKER_ID(self) -> int | None:
+        worker_id = self.__get_from_cache("SNOWFLAKE_WORKER_ID", None)
+        if worker_id is None:
+            return None
+        worker_id = int(worker_id)
+        if not 0 <= worker_id < 32:
+            raise ValueError(f"Invalid SNOWFLAKE_WORKER_ID: {worker_id}. Must be between 0 and 31")
+        return worker_id
+
     @property
     def TERMINAL_LOGGING_LEVEL(self) -> str:
         return self.__get_from_cache("TERMINAL_LOGGING_LEVEL", "AUTO").upper()
@@ -103,6 +163,14 @@ class Env:
     def SENTRY_DSN(self) -> str:
         return self.__get_from_cache("SENTRY_DSN")
 
+    @property
+    def JSON_CODEC(self) -> Literal["orjson", "stdlib"]:
+        json_codec = cast(Any, self.__get_from_cache("JSON_CODEC", "orjson"))
+        _available_json_codecs = {"orjson", "stdlib"}
+        if json_codec not in _available_json_codecs:
+            raise ValueError(f"Invalid JSON codec: {json_codec}. Must be one of {_available_json_codecs}")
+        return json_codec
+
     @property
     def BROADCAST_TYPE(self) -> Literal["in-memory", "kafka"]:
         broadcast_type = cast(Any, self.__get_from_cache("BROADCAST_TYPE", "in-memory"))
@@ -116,6 +184,44 @@ class Env:
         urls = self.__get_from_cache("BROADCAST_URLS", "")
         return urls.split(",") if urls else []
 
+    @property
+    def BROADCAST_INLINE_MAX_BYTES(self) -> int:
+        return int(self.__get_from_cache("BROADCAST_INLINE_MAX_BYTES", str(64 * 1024)))  # 0 disables inline payloads
+
+    @property
+    def BROADCAST_COMPRESSION(self) -> Literal["none", "gzip"]:
+        compression = cast(Any, self.__get_from_cache("BROADCAST_COMPRESSION", "none"))
+        _available_compressions = {"none", "gzip"}
+        if compression not in _available_compressions:
+            raise ValueError(f"Invalid broadcast compression: {compression}. Must be one of {_available_compressions}")
+        return compression
+
+    @property
+    def BROADCAST_ASYNC(self) -> bool:
+        return self.__get_from_cache("BROADCAST_ASYNC", "false") == "true"
+
+    @property
+    def BROADCAST_BUFFER_SIZE(self) -> int:
+        return int(self.__get_from_cache("BROADCAST_BUFFER_SIZE", "10000"))
+
+    @property
+    def BROADCAST_BATCH_SIZE(self) -> int:
+        return int(self.__get_from_cache("BROADCAST_BATCH_SIZE", "100"))
+
+    @property
+    def BROADCAST_LINGER_MS(self) -> int:
+        return int(self.__get_from_cache("BROADCAST_LINGER_MS", "20"))
+
+    @property
+    def BROADCAST_BACKPRESSURE(self) -> Literal["block", "drop"]:
+        backpressure = cast(Any, self.__get_from_cache("BROADCAST_BACKPRESSURE", "block"))
+        _available_backpressures = {"block", "drop"}
+        if backpressure not in _available_backpressures:
+            raise ValueError(
+                f"Invalid broadcast backpressure: {backpressure}. Must be one of {_available_backpressures}"
+            )
+        return backpressure
+
     @property
     def CACHE_TYPE(self) -> Literal["in-memory", "redis"]:
         cache_type = cast(Any, self.__get_from_cache("CACHE_TYPE", "in-memory"))
@@ -128,6 +234,14 @@ class Env:
     def CACHE_URL(self) -> str:
         return self.__get_from_cache("CACHE_URL", "")
 
+    @property
+    def CACHE_LOCAL_TIER_SIZE(self) -> int:
+        return int(self.__get_from_cache("CACHE_LOCAL_TIER_SIZE", "0"))  # 0 disables the process-local tier
+
+    @property
+    def CACHE_LOCAL_TIER_TTL(self) -> int:
+        return int(self.__get_from_cache("CACHE_LOCAL_TIER_TTL", "30"))
+
     @property
     def COMMON_SECRET_KEY(self) -> str:
         return self.__get_from_cache("COMMON_SECRET_KEY", f"{self.PROJECT_NAME}_common_key")
@@ -148,6 +262,14 @@ class Env:
     def JWT_RT_EXPIRATION(self) -> int:
         return int(self.__get_from_cache("JWT_RT_EXPIRATION", 30))  # 30 days for default
 
+    @property
+    def JWT_RT_SECRET_KEY(self) -> str:
+        return self.__get_from_cache("JWT_RT_SECRET_KEY", "")
+
+    @property
+    def JWT_RT_ACCEPT_LEGACY(self) -> bool:
+        return self.__get_from_cache("JWT_RT_ACCEPT_LEGACY", "true") == "true"
+
     @property
     def REFRESH_TOKEN_NAME(self) -> str:
         return f"refresh_token_{self.PROJECT_SHORT_NAME}"
@@ -168,6 +290,10 @@ class Env:
     def S3_BUCKET_NAME(self) -> str:
         return self.__get_from_cache("S3_BUCKET_NAME", self.PROJECT_NAME)
 
+    @property
+    def S3_ENDPOINT_URL(self) -> str:
+        return self.__get_from_cache("S3_ENDPOINT_URL", "")
+
     @property
     def MAIL_FROM(self) -> str:
         return self.__get_from_cache("MAIL_FROM")
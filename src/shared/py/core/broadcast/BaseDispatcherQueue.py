@@ -1,10 +1,10 @@
 from abc import ABC, abstractmethod
-from json import loads as json_loads
 from pathlib import Path
 from typing import Any, cast
 from pydantic import BaseModel
 from ..caching import Cache
 from ..Env import Env
+from ..serialization import JsonCodec
 from ..types import SafeDateTime
 from ..utils.String import create_short_unique_id
 from .DispatcherModel import DispatcherModel
@@ -27,18 +27,21 @@ class BaseDispatcherQueue(ABC):
     def set_broadcast_dir(self, broadcast_dir: Path):
         self.__broadcast_dir = broadcast_dir
 
+    def _create_model(self, event: str | DispatcherModel, data: dict[str, Any] | None = None) -> DispatcherModel:
+        return DispatcherModel(event=event, data=data or {}) if isinstance(event, str) else event
+
     async def _record_model(
         self, event: str | DispatcherModel, data: dict[str, Any] | None = None, file_only: bool = False
     ) -> str:
         now_str = str(SafeDateTime.now().timestamp()).replace(".", "_")
         random_str = create_short_unique_id(10)
 
-        model = DispatcherModel(event=event, data=data or {}) if isinstance(event, str) else event
+        model = self._create_model(event, data)
 
         if Env.CACHE_TYPE == "redis":
             cache_key = f"broadcast-{now_str}-{random_str}"
-            # Prevent enums from being Enum.Name
-            await Cache.set(cache_key, json_loads(model.model_dump_json())["data"], 3 * 60)
+            # Prevent enums from being Enum.Name and IDs from being numbers
+            await Cache.set(cache_key, JsonCodec.loads(model.dump_json(data_only=True))["data"], 3 * 60)
             return cache_key
 
         name = f"{now_str}-{random_str}.json" if not file_only else f"{now_str}-{random_str}-fileonly.json"
@@ -48,8 +51,8 @@ class BaseDispatcherQueue(ABC):
 
         file_path = self.__broadcast_dir / name
 
-        with open(file_path, "w", encoding="utf-8") as file:
-            file.write(model.model_dump_json())
+        with open(file_path, "wb") as file:
+            file.write(model.dump_json())
             file.close()
 
         return name
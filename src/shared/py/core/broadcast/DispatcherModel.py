@@ -1,24 +1,15 @@
 from pydantic import BaseModel
-from ..types import SnowflakeID
-
-
-def _convert_id_for_js(v: dict):
-    for key, value in v.items():
-        if isinstance(value, SnowflakeID):
-            v[key] = str(value)
-        elif isinstance(value, dict):
-            v[key] = _convert_id_for_js(value)
-        else:
-            v[key] = value
-
-    return v
+from ..serialization import JsonCodec
 
 
 class DispatcherModel(BaseModel):
     event: str
     data: dict
 
-    class Config:
-        json_encoders = {
-            dict: _convert_id_for_js,
-        }
+    def dump_json(self, data_only: bool = False) -> bytes:
+        """Serializes the event for the socket server; IDs are written as strings, so JavaScript keeps every digit.
+
+        :param data_only: Whether to only serialize ``{"data": ...}``.
+        """
+        content = {"data": self.data} if data_only else {"event": self.event, "data": self.data}
+        return JsonCodec.dumps(content, ids_as_str=True)
@@ -1,25 +1,211 @@
-import json
+from asyncio import to_thread
+from atexit import register as register_atexit
+from os import getpid
+from queue import Empty, Full, Queue
+from threading import Lock, Thread
+from time import monotonic
 from typing import Any
 from kafka import KafkaProducer
 from ...Env import Env
+from ...logger import Logger
+from ...serialization import JsonCodec
 from ..BaseDispatcherQueue import BaseDispatcherQueue
 from ..DispatcherModel import DispatcherModel
 
 
+_logger = Logger.use("broadcast")
+
+
 class KafkaDispatcherQueue(BaseDispatcherQueue):
+    """Publishes events to Kafka.
+
+    Payloads up to ``BROADCAST_INLINE_MAX_BYTES`` are sent inside the message as ``{"data": ...}``. Larger payloads are
+    stored in the cache and only ``{"cache_key": ...}`` is sent.
+
+    By default every :meth:`put` waits for Kafka to acknowledge the event.
+
+    If ``BROADCAST_ASYNC`` is true, :meth:`put` only pushes the event into a bounded in-process buffer. A sender thread
+    drains the buffer and flushes the producer once per batch of ``BROADCAST_BATCH_SIZE`` events or every
+    ``BROADCAST_LINGER_MS``. Delivery failures are counted in :attr:`metrics` and logged instead of being raised.
+
+    The sender thread logs the counters every ``METRICS_LOG_INTERVAL`` seconds while it sends, at warning level if
+    events failed or were dropped since the last report, and once more when it stops.
+    """
+
+    BLOCK_TIMEOUT = 5
+    FLUSH_TIMEOUT = 30
+    METRICS_LOG_INTERVAL = 60
+
     def __init__(self):
+        super().__init__()
         self.producer = KafkaProducer(
-            bootstrap_servers=Env.BROADCAST_URLS, value_serializer=lambda v: json.dumps(v).encode("utf-8")
+            bootstrap_servers=Env.BROADCAST_URLS,
+            value_serializer=lambda v: v if isinstance(v, bytes) else JsonCodec.dumps(v),
+            compression_type=Env.BROADCAST_COMPRESSION if Env.BROADCAST_COMPRESSION != "none" else None,
         )
+        self.metrics = {"enqueued": 0, "sent": 0, "failed": 0, "dropped": 0}
+        self._metrics_lock = Lock()
+        self._reported_metrics = dict(self.metrics)
+        self._buffer: Queue[tuple[str, bytes | dict[str, Any]] | None] = Queue(maxsize=Env.BROADCAST_BUFFER_SIZE)
+        self._sender: Thread | None = None
+        self._sender_pid: int | None = None
 
     async def put(self, event: str | DispatcherModel, data: dict[str, Any] | None = None):
-        cache_key = await self._record_model(event, data)
-        self.producer.send(event if isinstance(event, str) else event.event, {"cache_key": cache_key})
-        self.producer.flush()
+        model = self._create_model(event, data)
+        topic = model.event
+        value: bytes | dict[str, Any] | None = self._serialize_inline(model)
+        if value is None:
+            value = {"cache_key": await self._record_model(model)}
+
+        if not Env.BROADCAST_ASYNC:
+            self.producer.send(topic, value)
+            self.producer.flush()
+            return
+
+        self._ensure_sender()
+        try:
+            self._buffer.put_nowait((topic, value))
+        except Full:
+            if Env.BROADCAST_BACKPRESSURE == "drop":
+                self._count("dropped")
+                _logger.warning(f"Broadcast buffer is full. Dropped event: {topic}")
+                return
+
+            try:
+                await to_thread(self._buffer.put, (topic, value), True, self.BLOCK_TIMEOUT)
+            except Full:
+                self._count("dropped")
+                _logger.warning(f"Broadcast buffer is still full after {self.BLOCK_TIMEOUT}s. Dropped event: {topic}")
+                return
+
+        self._count("enqueued")
+
+    def get_metrics(self) -> dict[str, int]:
+        """Returns a snapshot of the counters and the number of events waiting in the buffer."""
+        with self._metrics_lock:
+            metrics = dict(self.metrics)
+        metrics["buffered"] = self._buffer.qsize()
+        return metrics
 
     def start(self):
         self.is_closed = False
 
     def close(self):
         self.is_closed = True
+        self._stop_sender()
         self.producer.close()
+
+    def _serialize_inline(self, model: DispatcherModel) -> bytes | None:
+        if Env.BROADCAST_INLINE_MAX_BYTES <= 0:
+            return None
+
+        # Serializes straight to the wire format ({"data": ...}) in a single pass.
+        value = model.dump_json(data_only=True)
+        if len(value) > Env.BROADCAST_INLINE_MAX_BYTES:
+            return None
+        return value
+
+    def _ensure_sender(self) -> None:
+        if self._sender is not None and self._sender_pid == getpid() and self._sender.is_alive():
+            return
+
+        is_first_start = self._sender_pid != getpid()
+        self._sender_pid = getpid()
+        self._sender = Thread(target=self._send_loop, daemon=True)
+        self._sender.start()
+        if is_first_start:
+            register_atexit(self._stop_sender)
+
+    def _stop_sender(self) -> None:
+        sender = self._sender
+        if sender is None or self._sender_pid != getpid() or not sender.is_alive():
+            return
+
+        self._buffer.put(None)
+        sender.join(self.FLUSH_TIMEOUT)
+
+    def _send_loop(self) -> None:
+        linger = Env.BROADCAST_LINGER_MS / 1000
+        batch_size = Env.BROADCAST_BATCH_SIZE
+        next_report_at = monotonic() + self.METRICS_LOG_INTERVAL
+        while True:
+            item = self._buffer.get()
+            should_stop = item is None
+            batch = [item] if item is not None else []
+
+            deadline = monotonic() + linger
+            while not should_stop and len(batch) < batch_size:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._buffer.get(timeout=remaining)
+                except Empty:
+                    break
+                if item is None:
+                    should_stop = True
+                else:
+                    batch.append(item)
+
+            self._send_batch(batch)
+
+            if should_stop:
+                self._send_batch(self._drain())
+                self._report_metrics()
+                return
+
+            if monotonic() >= next_report_at:
+                self._report_metrics()
+                next_report_at = monotonic() + self.METRICS_LOG_INTERVAL
+
+    def _drain(self) -> list[tuple[str, bytes | dict[str, Any]]]:
+        batch = []
+        while True:
+            try:
+                item = self._buffer.get_nowait()
+            except Empty:
+                return batch
+            if item is not None:
+                batch.append(item)
+
+    def _send_batch(self, batch: list[tuple[str, bytes | dict[str, Any]]]) -> None:
+        if not batch:
+            return
+
+        for topic, value in batch:
+            try:
+                future = self.producer.send(topic, value)
+                future.add_callback(self._on_sent)
+                future.add_errback(self._on_failed, topic)
+            except Exception as e:
+                self._on_failed(topic, e)
+
+        try:
+            self.producer.flush(timeout=self.FLUSH_TIMEOUT)
+        except Exception as e:
+            _logger.error(f"Failed to flush broadcast batch: {e}")
+
+    def _on_sent(self, _: Any) -> None:
+        self._count("sent")
+
+    def _on_failed(self, topic: str, error: BaseException) -> None:
+        self._count("failed")
+        _logger.error(f"Failed to deliver broadcast event {topic}: {error}")
+
+    def _report_metrics(self) -> None:
+        metrics = self.get_metrics()
+        reported_metrics, self._reported_metrics = self._reported_metrics, metrics
+        # An idle queue is not reported again until something happens.
+        if not metrics["buffered"] and all(metrics[name] == reported_metrics[name] for name in self.metrics):
+            return
+
+        lost_count = sum(metrics[name] - reported_metrics[name] for name in ("failed", "dropped"))
+        message = ", ".join(f"{count} {name}" for name, count in metrics.items())
+        if lost_count:
+            _logger.warning(f"Broadcast metrics: {message} ({lost_count} events lost since the last report)")
+        else:
+            _logger.info(f"Broadcast metrics: {message}")
+
+    def _count(self, name: str) -> None:
+        with self._metrics_lock:
+            self.metrics[name] += 1
@@ -1,11 +1,9 @@
 from abc import ABC, abstractmethod
 from inspect import iscoroutinefunction
-from json import dumps as json_dumps
-from json import loads as json_loads
 from pathlib import Path
 from typing import Any, Callable
 from pydantic import BaseModel
-from ..utils.Converter import json_default
+from ..serialization import JsonCodec
 
 
 class BaseCache(ABC):
@@ -29,6 +27,21 @@ class BaseCache(ABC):
         :param cast: Function to cast value to
         """
 
+    async def get_with_ttl(
+        self, key: str, caster: Callable[[Any], Any] | None = None
+    ) -> tuple[Any | None, float | None]:
+        """Gets value from cache by key with its remaining time to live
+
+        Backends that can read the expiry with the value override this.
+
+        :param key: Key to get value from cache
+        :param cast: Function to cast value to (See :meth:`get`)
+
+        :return: Tuple of the value and its remaining time to live in seconds, or None if it does not expire or the
+                 backend cannot tell
+        """
+        return await self.get(key, caster), None
+
     @abstractmethod
     async def has(self, key: str) -> bool:
         """Checks if key exists in cache
@@ -62,8 +75,65 @@ class BaseCache(ABC):
     async def clear(self) -> None:
         """Deletes all values from cache"""
 
+    async def get_many(self, keys: list[str], caster: Callable[[Any], Any] | None = None) -> dict[str, Any | None]:
+        """Gets values from cache by keys
+
+        Backends that support batching override this to fetch every key at once.
+
+        :param keys: Keys to get values from cache
+        :param cast: Function to cast each value to (See :meth:`get`)
+
+        :return: Dictionary of key to value, missing keys are mapped to None
+        """
+        return {key: await self.get(key, caster) for key in keys}
+
+    async def set_many(self, values: dict[str, Any], ttl: int = 0) -> None:
+        """Sets values in cache by keys
+
+        Backends that support batching override this to write every key at once.
+
+        :param values: Dictionary of key to value to set in cache (See :meth:`set`)
+        :param ttl: Time to live in seconds
+        """
+        for key, value in values.items():
+            await self.set(key, value, ttl)
+
+    async def delete_many(self, keys: list[str]) -> None:
+        """Deletes values from cache by keys
+
+        Backends that support batching override this to delete every key at once.
+
+        :param keys: Keys to delete values from cache
+        """
+        for key in keys:
+            await self.delete(key)
+
+    async def publish_invalidation(self, keys: list[str] | None) -> None:
+        """Notifies other processes that keys have changed so they can drop their local copies
+
+        Backends without a cross-process channel leave this as a no-op.
+
+        :param keys: Changed keys, or None if every key has changed
+        """
+
+    def subscribe_invalidation(self, callback: Callable[[list[str] | None], None]) -> None:
+        """Registers a callback run with the keys published by other processes (See :meth:`publish_invalidation`)
+
+        The callback may be run from a background thread.
+
+        :param callback: Function to call with the changed keys, or None if every key has changed
+        """
+
+    async def close_loop_resources(self) -> None:
+        """Closes the connections bound to the running event loop
+
+        Must be awaited before a short-lived loop (e.g. ``asyncio.run`` in a broker task) finishes.
+
+        Backends without loop-bound connections leave this as a no-op.
+        """
+
     async def _cast_get(self, raw_value: Any, cast: Callable[[Any], Any] | None) -> Any | None:
-        value = json_loads(raw_value)
+        value = JsonCodec.loads(raw_value)
 
         if cast is None:
             return value
@@ -80,4 +150,4 @@ class BaseCache(ABC):
         if isinstance(value, BaseModel):
             return value.model_dump_json()
         else:
-            return json_dumps(value, default=json_default)
+            return JsonCodec.dumps_str(value)
@@ -1,9 +1,11 @@
+from os import getpid
 from pathlib import Path
 from typing import Any, Callable, TypeVar, overload
 from ..Env import Env
 from ..utils.decorators import class_instance, thread_safe_singleton
 from .BaseCache import BaseCache
 from .InMemoryCache import InMemoryCache
+from .LocalCache import LocalCache
 from .RedisCache import RedisCache
 
 
@@ -13,21 +15,54 @@ _TCastReturn = TypeVar("_TCastReturn")
 @class_instance()
 @thread_safe_singleton
 class Cache(BaseCache):
+    """Application cache.
+
+    If ``CACHE_LOCAL_TIER_SIZE`` is set, values fetched with a caster are also kept in a process-local tier
+    (:class:`LocalCache`) for ``CACHE_LOCAL_TIER_TTL`` seconds at most, and never beyond their expiry in the shared
+    tier. Every write through this class invalidates that tier in all processes.
+    """
+
     def __init__(self):
         if Env.CACHE_TYPE == "redis":
             self._cache: BaseCache = RedisCache()
         else:
             self._cache: BaseCache = InMemoryCache()
 
+        self._local: LocalCache | None = None
+        if Env.CACHE_LOCAL_TIER_SIZE > 0:
+            self._local = LocalCache(Env.CACHE_LOCAL_TIER_SIZE, Env.CACHE_LOCAL_TIER_TTL)
+        self._subscribed_pid: int | None = None
+        self._hits = 0
+        self._misses = 0
+
     def set_cache_dir(self, cache_dir: str | Path) -> None:
         self._cache.set_cache_dir(cache_dir)
+        self._subscribed_pid = None
 
     @overload
     async def get(self, key: str) -> Any | None: ...
     @overload
     async def get(self, key: str, caster: Callable[[Any], _TCastReturn]) -> _TCastReturn | None: ...
     async def get(self, key: str, caster: Callable[[Any], _TCastReturn] | None = None) -> Any | None:
-        return await self._cache.get(key, caster)
+        local = self._local if caster is not None else None
+        if local is not None and caster is not None:
+            self._subscribe_invalidation()
+            found, value = local.get(key, caster)
+            if found:
+                return value
+
+            value, ttl = await self._cache.get_with_ttl(key, caster)
+        else:
+            value, ttl = await self._cache.get(key, caster), None
+
+        if value is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        if local is not None and caster is not None:
+            local.set(key, caster, value, ttl)
+        return value
 
     async def has(self, key: str) -> bool:
         return await self._cache.has(key)
@@ -38,9 +73,59 @@ class Cache(BaseCache):
     async def set(self, key: str, value: Any, ttl: int) -> None: ...
     async def set(self, key: str, value: Any, ttl: int = 0) -> None:
         await self._cache.set(key, value, ttl)
+        await self._invalidate([key])
 
     async def delete(self, key: str) -> None:
         await self._cache.delete(key)
+        await self._invalidate([key])
 
     async def clear(self) -> None:
         await self._cache.clear()
+        await self._invalidate(None)
+
+    @overload
+    async def get_many(self, keys: list[str]) -> dict[str, Any | None]: ...
+    @overload
+    async def get_many(
+        self, keys: list[str], caster: Callable[[Any], _TCastReturn]
+    ) -> dict[str, _TCastReturn | None]: ...
+    async def get_many(
+        self, keys: list[str], caster: Callable[[Any], _TCastReturn] | None = None
+    ) -> dict[str, Any | None]:
+        return await self._cache.get_many(keys, caster)
+
+    async def set_many(self, values: dict[str, Any], ttl: int = 0) -> None:
+        await self._cache.set_many(values, ttl)
+        await self._invalidate(list(values.keys()))
+
+    async def delete_many(self, keys: list[str]) -> None:
+        await self._cache.delete_many(keys)
+        await self._invalidate(keys)
+
+    async def close_loop_resources(self) -> None:
+        await self._cache.close_loop_resources()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Returns the hit/miss counters of each tier.
+
+        ``l1`` is the process-local tier (omitted if disabled) and ``l2`` is the shared backend.
+        """
+        stats = {"l2": {"hits": self._hits, "misses": self._misses}}
+        if self._local is not None:
+            stats["l1"] = {"hits": self._local.hits, "misses": self._local.misses, "size": self._local.size}
+        return stats
+
+    async def _invalidate(self, keys: list[str] | None) -> None:
+        if self._local is None:
+            return
+
+        self._local.invalidate(keys)
+        await self._cache.publish_invalidation(keys)
+
+    def _subscribe_invalidation(self) -> None:
+        if self._subscribed_pid == getpid() or self._local is None:
+            return
+
+        self._subscribed_pid = getpid()
+        self._local.invalidate(None)
+        self._cache.subscribe_invalidation(self._local.invalidate)
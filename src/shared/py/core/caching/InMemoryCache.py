@@ -1,7 +1,13 @@
-from datetime import timedelta
+from collections import OrderedDict
+from json import dumps as json_dumps
+from json import loads as json_loads
+from os import getpid, register_at_fork
+from pathlib import Path
 from sqlite3 import Connection
+from threading import Event, Lock, Thread
+from time import time
 from typing import Any, Callable, TypeVar, overload
-from ..types import SafeDateTime
+from uuid import uuid4
 from .BaseCache import BaseCache
 
 
@@ -9,65 +15,213 @@ _TCastReturn = TypeVar("_TCastReturn")
 
 
 class InMemoryCache(BaseCache):
+    """SQLite-backed cache shared by every process using the same cache directory.
+
+    Each process keeps one long-lived WAL-mode connection and a bounded LRU of raw values in front of it.
+
+    Expired rows are never returned by reads and are physically removed by a background sweeper thread.
+
+    The LRU is dropped whenever another connection commits to the database (detected with ``PRAGMA data_version``),
+    so values written or deleted by other workers are never served stale.
+
+    Invalidations for :class:`LocalCache` are exchanged through a ``cache_invalidation`` table polled by a daemon thread.
+    """
+
+    LRU_MAX_SIZE = 1024
+    SWEEP_INTERVAL = 60
+    INVALIDATION_POLL_INTERVAL = 0.5
+    INVALIDATION_RETENTION = 60
+
+    def __init__(self):
+        super().__init__()
+        self._lock = Lock()
+        self._conn: Connection | None = None
+        self._conn_pid: int | None = None
+        self._data_version: int | None = None
+        self._lru: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        self._sweeper: Thread | None = None
+        self._sweeper_stop = Event()
+        self._sender_id = uuid4().hex
+        register_at_fork(after_in_child=self._reset_after_fork)
+
+    def set_cache_dir(self, cache_dir: str | Path) -> None:
+        with self._lock:
+            self._close()
+            super().set_cache_dir(cache_dir)
+
     @overload
     async def get(self, key: str) -> Any | None: ...
     @overload
     async def get(self, key: str, caster: Callable[[Any], _TCastReturn]) -> _TCastReturn | None: ...
     async def get(self, key: str, caster: Callable[[Any], _TCastReturn] | None = None) -> Any | None:
-        await self._expire()
-        with self._get_cache_db() as conn:
-            cursor = conn.execute(
-                "SELECT value, expiry FROM cache WHERE key = ? AND expiry > ?",
-                (key, int(SafeDateTime.now().timestamp())),
-            )
-            raw_value, ttl = cursor.fetchone() or (None, None)
-            if raw_value is None or ttl is None:
-                return None
+        raw_value = self._get_raw(key)
+        if raw_value is None:
+            return None
+
+        return await self._cast_get(raw_value, caster)
+
+    async def get_with_ttl(
+        self, key: str, caster: Callable[[Any], _TCastReturn] | None = None
+    ) -> tuple[Any | None, float | None]:
+        raw_value, expiry = self._get_raw_with_expiry(key)
+        if raw_value is None or expiry is None:
+            return None, None
 
-            value = await self._cast_get(raw_value, caster)
-        return value
+        return await self._cast_get(raw_value, caster), max(expiry - time(), 0)
 
     async def has(self, key: str) -> bool:
-        await self._expire()
-        result = False
-        with self._get_cache_db() as conn:
-            cursor = conn.execute(
-                "SELECT 1 FROM cache WHERE key = ? AND expiry > ?", (key, int(SafeDateTime.now().timestamp()))
-            )
-            result = cursor.fetchone() is not None
-        return result
+        return self._get_raw(key) is not None
 
     async def set(self, key: str, value: Any, ttl: int = 0) -> None:
-        await self._expire()
-        with self._get_cache_db() as conn:
-            casted_value = await self._cast_set(value)
-            expiry = int((SafeDateTime.now() + timedelta(seconds=ttl)).timestamp())
+        casted_value = await self._cast_set(value)
+        expiry = int(time()) + ttl
+        with self._lock:
+            conn = self._get_cache_db()
             conn.execute("REPLACE INTO cache (key, value, expiry) VALUES (?, ?, ?)", (key, casted_value, expiry))
             conn.commit()
+            self._remember(key, casted_value, expiry)
 
     async def delete(self, key: str) -> None:
-        await self._expire()
-        with self._get_cache_db() as conn:
+        with self._lock:
+            conn = self._get_cache_db()
             conn.execute("DELETE FROM cache WHERE key = ?", (key,))
             conn.commit()
+            self._lru.pop(key, None)
 
     async def clear(self) -> None:
-        with self._get_cache_db() as conn:
+        with self._lock:
+            conn = self._get_cache_db()
             conn.execute("DELETE FROM cache")
             conn.commit()
+            self._lru.clear()
+
+    async def get_many(
+        self, keys: list[str], caster: Callable[[Any], _TCastReturn] | None = None
+    ) -> dict[str, Any | None]:
+        values = {}
+        for key in keys:
+            raw_value = self._get_raw(key)
+            values[key] = None if raw_value is None else await self._cast_get(raw_value, caster)
+        return values
+
+    async def set_many(self, values: dict[str, Any], ttl: int = 0) -> None:
+        expiry = int(time()) + ttl
+        rows = [(key, await self._cast_set(value), expiry) for key, value in values.items()]
+        with self._lock:
+            conn = self._get_cache_db()
+            conn.executemany("REPLACE INTO cache (key, value, expiry) VALUES (?, ?, ?)", rows)
+            conn.commit()
+            for key, casted_value, _ in rows:
+                self._remember(key, casted_value, expiry)
+
+    async def delete_many(self, keys: list[str]) -> None:
+        with self._lock:
+            conn = self._get_cache_db()
+            conn.executemany("DELETE FROM cache WHERE key = ?", [(key,) for key in keys])
+            conn.commit()
+            for key in keys:
+                self._lru.pop(key, None)
+
+    async def publish_invalidation(self, keys: list[str] | None) -> None:
+        with self._lock:
+            conn = self._get_cache_db()
+            conn.execute(
+                "INSERT INTO cache_invalidation (sender, keys, created_at) VALUES (?, ?, ?)",
+                (self._sender_id, json_dumps(keys), int(time())),
+            )
+            conn.commit()
+
+    def subscribe_invalidation(self, callback: Callable[[list[str] | None], None]) -> None:
+        with self._lock:
+            conn = self._get_cache_db()
+            last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM cache_invalidation").fetchone()[0]
+            stop = self._sweeper_stop
 
-    async def _expire(self) -> None:
-        with self._get_cache_db() as conn:
-            conn.execute("DELETE FROM cache WHERE expiry <= ?", (int(SafeDateTime.now().timestamp()),))
+        Thread(target=self._poll_invalidations, args=(stop, last_id, callback), daemon=True).start()
+
+    def _poll_invalidations(self, stop: Event, last_id: int, callback: Callable[[list[str] | None], None]) -> None:
+        while not stop.wait(self.INVALIDATION_POLL_INTERVAL):
+            try:
+                with self._lock:
+                    conn = self._get_cache_db()
+                    rows = conn.execute(
+                        "SELECT id, sender, keys FROM cache_invalidation WHERE id > ? ORDER BY id", (last_id,)
+                    ).fetchall()
+            except Exception:
+                continue
+
+            for row_id, sender, keys in rows:
+                last_id = row_id
+                if sender != self._sender_id:
+                    callback(json_loads(keys))
+
+    def _get_raw(self, key: str) -> str | None:
+        return self._get_raw_with_expiry(key)[0]
+
+    def _get_raw_with_expiry(self, key: str) -> tuple[str | None, int | None]:
+        now = int(time())
+        with self._lock:
+            conn = self._get_cache_db()
+            self._sync_lru(conn)
+
+            cached = self._lru.get(key)
+            if cached is not None:
+                raw_value, expiry = cached
+                if expiry > now:
+                    self._lru.move_to_end(key)
+                    return raw_value, expiry
+                self._lru.pop(key, None)
+                return None, None
+
+            cursor = conn.execute("SELECT value, expiry FROM cache WHERE key = ? AND expiry > ?", (key, now))
+            raw_value, expiry = cursor.fetchone() or (None, None)
+            if raw_value is None or expiry is None:
+                return None, None
+
+            self._remember(key, raw_value, expiry)
+            return raw_value, expiry
+
+    def _remember(self, key: str, raw_value: str, expiry: int) -> None:
+        self._lru[key] = (raw_value, expiry)
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.LRU_MAX_SIZE:
+            self._lru.popitem(last=False)
+
+    def _sync_lru(self, conn: Connection) -> None:
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self._data_version:
+            self._lru.clear()
+            self._data_version = data_version
+
+    def _expire(self) -> None:
+        with self._lock:
+            conn = self._get_cache_db()
+            conn.execute("DELETE FROM cache WHERE expiry <= ?", (int(time()),))
+            conn.execute(
+                "DELETE FROM cache_invalidation WHERE created_at <= ?", (int(time()) - self.INVALIDATION_RETENTION,)
+            )
             conn.commit()
 
+    def _sweep(self, stop: Event) -> None:
+        while not stop.wait(self.SWEEP_INTERVAL):
+            try:
+                self._expire()
+            except Exception:
+                pass
+
     def _get_cache_db(self) -> Connection:
+        """Returns the connection of the current process. Must be called while holding ``self._lock``."""
+        if self._conn is not None and self._conn_pid == getpid():
+            return self._conn
+
         if self._cache_dir is None:
             raise ValueError("Cache directory is not set")
 
         self._cache_dir.mkdir(parents=True, exist_ok=True)
         db_path = self._cache_dir / "cache.db"
-        conn = Connection(db_path)
+        conn = Connection(db_path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
         conn.execute("""
             CREATE TABLE IF NOT EXISTS cache (
                 key TEXT PRIMARY KEY,
@@ -75,4 +229,46 @@ class InMemoryCache(BaseCache):
                 expiry INTEGER NOT NULL
             )
         """)
+        conn.execute("CREATE INDEX IF NOT EXISTS cache_expiry_index ON cache (expiry)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache_invalidation (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                sender TEXT NOT NULL,
+                keys TEXT NOT NULL,
+                created_at INTEGER NOT NULL
+            )
+        """)
+        conn.commit()
+
+        # A connection inherited through fork must not be reused, so everything is rebuilt for the new process.
+        self._conn = conn
+        self._conn_pid = getpid()
+        self._data_version = None
+        self._lru.clear()
+
+        self._sweeper_stop = Event()
+        self._sweeper = Thread(target=self._sweep, args=(self._sweeper_stop,), daemon=True)
+        self._sweeper.start()
+
         return conn
+
+    def _reset_after_fork(self) -> None:
+        # The parent's lock may have been held by its sweeper thread, which does not exist in the child.
+        self._lock = Lock()
+        self._sender_id = uuid4().hex
+        self._conn = None
+        self._conn_pid = None
+        self._data_version = None
+        self._lru.clear()
+
+    def _close(self) -> None:
+        self._sweeper_stop.set()
+        if self._conn is not None and self._conn_pid == getpid():
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+        self._conn = None
+        self._conn_pid = None
+        self._data_version = None
+        self._lru.clear()
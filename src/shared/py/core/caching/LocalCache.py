@@ -0,0 +1,62 @@
+from collections import OrderedDict
+from copy import deepcopy
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable
+
+
+class LocalCache:
+    """Bounded, TTL-aware process-local cache used as the first tier of :class:`Cache`.
+
+    Values are copied when they are stored and when they are returned, so a caller mutating its value (e.g. a
+    validated model) never leaks the change to the other callers in the process. Changes meant to be shared must be
+    written back through :class:`Cache` (which invalidates this tier), as :meth:`Auth.reset_user` does.
+    """
+
+    def __init__(self, max_size: int, ttl: int):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._lock = Lock()
+        self._entries: OrderedDict[str, tuple[Callable[[Any], Any], Any, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, caster: Callable[[Any], Any]) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != caster or entry[2] <= monotonic():
+                if entry is not None:
+                    self._entries.pop(key, None)
+                self.misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        return True, deepcopy(value)
+
+    def set(self, key: str, caster: Callable[[Any], Any], value: Any, ttl: float | None = None) -> None:
+        """Stores a value for the TTL of this cache, or for `ttl` seconds if it is shorter.
+
+        :param ttl: The remaining time to live of the value in the shared tier, or None if it does not expire
+        """
+        ttl = self._ttl if ttl is None else min(self._ttl, ttl)
+        with self._lock:
+            self._entries[key] = (caster, deepcopy(value), monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, keys: list[str] | None) -> None:
+        """Drops the given keys from the cache. If keys is None, drops everything."""
+        with self._lock:
+            if keys is None:
+                self._entries.clear()
+                return
+
+            for key in keys:
+                self._entries.pop(key, None)
@@ -1,6 +1,11 @@
-from inspect import iscoroutinefunction
+from asyncio import AbstractEventLoop, get_running_loop
+from json import dumps as json_dumps
+from json import loads as json_loads
 from typing import Any, Callable, TypeVar, overload
-from redis import Redis
+from uuid import uuid4
+from weakref import WeakKeyDictionary
+from redis import Redis as SyncRedis
+from redis.asyncio import ConnectionPool, Redis
 from ..Env import Env
 from .BaseCache import BaseCache
 
@@ -9,39 +14,123 @@ _TCastReturn = TypeVar("_TCastReturn")
 
 
 class RedisCache(BaseCache):
+    """Redis cache on top of :mod:`redis.asyncio`.
+
+    asyncio connections are bound to the event loop that opened them, so one connection pool is kept per running loop.
+
+    The API server only has one loop per worker, so every request in a worker shares the same pool. Short-lived loops
+    must await :meth:`close_loop_resources` before finishing to close theirs.
+    """
+
     def __init__(self):
         super().__init__()
-        self._cache = Redis.from_url(Env.CACHE_URL, decode_responses=True)
+        self._clients: WeakKeyDictionary[AbstractEventLoop, Redis] = WeakKeyDictionary()
+        self._invalidation_channel = f"{Env.PROJECT_NAME}:cache-invalidation"
+        self._sender_id = uuid4().hex
 
     @overload
     async def get(self, key: str) -> Any | None: ...
     @overload
     async def get(self, key: str, caster: Callable[[Any], _TCastReturn]) -> _TCastReturn | None: ...
     async def get(self, key: str, caster: Callable[[Any], _TCastReturn] | None = None) -> Any | None:
-        raw_value = await self.__run_redis_method("get", key)
+        raw_value = await self._get_client().get(key)
         if raw_value is None:
             return None
 
         value = await self._cast_get(raw_value, caster)
         return value
 
+    async def get_with_ttl(
+        self, key: str, caster: Callable[[Any], _TCastReturn] | None = None
+    ) -> tuple[Any | None, float | None]:
+        async with self._get_client().pipeline(transaction=False) as pipeline:
+            pipeline.get(key)
+            pipeline.pttl(key)
+            raw_value, ttl_ms = await pipeline.execute()
+        if raw_value is None:
+            return None, None
+
+        # PTTL is -1 for keys without expiry.
+        ttl = ttl_ms / 1000 if ttl_ms >= 0 else None
+        return await self._cast_get(raw_value, caster), ttl
+
     async def has(self, key: str) -> bool:
-        return await self.__run_redis_method("exists", key)
+        return bool(await self._get_client().exists(key))
 
     async def set(self, key: str, value: Any, ttl: int = 0) -> None:
         casted_value = await self._cast_set(value)
-        await self.__run_redis_method("set", key, casted_value, ex=ttl if ttl > 0 else None)
+        await self._get_client().set(key, casted_value, ex=ttl if ttl > 0 else None)
 
     async def delete(self, key: str) -> None:
-        if await self.__run_redis_method("exists", key):
-            await self.__run_redis_method("delete", key)
+        await self._get_client().delete(key)
 
     async def clear(self) -> None:
-        await self.__run_redis_method("flushdb")
-
-    async def __run_redis_method(self, command: str, *args: Any, **kwargs) -> Any:
-        method = getattr(self._cache, command)
-        if iscoroutinefunction(method):
-            return await method(*args, **kwargs)
-        else:
-            return method(*args, **kwargs)
+        await self._get_client().flushdb()
+
+    async def get_many(
+        self, keys: list[str], caster: Callable[[Any], _TCastReturn] | None = None
+    ) -> dict[str, Any | None]:
+        if not keys:
+            return {}
+
+        raw_values = await self._get_client().mget(keys)
+        values = {}
+        for key, raw_value in zip(keys, raw_values):
+            values[key] = None if raw_value is None else await self._cast_get(raw_value, caster)
+        return values
+
+    async def set_many(self, values: dict[str, Any], ttl: int = 0) -> None:
+        if not values:
+            return
+
+        async with self._get_client().pipeline(transaction=False) as pipeline:
+            for key, value in values.items():
+                pipeline.set(key, await self._cast_set(value), ex=ttl if ttl > 0 else None)
+            await pipeline.execute()
+
+    async def delete_many(self, keys: list[str]) -> None:
+        if not keys:
+            return
+
+        await self._get_client().delete(*keys)
+
+    async def publish_invalidation(self, keys: list[str] | None) -> None:
+        message = json_dumps({"sender": self._sender_id, "keys": keys})
+        await self._get_client().publish(self._invalidation_channel, message)
+
+    def subscribe_invalidation(self, callback: Callable[[list[str] | None], None]) -> None:
+        # Listens on a plain client in a daemon thread so it does not depend on any event loop being alive.
+        self._sender_id = uuid4().hex
+
+        def handle_message(message: dict[str, Any]) -> None:
+            try:
+                data = json_loads(message["data"])
+            except Exception:
+                return
+            if data.get("sender") == self._sender_id:
+                return
+            callback(data.get("keys"))
+
+        pubsub = SyncRedis.from_url(Env.CACHE_URL, decode_responses=True).pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{self._invalidation_channel: handle_message})
+        pubsub.run_in_thread(sleep_time=1, daemon=True)
+
+    async def close_loop_resources(self) -> None:
+        try:
+            client = self._clients.pop(get_running_loop(), None)
+        except RuntimeError:
+            return
+        if client is None:
+            return
+
+        await client.aclose()
+        await client.connection_pool.aclose()
+
+    def _get_client(self) -> Redis:
+        loop = get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            pool = ConnectionPool.from_url(Env.CACHE_URL, decode_responses=True)
+            client = Redis(connection_pool=pool)
+            self._clients[loop] = client
+        return client
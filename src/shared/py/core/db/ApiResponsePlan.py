@@ -0,0 +1,96 @@
+from typing import Any, Callable, Iterable, TypeAlias
+
+
+TApiResponseField: TypeAlias = str | tuple[str | tuple[str, ...], Callable[..., Any]]
+
+
+class ApiResponsePlan:
+    """Serializer of the api response of a model, compiled once from a plan of its fields.
+
+    Each field of the plan is either the name of an attribute, or the name (or a tuple of names) of the attributes
+    and a function converting their values.
+
+    E.g.::
+
+        ApiResponsePlan(
+            {
+                "uid": ("id", SnowflakeID.to_short_code),
+                "title": "title",
+                "filterable_map": (("project_id", "card_id"), create_filterable_map),
+            }
+        )
+
+    The plan is compiled into a function building the whole dict in one expression from the row's ``__dict__``, so
+    the values are read without going through SQLAlchemy's instrumented attributes. Rows with an attribute that is not
+    loaded (expired or deferred) are serialized with normal attribute access instead.
+
+    :param fields: The keys of the api response and the attributes (and converters) of their values, in order.
+    """
+
+    def __init__(self, fields: dict[str, TApiResponseField]):
+        self._fields = dict(fields)
+        self._serialize_loaded, self._serialize_attributes = self.__compile()
+
+    def extend(self, fields: dict[str, TApiResponseField]) -> "ApiResponsePlan":
+        """Creates a plan with the fields of this plan followed by the given fields.
+
+        :param fields: The fields to add (or replace).
+        """
+        return ApiResponsePlan({**self._fields, **fields})
+
+    def serialize(self, row: Any) -> dict[str, Any]:
+        """Serializes a row.
+
+        :param row: The row to serialize.
+        """
+        try:
+            return self._serialize_loaded(row.__dict__)
+        except KeyError:
+            return self._serialize_attributes(row)
+
+    def serialize_many(self, rows: Iterable[Any]) -> list[dict[str, Any]]:
+        """Serializes rows in a batch.
+
+        :param rows: The rows to serialize.
+        """
+        serialize_loaded = self._serialize_loaded
+        serialized = []
+        for row in rows:
+            try:
+                serialized.append(serialize_loaded(row.__dict__))
+            except KeyError:
+                serialized.append(self._serialize_attributes(row))
+        return serialized
+
+    def __compile(self) -> tuple[Callable[[dict[str, Any]], dict[str, Any]], Callable[[Any], dict[str, Any]]]:
+        namespace: dict[str, Any] = {}
+        loaded_items = []
+        attribute_items = []
+        for i, (key, field) in enumerate(self._fields.items()):
+            if isinstance(field, str):
+                names, converter = field, None
+            else:
+                names, converter = field
+            if isinstance(names, str):
+                names = (names,)
+
+            for name in names:
+                if not name.isidentifier():
+                    raise ValueError(f"Invalid attribute name of the api response field {key}: {name}")
+
+            loaded_value = ", ".join(f"values[{name!r}]" for name in names)
+            attribute_value = ", ".join(f"row.{name}" for name in names)
+            if converter is not None:
+                namespace[f"_convert_{i}"] = converter
+                loaded_value = f"_convert_{i}({loaded_value})"
+                attribute_value = f"_convert_{i}({attribute_value})"
+
+            loaded_items.append(f"{key!r}: {loaded_value}")
+            attribute_items.append(f"{key!r}: {attribute_value}")
+
+        source = (
+            f"def serialize_loaded(values):\n    return {{{', '.join(loaded_items)}}}\n"
+            f"def serialize_attributes(row):\n    return {{{', '.join(attribute_items)}}}\n"
+        )
+        exec(compile(source, "<api response plan>", "exec"), namespace)
+        return namespace["serialize_loaded"], namespace["serialize_attributes"]
@@ -0,0 +1,281 @@
+from asyncio import sleep
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterable, Mapping, Optional, TypeVar, Union, cast, overload
+from sqlalchemy import CompoundSelect, CursorResult, Delete, Insert, IteratorResult, Update
+from sqlalchemy import Sequence as SqlSequence
+from sqlalchemy.engine.result import ScalarResult, TupleResult
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.util import EMPTY_DICT
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.base import Executable
+from sqlmodel.sql.expression import Select, SelectOfScalar
+from ..logger import Logger
+from ..types import SafeDateTime, SnowflakeID
+from .DbEngine import DbEngine
+from .DbRequestScope import DbRequestScope
+from .DbSession import Result, _is_max_client_conn_error, _prepare_statement
+from .Models import BaseSqlModel, SoftDeleteModel
+
+
+_TSelectParam = TypeVar("_TSelectParam", bound=Any)
+
+
+_logger = Logger.use("db")
+
+
+class AsyncDbSession:
+    """Manages the database sessions on the asyncio driver.
+
+    It has the same interface and semantics as :class:`DbSession` (soft deletes, readonly sessions, detached results),
+    but every database round trip is awaited instead of blocking the event loop.
+    """
+
+    def __init__(self, session: AsyncSession, readonly: bool):
+        self.__session = session
+        self.__readonly = readonly
+
+    @staticmethod
+    @asynccontextmanager
+    async def use(readonly: bool, reuse: bool = True) -> AsyncIterator["AsyncDbSession"]:
+        """Opens a database session.
+
+        See :meth:`DbSession.use`.
+
+        :param readonly: If `True`, the session runs on the readonly database and cannot write.
+        :param reuse: If `False`, a readonly session always gets its own connection and transaction.
+        """
+        scope = DbRequestScope.current()
+        if scope and readonly and reuse:
+            async with scope.use_async_connection() as connection:
+                if connection is not None:
+                    async with AsyncDbSession.__use_shared(connection) as db:
+                        yield db
+                    return
+
+        MAX_TRIALS = 10
+        engine = DbEngine.get_async_engine(readonly)
+        session = None
+        for trial in range(MAX_TRIALS):
+            session = AsyncSession(engine, expire_on_commit=False)
+            try:
+                # Connects before handing the session out, so only connection errors are retried.
+                await session.connection()
+                break
+            except Exception as e:
+                await session.close()
+                if _is_max_client_conn_error(e) and trial < MAX_TRIALS - 1:
+                    _logger.warning(f"Database connection error: {e}. Retrying...")
+                    await sleep(1)
+                    continue
+                _logger.exception(e)
+                raise e
+
+        session = cast(AsyncSession, session)
+        DbRequestScope.record_connection()
+        db = AsyncDbSession(session, readonly=readonly)
+        try:
+            yield db
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            _logger.exception(e)
+            raise e
+        finally:
+            db.close()
+            await session.close()
+
+    @staticmethod
+    @asynccontextmanager
+    async def __use_shared(connection: AsyncConnection) -> AsyncIterator["AsyncDbSession"]:
+        session = AsyncSession(connection, expire_on_commit=False)
+        db = AsyncDbSession(session, readonly=True)
+        try:
+            async with session.begin():
+                yield db
+        except Exception as e:
+            _logger.exception(e)
+            raise e
+        finally:
+            db.close()
+            await session.close()
+
+    def close(self):
+        self.__session = cast(AsyncSession, None)
+        self.__readonly = True
+
+    async def insert(self, obj: BaseSqlModel):
+        """Inserts a new object into the database if it is new.
+
+        :param obj: The object to be inserted; must be a subclass of :class:`BaseSqlModel`.
+        """
+        if self.__readonly:
+            raise Exception("Cannot insert into a readonly database")
+
+        if not obj.is_new():
+            return
+
+        obj.id = SnowflakeID()
+        obj.updated_at = obj.created_at
+        obj = obj.model_validate(obj.model_dump())
+        try:
+            self.__session.add(obj)
+        except Exception:
+            pass
+
+    async def insert_all(self, objs: Iterable[BaseSqlModel]):
+        """Inserts new objects into the database if they are new.
+
+        :param objs: The objects to be inserted; must be a subclass of :class:`BaseSqlModel`.
+        """
+        if self.__readonly:
+            raise Exception("Cannot insert into a readonly database")
+
+        for obj in objs:
+            await self.insert(obj)
+
+    async def update(self, obj: BaseSqlModel):
+        """Updates an object in the database if it is not new.
+
+        :param obj: The object to be updated; must be a subclass of :class:`BaseSqlModel`.
+        """
+        if self.__readonly:
+            raise Exception("Cannot update in a readonly database")
+
+        if obj.is_new() or not obj.has_changes():
+            return
+
+        obj.clear_changes()
+        obj = obj.model_validate(obj.model_dump())
+        try:
+            obj = await self.__session.merge(obj)
+        except Exception:
+            self.__session.add(obj)
+
+    @overload
+    async def delete(self, obj: BaseSqlModel): ...
+    @overload
+    async def delete(self, obj: SoftDeleteModel, purge: bool = False): ...
+    async def delete(self, obj: BaseSqlModel, purge: bool = False):
+        """Deletes an object from the database if it is not new.
+
+        If the object is a subclass of :class:`SoftDeleteModel`, it will be soft-deleted by default.
+
+        :param obj: The object to be deleted; must be a subclass of :class:`BaseSqlModel`.
+        :param purge: If `True`, the object will be hard-deleted for subclasses of :class:`SoftDeleteModel`.
+        """
+        if self.__readonly:
+            raise Exception("Cannot delete from a readonly database")
+
+        if obj.is_new():
+            return
+
+        obj.clear_changes()
+        obj = obj.model_validate(obj.model_dump())
+
+        try:
+            obj = await self.__session.merge(obj)
+        except Exception:
+            pass
+
+        try:
+            if purge or not isinstance(obj, SoftDeleteModel):
+                await self.__session.delete(obj)
+                return
+            if obj.deleted_at is not None:
+                return
+            obj.deleted_at = SafeDateTime.now()
+            self.__session.add(obj)
+        except Exception:
+            pass
+
+    @overload
+    async def exec(
+        self,
+        statement: SelectOfScalar[_TSelectParam],
+        *,
+        params: Optional[Union[Mapping[str, Any], SqlSequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = EMPTY_DICT,
+        bind_arguments: Optional[Dict[str, Any]] = None,
+    ) -> Result[_TSelectParam]: ...
+    @overload
+    async def exec(
+        self,
+        statement: Select[_TSelectParam],
+        *,
+        params: Optional[Union[Mapping[str, Any], SqlSequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = EMPTY_DICT,
+        bind_arguments: Optional[Dict[str, Any]] = None,
+    ) -> Result[_TSelectParam]: ...
+    @overload
+    async def exec(
+        self,
+        statement: CompoundSelect[_TSelectParam],
+        *,
+        params: Optional[Union[Mapping[str, Any], SqlSequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = EMPTY_DICT,
+        bind_arguments: Optional[Dict[str, Any]] = None,
+    ) -> Result[_TSelectParam]: ...
+    @overload
+    async def exec(
+        self,
+        statement: Insert | Insert[_TSelectParam] | Update | Update[_TSelectParam],
+        *,
+        params: Optional[Union[Mapping[str, Any], SqlSequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = EMPTY_DICT,
+        bind_arguments: Optional[Dict[str, Any]] = None,
+    ) -> int: ...
+    @overload
+    async def exec(
+        self,
+        statement: Delete | Delete[_TSelectParam],
+        *,
+        params: Optional[Union[Mapping[str, Any], SqlSequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = EMPTY_DICT,
+        bind_arguments: Optional[Dict[str, Any]] = None,
+        purge: bool = False,
+    ) -> int: ...
+    async def exec(  # type: ignore
+        self,
+        statement: Union[
+            Select[_TSelectParam],
+            SelectOfScalar[_TSelectParam],
+            Executable[_TSelectParam],
+        ],
+        *,
+        params: Optional[Union[Mapping[str, Any], SqlSequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = EMPTY_DICT,
+        bind_arguments: Optional[Dict[str, Any]] = None,
+        purge: bool = False,
+    ) -> Union[Result[_TSelectParam], Result[_TSelectParam]] | int:
+        """Executes a statement on the database.
+
+        See :meth:`DbSession.exec`.
+
+        :param statement: The statement to be executed.
+        :param params: The parameters to be passed to the statement.
+        :param purge: If `True`, the statement will be executed as a :class:`Delete`; Only applicable to :param:`statement` of type :class:`Delete`.
+        :param execution_options: The execution options to be passed to the statement.
+        :param bind_arguments: The bind arguments to be passed to the statement.
+        """
+        statement, should_return_count = _prepare_statement(statement, purge)
+
+        if self.__readonly and should_return_count:
+            raise Exception("Cannot execute non-select statements in a readonly database")
+
+        result = await self.__session.exec(
+            statement,
+            params=params,
+            execution_options=execution_options,
+            bind_arguments=bind_arguments,
+        )
+        DbRequestScope.record_query()
+
+        if should_return_count:
+            return result.rowcount  # type: ignore
+
+        if isinstance(result, (ScalarResult, TupleResult, IteratorResult, CursorResult)):
+            raw_records = result.all()
+            return Result(raw_records)
+
+        _logger.warning(f"Unexpected result type: {type(result)}")
+        return result
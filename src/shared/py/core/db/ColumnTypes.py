@@ -1,14 +1,12 @@
 from enum import Enum
-from json import dumps as json_dumps
-from json import loads as json_loads
 from typing import Any, Callable, TypeVar, cast
 from pydantic import BaseModel, SecretStr
 from pydantic_core import PydanticUndefined as Undefined
 from sqlalchemy import JSON, DateTime, func
 from sqlalchemy.types import TEXT, VARCHAR, BigInteger, TypeDecorator
 from sqlmodel import Field, SQLModel
+from ..serialization import JsonCodec
 from ..types import SafeDateTime, SnowflakeID
-from ..utils.Converter import json_default
 
 
 TModelColumn = TypeVar("TModelColumn", bound=BaseModel)
@@ -96,7 +94,7 @@ def ModelColumnListType(model_type: type[TModelColumn]):
         def process_bind_param(self, value: list[TModelColumn] | None, dialect) -> str | None:
             if value is None:
                 return None
-            return json_dumps([item.model_dump() for item in value], default=json_default)
+            return JsonCodec.dumps_str([item.model_dump() for item in value])
 
         def process_result_value(
             self, value: str | list[TModelColumn] | list[dict] | None, dialect
@@ -107,7 +105,7 @@ def ModelColumnListType(model_type: type[TModelColumn]):
             if isinstance(value, list):
                 return [model_type(**item) if isinstance(item, dict) else item for item in value]
             elif isinstance(value, str):
-                loaded_value = json_loads(value)
+                loaded_value = JsonCodec.loads(value)
                 if isinstance(loaded_value, list):
                     return [model_type(**item) if isinstance(item, dict) else item for item in loaded_value]
                 else:
@@ -1,13 +1,24 @@
-from typing import Any, Literal
-from sqlalchemy import NullPool, StaticPool
+from typing import Any, Literal, TypeAlias
+from sqlalchemy import NullPool, StaticPool, make_url
 from ..Env import Env
 from ..utils.decorators import staticclass
+from .DbPool import MonitoredAsyncQueuePool, MonitoredQueuePool
+
+
+TDbProcessRole: TypeAlias = Literal["api", "broker"]
 
 
 @staticclass
 class DbConfigHelper:
     @staticmethod
-    def create_config(url: str) -> dict[str, Any]:
+    def create_config(url: str, is_async: bool = False, role: TDbProcessRole = "api") -> dict[str, Any]:
+        """Creates the engine options of the database url.
+
+        :param url: The sanitized database url.
+        :param is_async: Whether the engine is an asyncio engine.
+        :param role: The role of the process, which sizes the connection pool (``DB_POOL_*`` for the API server,
+                     ``DB_BROKER_POOL_*`` for the broker).
+        """
         driver_type = DbConfigHelper.get_driver_type(url)
         if driver_type == "sqlite":
             return {
@@ -20,30 +31,62 @@ class DbConfigHelper:
             }
 
         if driver_type == "postgresql":
+            connect_args: dict[str, Any] = {
+                "application_name": Env.PROJECT_NAME,
+                "connect_timeout": Env.DB_TIMEOUT,
+                "tcp_user_timeout": Env.DB_TCP_USER_TIMEOUT,
+            }
+            if DbConfigHelper.is_behind_pgbouncer(url):
+                # PgBouncer in transaction mode may hand each transaction a different server connection,
+                # so server-side prepared statements must not be used.
+                connect_args["prepare_threshold"] = None
+
+            if Env.DB_POOL_MODE == "null":
+                return {
+                    "connect_args": connect_args,
+                    "poolclass": NullPool,
+                    "pool_pre_ping": True,
+                }
+
             return {
-                "connect_args": {
-                    "conninfo": f"application_name={Env.PROJECT_NAME}&timeout={Env.DB_TIMEOUT}&statement_cache_size=0&tcp_user_timeout={Env.DB_TCP_USER_TIMEOUT}",
-                },
-                "poolclass": NullPool,
+                "connect_args": connect_args,
+                "poolclass": MonitoredAsyncQueuePool if is_async else MonitoredQueuePool,
+                "pool_size": Env.DB_BROKER_POOL_SIZE if role == "broker" else Env.DB_POOL_SIZE,
+                "max_overflow": Env.DB_BROKER_POOL_MAX_OVERFLOW if role == "broker" else Env.DB_POOL_MAX_OVERFLOW,
+                "pool_timeout": Env.DB_POOL_TIMEOUT,
+                "pool_recycle": Env.DB_POOL_RECYCLE,
                 "pool_pre_ping": True,
             }
 
         return {}
 
     @staticmethod
-    def get_sanitized_driver(url: str) -> str:
+    def is_behind_pgbouncer(url: str) -> bool:
+        if Env.DB_PGBOUNCER != "auto":
+            return Env.DB_PGBOUNCER == "true"
+
+        try:
+            parsed_url = make_url(url)
+        except Exception:
+            return False
+
+        return parsed_url.port == 6432 or "bouncer" in (parsed_url.host or "")
+
+    @staticmethod
+    def get_sanitized_driver(url: str, is_async: bool = False) -> str:
         splitted = url.split("://", maxsplit=1)
         driver_type = DbConfigHelper.get_driver_type(url)
         if driver_type == "sqlite":
-            return f"sqlite://{splitted[1]}"
+            return f"sqlite+aiosqlite://{splitted[1]}" if is_async else f"sqlite://{splitted[1]}"
         if driver_type == "postgresql":
+            # psycopg 3 provides both the sync and the asyncio dialect under the same name.
             return f"postgresql+psycopg://{splitted[1]}"
         return url
 
     @staticmethod
     def get_driver_type(url: str) -> Literal["sqlite", "postgresql"] | str:
         splitted = url.split("://", maxsplit=1)
-        driver = splitted[0]
+        driver = splitted[0].split("+", maxsplit=1)[0]
         if driver == "sqlite":
             return "sqlite"
         if driver in ("postgresql", "postgres"):
@@ -1,8 +1,13 @@
-from typing import Optional
+from asyncio import AbstractEventLoop, get_running_loop
+from os import getpid
+from typing import Any, Optional
+from weakref import WeakKeyDictionary
 from sqlalchemy import Engine, create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from ..Env import Env
 from ..utils.decorators import class_instance, thread_safe_singleton
-from .DbConfigHelper import DbConfigHelper
+from .DbConfigHelper import DbConfigHelper, TDbProcessRole
+from .DbPool import MonitoredAsyncQueuePool, MonitoredQueuePool
 
 
 @class_instance()
@@ -10,25 +15,115 @@ from .DbConfigHelper import DbConfigHelper
 class DbEngine:
     __main_engine: Optional[Engine] = None
     __readonly_engine: Optional[Engine] = None
+    __async_engines: WeakKeyDictionary[AbstractEventLoop, dict[bool, AsyncEngine]] = WeakKeyDictionary()
+    __pid: Optional[int] = None
+    __role: TDbProcessRole = "api"
+
+    def set_role(self, role: TDbProcessRole) -> None:
+        """Sets the role of the process, which sizes the connection pools of the engines created from now on.
+
+        The main and readonly engines already created are disposed, so they are created again with the pool size of
+        the role.
+
+        :param role: The role of the process.
+        """
+        if self.__role == role:
+            return
+
+        self.__role = role
+        for engine in (self.__main_engine, self.__readonly_engine):
+            if engine:
+                engine.dispose()
+        self.__main_engine = None
+        self.__readonly_engine = None
 
     def get_main_engine(self) -> Engine:
+        self.__ensure_process()
         if self.__main_engine:
             return self.__main_engine
 
         url = DbConfigHelper.get_sanitized_driver(Env.MAIN_DATABASE_URL)
         self.__main_engine = create_engine(
             url,
-            **DbConfigHelper.create_config(url),
+            **DbConfigHelper.create_config(url, role=self.__role),
         )
         return self.__main_engine
 
     def get_readonly_engine(self) -> Engine:
+        self.__ensure_process()
         if self.__readonly_engine:
             return self.__readonly_engine
 
         url = DbConfigHelper.get_sanitized_driver(Env.READONLY_DATABASE_URL)
         self.__readonly_engine = create_engine(
             url,
-            **DbConfigHelper.create_config(url),
+            **DbConfigHelper.create_config(url, role=self.__role),
         )
         return self.__readonly_engine
+
+    def get_async_engine(self, readonly: bool) -> AsyncEngine:
+        """Returns the asyncio engine of the running event loop.
+
+        asyncio connections are bound to the event loop that opened them, so one engine (and pool) is kept per loop.
+        """
+        self.__ensure_process()
+        engines = self.__async_engines.setdefault(get_running_loop(), {})
+        engine = engines.get(readonly)
+        if engine:
+            return engine
+
+        database_url = Env.READONLY_DATABASE_URL if readonly else Env.MAIN_DATABASE_URL
+        url = DbConfigHelper.get_sanitized_driver(database_url, is_async=True)
+        engine = create_async_engine(
+            url,
+            **DbConfigHelper.create_config(url, is_async=True, role=self.__role),
+        )
+        engines[readonly] = engine
+        return engine
+
+    async def dispose_async_engines(self) -> None:
+        """Disposes the asyncio engines (and closes their pooled connections) of the running event loop.
+
+        Must be awaited before a short-lived loop (e.g. ``asyncio.run`` in a broker task) finishes, otherwise its
+        engines and their connections are left open.
+        """
+        try:
+            engines = self.__async_engines.pop(get_running_loop(), {})
+        except RuntimeError:
+            return
+        for engine in engines.values():
+            await engine.dispose()
+
+    def get_pool_stats(self) -> dict[str, dict[str, Any]]:
+        """Returns the connection pool statistics (including checkout wait times) of the engines in use.
+
+        Async engines are only reported for the running event loop.
+        """
+        stats = {}
+        for name, engine in (("main", self.__main_engine), ("readonly", self.__readonly_engine)):
+            if engine and isinstance(engine.pool, MonitoredQueuePool):
+                stats[name] = engine.pool.stats()
+
+        try:
+            async_engines = self.__async_engines.get(get_running_loop(), {})
+        except RuntimeError:
+            async_engines = {}
+        for readonly, engine in async_engines.items():
+            if isinstance(engine.pool, MonitoredAsyncQueuePool):
+                stats["async_readonly" if readonly else "async_main"] = engine.pool.stats()
+        return stats
+
+    def __ensure_process(self) -> None:
+        # Pooled connections must not be shared with a forked child, so the child starts with fresh pools.
+        pid = getpid()
+        if self.__pid == pid:
+            return
+
+        for engine in (self.__main_engine, self.__readonly_engine):
+            if engine:
+                engine.dispose(close=False)
+        for engines in self.__async_engines.values():
+            for engine in engines.values():
+                engine.sync_engine.dispose(close=False)
+        self.__async_engines.clear()
+        self.__pid = pid
@@ -0,0 +1,51 @@
+from threading import Lock
+from time import perf_counter
+from typing import Any
+from sqlalchemy import AsyncAdaptedQueuePool, QueuePool
+
+
+class _CheckoutWaitMonitor:
+    """Records how long callers waited to check out a connection from a :class:`QueuePool`."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = Lock()
+        self._checkouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def stats(self) -> dict[str, Any]:
+        with self._stats_lock:
+            checkouts = self._checkouts
+            total_wait = self._total_wait
+            max_wait = self._max_wait
+
+        pool: QueuePool = self  # type: ignore
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "checkouts": checkouts,
+            "avg_wait_ms": (total_wait / checkouts * 1000) if checkouts else 0.0,
+            "max_wait_ms": max_wait * 1000,
+        }
+
+    def _do_get(self):
+        started_at = perf_counter()
+        try:
+            return super()._do_get()  # type: ignore
+        finally:
+            waited = perf_counter() - started_at
+            with self._stats_lock:
+                self._checkouts += 1
+                self._total_wait += waited
+                if waited > self._max_wait:
+                    self._max_wait = waited
+
+
+class MonitoredQueuePool(_CheckoutWaitMonitor, QueuePool):
+    """:class:`QueuePool` that records how long callers waited to check out a connection."""
+
+
+class MonitoredAsyncQueuePool(_CheckoutWaitMonitor, AsyncAdaptedQueuePool):
+    """:class:`AsyncAdaptedQueuePool` that records how long callers waited to check out a connection."""
@@ -0,0 +1,177 @@
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from threading import Lock, get_ident
+from typing import AsyncIterator, Optional
+from weakref import WeakKeyDictionary
+from sqlalchemy import Connection, Pool, QueuePool
+from sqlalchemy.ext.asyncio import AsyncConnection
+from .DbEngine import DbEngine
+
+
+_current_scope: ContextVar[Optional["DbRequestScope"]] = ContextVar("db_request_scope", default=None)
+_held_connections_lock = Lock()
+_held_connections: WeakKeyDictionary[Pool, int] = WeakKeyDictionary()
+
+
+class DbRequestScope:
+    """Shares one readonly connection between the database sessions opened while handling a request.
+
+    Inside :meth:`use`, ``DbSession.use(readonly=True)`` and ``AsyncDbSession.use(readonly=True)`` run on a single
+    connection per driver checked out for the whole request instead of checking one out per call. The shared
+    connections are in autocommit mode, so every read still sees the writes committed earlier in the request.
+
+    Writes (``readonly=False``) and reads with ``reuse=False`` always get their own session and transaction.
+
+    The shared connections are held across the awaits of the request (and the sync one is checked out on the event
+    loop thread), so the request scopes of a process may only hold part of a :class:`QueuePool` (see
+    :meth:`get_connection_limit`). Past that limit, sessions get their own connection, which they return when they
+    end, so the loop never blocks on a pool exhausted by requests waiting for the loop.
+
+    It also counts the connections checked out and the statements executed during the request.
+    """
+
+    def __init__(self):
+        self.connections = 0
+        self.queries = 0
+        self.__thread_id = get_ident()
+        self.__connection: Connection | None = None
+        self.__connection_pool: Pool | None = None
+        self.__async_connection: AsyncConnection | None = None
+        self.__async_connection_pool: Pool | None = None
+        self.__is_async_connection_in_use = False
+        self.__is_closed = False
+
+    @staticmethod
+    @asynccontextmanager
+    async def use() -> AsyncIterator["DbRequestScope"]:
+        scope = DbRequestScope()
+        token = _current_scope.set(scope)
+        try:
+            yield scope
+        finally:
+            _current_scope.reset(token)
+            await scope.close()
+
+    @staticmethod
+    def current() -> Optional["DbRequestScope"]:
+        return _current_scope.get()
+
+    @staticmethod
+    def record_connection() -> None:
+        scope = _current_scope.get()
+        if scope:
+            scope.connections += 1
+
+    @staticmethod
+    def record_query() -> None:
+        scope = _current_scope.get()
+        if scope:
+            scope.queries += 1
+
+    def stats(self) -> dict[str, int]:
+        return {"connections": self.connections, "queries": self.queries}
+
+    @staticmethod
+    def get_connection_limit(pool: Pool) -> int | None:
+        """Returns how many connections of the pool the request scopes may hold, or None if it is unlimited.
+
+        Only the steady pool size is lent to the request scopes, and at least one connection is always left over for
+        the other sessions.
+
+        :param pool: The pool of a readonly engine.
+        """
+        if not isinstance(pool, QueuePool):
+            return None
+
+        max_overflow = getattr(pool, "_max_overflow", 0)
+        if max_overflow < 0:
+            return None
+        return max(min(pool.size(), pool.size() + max_overflow - 1), 0)
+
+    def get_connection(self) -> Connection | None:
+        """Returns the shared sync connection, or None if it cannot be shared with the caller.
+
+        Sync endpoints run in a thread pool with a copy of the request context, so the connection is only handed to the
+        thread that created the scope. None is also returned once the request scopes hold as many connections as
+        :meth:`get_connection_limit` allows.
+        """
+        if self.__is_closed or get_ident() != self.__thread_id:
+            return None
+
+        if self.__connection is None:
+            engine = DbEngine.get_readonly_engine()
+            if not DbRequestScope.__claim_connection(engine.pool):
+                return None
+
+            try:
+                connection = engine.connect()
+            except Exception:
+                DbRequestScope.__release_connection(engine.pool)
+                raise
+            self.__connection = connection.execution_options(isolation_level="AUTOCOMMIT")
+            self.__connection_pool = engine.pool
+            self.connections += 1
+        return self.__connection
+
+    @asynccontextmanager
+    async def use_async_connection(self) -> AsyncIterator[AsyncConnection | None]:
+        """Lends the shared async connection, or yields None if it is closed, already lent to another task or past
+        :meth:`get_connection_limit`.
+        """
+        if self.__is_closed or self.__is_async_connection_in_use:
+            yield None
+            return
+
+        if self.__async_connection is None:
+            engine = DbEngine.get_async_engine(readonly=True)
+            pool = engine.sync_engine.pool
+            if not DbRequestScope.__claim_connection(pool):
+                yield None
+                return
+
+            try:
+                connection = await engine.connect()
+                self.__async_connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+            except Exception:
+                DbRequestScope.__release_connection(pool)
+                raise
+            self.__async_connection_pool = pool
+            self.connections += 1
+
+        self.__is_async_connection_in_use = True
+        try:
+            yield self.__async_connection
+        finally:
+            self.__is_async_connection_in_use = False
+
+    async def close(self) -> None:
+        self.__is_closed = True
+        if self.__connection is not None:
+            self.__connection.close()
+            self.__connection = None
+        if self.__connection_pool is not None:
+            DbRequestScope.__release_connection(self.__connection_pool)
+            self.__connection_pool = None
+        if self.__async_connection is not None:
+            await self.__async_connection.close()
+            self.__async_connection = None
+        if self.__async_connection_pool is not None:
+            DbRequestScope.__release_connection(self.__async_connection_pool)
+            self.__async_connection_pool = None
+
+    @staticmethod
+    def __claim_connection(pool: Pool) -> bool:
+        limit = DbRequestScope.get_connection_limit(pool)
+        with _held_connections_lock:
+            held = _held_connections.get(pool, 0)
+            if limit is not None and held >= limit:
+                return False
+            _held_connections[pool] = held + 1
+        return True
+
+    @staticmethod
+    def __release_connection(pool: Pool) -> None:
+        with _held_connections_lock:
+            held = _held_connections.get(pool, 0)
+            if held > 0:
+                _held_connections[pool] = held - 1
@@ -1,8 +1,9 @@
 from contextlib import contextmanager
 from time import sleep
-from typing import Any, Dict, Generic, Iterable, Mapping, Optional, Sequence, TypeVar, Union, cast, overload
+from typing import Any, Dict, Generic, Iterable, Iterator, Mapping, Optional, Sequence, TypeVar, Union, cast, overload
 import psycopg.errors
-from sqlalchemy import CompoundSelect, CursorResult, Delete, Insert, IteratorResult, Update
+from pydantic import BaseModel
+from sqlalchemy import CompoundSelect, CursorResult, Delete, Insert, IteratorResult, Update, insert
 from sqlalchemy import Sequence as SqlSequence
 from sqlalchemy.engine.result import ScalarResult, TupleResult
 from sqlalchemy.exc import OperationalError
@@ -13,6 +14,7 @@ from sqlmodel.sql.expression import Select, SelectOfScalar
 from ..logger import Logger
 from ..types import SafeDateTime, SnowflakeID
 from .DbEngine import DbEngine
+from .DbRequestScope import DbRequestScope
 from .Models import BaseSqlModel, SoftDeleteModel
 
 
@@ -21,7 +23,7 @@ _TSelectParam = TypeVar("_TSelectParam", bound=Any)
 
 class Result(Generic[_TSelectParam]):
     def __init__(self, records: Sequence[Any]):
-        self.__records = [self.__copy_record(record) for record in records]
+        self.__records = [_snapshot_record(record) for record in records]
 
     def all(self) -> list[_TSelectParam]:
         return self.__records
@@ -29,18 +31,83 @@ class Result(Generic[_TSelectParam]):
     def first(self) -> Optional[_TSelectParam]:
         return self.__records[0] if self.__records else None
 
-    def __copy_record(self, record: Any):
-        if isinstance(record, BaseSqlModel):
-            record = self.__copy_model(record)
-        elif isinstance(record, tuple):
-            record = self.__convert_tuple_record(record)
-        return record
 
-    def __convert_tuple_record(self, record: tuple) -> tuple:
-        return tuple(self.__copy_model(item) if isinstance(item, BaseSqlModel) else item for item in record)
+def _snapshot_record(record: Any) -> Any:
+    if isinstance(record, BaseSqlModel):
+        return _snapshot_model(record)
+    if isinstance(record, tuple):
+        return tuple(_snapshot_model(item) if isinstance(item, BaseSqlModel) else item for item in record)
+    return record
 
-    def __copy_model(self, record: BaseSqlModel) -> BaseSqlModel:
-        return record.__class__.model_validate(record.model_dump())
+
+def _snapshot_model(record: BaseSqlModel) -> BaseSqlModel:
+    """Copies the loaded column state of a record into a new transient instance detached from the session.
+
+    It is equivalent to ``record.__class__.model_validate(record.model_dump())`` without serializing and validating
+    every field again.
+    """
+    model_class = record.__class__
+    snapshot = model_class._sa_class_manager.new_instance()  # type: ignore
+    loaded = record.__dict__
+    values = snapshot.__dict__
+    for key in model_class.model_fields:
+        value = loaded[key] if key in loaded else getattr(record, key)
+        if isinstance(value, (list, dict)):
+            value = value.copy()
+        elif isinstance(value, BaseModel):
+            value = value.model_copy()
+        values[key] = value
+
+    object.__setattr__(snapshot, "__pydantic_fields_set__", set(record.__pydantic_fields_set__))
+    object.__setattr__(snapshot, "__pydantic_extra__", None)
+    object.__setattr__(snapshot, "__pydantic_private__", None)
+    object.__setattr__(snapshot, "_initiated", True)
+    return snapshot
+
+
+def _to_row(obj: BaseSqlModel, fields: Iterable[str] | None = None) -> dict[str, Any]:
+    """Returns the column values of an object, validated the same way :meth:`DbSession.insert` does.
+
+    The values are validated into a bare instance, so no ORM state or attribute events are created for it.
+    """
+    model_class = obj.__class__
+    loaded = obj.__dict__
+    data = {key: loaded[key] if key in loaded else getattr(obj, key) for key in model_class.model_fields}
+    validated = model_class.__new__(model_class)
+    model_class.__pydantic_validator__.validate_python(data, self_instance=validated)
+    values = validated.__dict__
+    return {key: values[key] for key in (fields if fields is not None else model_class.model_fields)}
+
+
+def _is_max_client_conn_error(error: Exception) -> bool:
+    return (
+        isinstance(error, OperationalError)
+        and isinstance(error.orig, psycopg.errors.OperationalError)
+        and str(error.orig).count("max_client_conn") > 0
+    )
+
+
+def _prepare_statement(statement: Any, purge: bool) -> tuple[Any, bool]:
+    """Converts a :class:`Delete` on a :class:`SoftDeleteModel` table to an :class:`Update` unless `purge` is `True`.
+
+    Returns the statement to be executed and whether it returns a row count instead of records.
+    """
+    if (
+        isinstance(statement, Delete)
+        and (
+            isinstance(statement.table.entity_namespace, type)
+            and issubclass(statement.table.entity_namespace, SoftDeleteModel)
+        )
+        and not purge
+    ):
+        statement = update(statement.table).values(deleted_at=SafeDateTime.now()).where(statement.whereclause)  # type: ignore
+
+    should_return_count = (
+        not isinstance(statement, Select)
+        and not isinstance(statement, SelectOfScalar)
+        and not isinstance(statement, CompoundSelect)
+    )
+    return statement, should_return_count
 
 
 _logger = Logger.use("db")
@@ -52,13 +119,37 @@ class DbSession:
     The purpose of this class is to provide a single interface for multiple database sessions.
     """
 
-    def __init__(self, session: Session, readonly: bool):
+    def __init__(self, session: Session, readonly: bool, shared: bool = False):
         self.__session = session
         self.__readonly = readonly
+        self.__shared = shared
 
     @staticmethod
     @contextmanager
-    def use(readonly: bool):
+    def use(readonly: bool, reuse: bool = True):
+        """Opens a database session.
+
+        Inside :meth:`DbRequestScope.use`, readonly sessions run on the connection shared by the request unless
+        `reuse` is `False`.
+
+        :param readonly: If `True`, the session runs on the readonly database and cannot write.
+        :param reuse: If `False`, a readonly session always gets its own connection and transaction.
+        """
+        scope = DbRequestScope.current()
+        connection = scope.get_connection() if scope and readonly and reuse else None
+        if connection is not None:
+            with Session(connection, expire_on_commit=False) as db_session:
+                db = DbSession(db_session, readonly=True, shared=True)
+                try:
+                    with db_session.begin():
+                        yield db
+                except Exception as e:
+                    _logger.exception(e)
+                    raise e
+                finally:
+                    db.close()
+            return
+
         MAX_TRIALS = 10
         for _ in range(MAX_TRIALS):
             session = None
@@ -68,15 +159,15 @@ class DbSession:
                 with Session(engine, expire_on_commit=False) as db_session:
                     db = DbSession(db_session, readonly=readonly)
                     session = db_session
+                    DbRequestScope.record_connection()
                     with db_session.begin():
                         yield db
                 break
             except Exception as e:
-                if isinstance(e, OperationalError) and isinstance(e.orig, psycopg.errors.OperationalError):
-                    if str(e.orig).count("max_client_conn") > 0:
-                        sleep(1)
-                        _logger.warning(f"Database connection error: {e}. Retrying...")
-                        continue
+                if _is_max_client_conn_error(e):
+                    sleep(1)
+                    _logger.warning(f"Database connection error: {e}. Retrying...")
+                    continue
                 _logger.exception(e)
                 raise e
             finally:
@@ -90,6 +181,7 @@ class DbSession:
     def close(self):
         self.__session = cast(Session, None)
         self.__readonly = True
+        self.__shared = False
 
     def insert(self, obj: BaseSqlModel):
         """Inserts a new object into the database if it is new.
@@ -113,6 +205,9 @@ class DbSession:
     def insert_all(self, objs: Iterable[BaseSqlModel]):
         """Inserts new objects into the database if they are new.
 
+        The objects are added to the session as with :meth:`insert`, so the session flushes them in the order of
+        their foreign keys and objects of several models can be mixed. Use :meth:`bulk_insert` for large batches.
+
         :param objs: The objects to be inserted; must be a subclass of :class:`BaseSqlModel`.
         """
         if self.__readonly:
@@ -121,6 +216,36 @@ class DbSession:
         for obj in objs:
             self.insert(obj)
 
+    def bulk_insert(self, objs: Iterable[BaseSqlModel]):
+        """Inserts new objects with one multi-row ``INSERT`` per table instead of one ORM flush per object.
+
+        IDs are allocated for every new object up front. Objects that are not new are skipped, as in :meth:`insert`.
+
+        The ``INSERT`` statements are executed immediately, one per model in the order each model first appears in
+        `objs`, and not in the order of their foreign keys. Objects referring to each other must be inserted parent
+        first, or with :meth:`insert_all`.
+
+        :param objs: The objects to be inserted; must be a subclass of :class:`BaseSqlModel`.
+        """
+        if self.__readonly:
+            raise Exception("Cannot insert into a readonly database")
+
+        new_objs = [obj for obj in objs if obj.is_new()]
+        if not new_objs:
+            return
+
+        rows_by_model: dict[type[BaseSqlModel], list[dict[str, Any]]] = {}
+        for obj, obj_id in zip(new_objs, SnowflakeID.allocate(len(new_objs))):
+            obj.id = obj_id
+            obj.updated_at = obj.created_at
+            obj.clear_changes()
+            rows_by_model.setdefault(obj.__class__, []).append(_to_row(obj))
+
+        for model_class, rows in rows_by_model.items():
+            # A list of parameter sets makes SQLAlchemy batch the rows into multi-row VALUES clauses.
+            self.__session.exec(insert(model_class), params=rows)  # type: ignore
+            DbRequestScope.record_query()
+
     def update(self, obj: BaseSqlModel):
         """Updates an object in the database if it is not new.
 
@@ -139,6 +264,39 @@ class DbSession:
         except Exception:
             self.__session.add(obj)
 
+    def bulk_update(self, objs: Iterable[BaseSqlModel], fields: Iterable[str]):
+        """Writes the given fields of existing objects with one executemany ``UPDATE ... WHERE id = ?`` per table.
+
+        Unlike :meth:`update`, the objects are not merged into the session, and the fields are written even if they
+        have no tracked changes. ``updated_at`` of the objects is set to the current time unless it is one of the
+        fields.
+
+        :param objs: The objects to be updated; must be a subclass of :class:`BaseSqlModel`.
+        :param fields: The names of the fields to be written.
+        """
+        if self.__readonly:
+            raise Exception("Cannot update in a readonly database")
+
+        fields = list(fields)
+        updated_at = SafeDateTime.now()
+        rows_by_model: dict[type[BaseSqlModel], list[dict[str, Any]]] = {}
+        for obj in objs:
+            if obj.is_new():
+                continue
+            if "updated_at" not in fields:
+                obj.updated_at = updated_at
+            obj.clear_changes()
+            row = _to_row(obj, fields)
+            row["id"] = obj.id
+            if "updated_at" not in row:
+                row["updated_at"] = obj.updated_at
+            rows_by_model.setdefault(obj.__class__, []).append(row)
+
+        for model_class, rows in rows_by_model.items():
+            # The ORM turns a list of parameter sets that include the primary key into an UPDATE by primary key.
+            self.__session.exec(update(model_class), params=rows)  # type: ignore
+            DbRequestScope.record_query()
+
     @overload
     def delete(self, obj: BaseSqlModel): ...
     @overload
@@ -272,21 +430,7 @@ class DbSession:
         :param _parent_execute_state: The parent execute state to be passed to the statement.
         :param _add_event: The event to be added to the statement.
         """
-        if (
-            isinstance(statement, Delete)
-            and (
-                isinstance(statement.table.entity_namespace, type)
-                and issubclass(statement.table.entity_namespace, SoftDeleteModel)
-            )
-            and not purge
-        ):
-            statement = update(statement.table).values(deleted_at=SafeDateTime.now()).where(statement.whereclause)  # type: ignore
-
-        should_return_count = (
-            not isinstance(statement, Select)
-            and not isinstance(statement, SelectOfScalar)
-            and not isinstance(statement, CompoundSelect)
-        )
+        statement, should_return_count = _prepare_statement(statement, purge)
 
         if self.__readonly and should_return_count:
             raise Exception("Cannot execute non-select statements in a readonly database")
@@ -301,6 +445,7 @@ class DbSession:
         }
 
         result = self.__session.exec(**args)
+        DbRequestScope.record_query()
 
         if should_return_count:
             return result.rowcount
@@ -312,3 +457,36 @@ class DbSession:
 
         _logger.warning(f"Unexpected result type: {type(result)}")
         return result
+
+    def exec_iter(
+        self,
+        statement: Union[Select[_TSelectParam], SelectOfScalar[_TSelectParam], CompoundSelect[_TSelectParam]],
+        *,
+        params: Optional[Union[Mapping[str, Any], SqlSequence[Mapping[str, Any]]]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[_TSelectParam]:
+        """Executes a select statement and yields the records lazily.
+
+        Unlike :meth:`exec`, rows are fetched from a server-side cursor ``batch_size`` rows at a time, so large exports
+        do not hold every record in memory. The iterator must be consumed before leaving :meth:`use`.
+
+        Server-side cursors need a transaction, so a session shared by the request streams on its own connection.
+
+        :param statement: The select statement to be executed.
+        :param params: The parameters to be passed to the statement.
+        :param batch_size: The number of rows fetched from the cursor at once.
+        """
+        if self.__shared:
+            with DbSession.use(readonly=True, reuse=False) as db:
+                yield from db.exec_iter(statement, params=params, batch_size=batch_size)
+            return
+
+        result = self.__session.exec(
+            statement,  # type: ignore
+            params=params,
+            execution_options={"stream_results": True, "yield_per": batch_size},
+        )
+        DbRequestScope.record_query()
+        for partition in result.partitions():
+            for record in partition:
+                yield _snapshot_record(record)
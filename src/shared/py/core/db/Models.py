@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, ClassVar, Literal, TypeVar, overload
+from typing import Any, ClassVar, Iterable, Literal, TypeVar, overload
 from pydantic import BaseModel, SecretStr, model_serializer
 from sqlalchemy import MetaData
 from sqlalchemy.orm import declared_attr, registry
@@ -8,10 +8,13 @@ from sqlalchemy.orm.attributes import InstrumentedAttribute
 from sqlmodel import Field, SQLModel
 from ..types import SafeDateTime, SnowflakeID
 from ..utils.StringCase import StringCase
+from .ApiResponsePlan import ApiResponsePlan
 from .ColumnTypes import DateTimeField, SnowflakeIDField
 
 
 _TColumnType = TypeVar("_TColumnType")
+_TSqlModel = TypeVar("_TSqlModel", bound="BaseSqlModel")
+_CHANGES_ATTR = "_tracked_changes"
 
 SQLModel.metadata = MetaData(
     naming_convention={
@@ -28,35 +31,30 @@ default_registry = registry()
 class BaseSqlModel(ABC, SQLModel, registry=default_registry):
     """Bases for all SQL models in the application inherited from :class:`SQLModel`."""
 
-    __changes__: ClassVar[dict[str, dict[str, Any]]] = {}
     __pydantic_post_init__ = "model_post_init"
+    # Set by the models whose api_response() is compiled from a plan, so lists of them are serialized in a batch.
+    API_RESPONSE_PLAN: ClassVar[ApiResponsePlan | None] = None
 
     id: SnowflakeID = SnowflakeIDField(primary_key=True)
     created_at: SafeDateTime = DateTimeField(default=SafeDateTime.now, nullable=False)
     updated_at: SafeDateTime = DateTimeField(default=SafeDateTime.now, nullable=False, onupdate=True)
 
-    @property
-    def __change_key(self) -> str:
-        return f"{self.__tablename__}:{self.id}"
-
-    @property
-    def __changes(self) -> dict[str, Any]:
-        return self.__changes__[self.__change_key] if self.__change_key in self.__changes__ else {}
-
     @property
     def changes(self) -> dict[str, Any]:
         """Get the changes made to the object."""
-        if not isinstance(self, BaseSqlModel) or not self.__changes:
+        changes = self.__dict__.get(_CHANGES_ATTR)
+        if not changes:
             return {}
-        return {**self.__changes}
+        return {**changes}
 
     @property
     def changes_dict(self) -> dict[str, Any]:
         """Get the changed values as a dictionary if the object is a model."""
-        if not isinstance(self, BaseSqlModel) or not self.__changes:
+        changes = self.__dict__.get(_CHANGES_ATTR)
+        if not changes:
             return {}
         changed_values = {}
-        for key, value in self.__changes.items():
+        for key, value in changes.items():
             if isinstance(value, SecretStr):
                 value = value.get_secret_value()
             elif isinstance(value, BaseModel):
@@ -84,27 +82,34 @@ class BaseSqlModel(ABC, SQLModel, registry=default_registry):
         if isinstance(__pydantic_self__, BaseSqlModel):
             __pydantic_self__.model_post_init()
         super().__init__(**data)
+        # Assigning the initial values is not a change.
+        __pydantic_self__.__dict__.pop(_CHANGES_ATTR, None)
 
     def __setattr__(self, name: str, value: Any) -> None:
+        instance_dict = self.__dict__
         if name == "_sa_instance_state":
-            if not hasattr(self, "_initiated"):
+            if "_initiated" not in instance_dict:
                 object.__setattr__(self, "_initiated", True)
             super().__setattr__(name, value)
             return
 
-        if not isinstance(self, BaseSqlModel) or not hasattr(self, "_initiated") or name == "_initiated":
+        if name == "_initiated" or "_initiated" not in instance_dict or name not in self.__class__.model_fields:
             super().__setattr__(name, value)
             return
 
-        if not self.is_new() and name in self.model_fields.keys():
+        # The id is not set yet while the model is being constructed, and is 0 until it is inserted.
+        if instance_dict.get("id"):
             old_value = getattr(self, name)
-            if self.__change_key not in self.__changes__:
-                self.__changes__[self.__change_key] = {}
             if old_value != value:
-                if name not in self.__changes:
-                    self.__changes[name] = old_value
-                elif self.__changes[name] == value:
-                    del self.__changes[name]
+                # The original value of each changed field is kept on the instance itself, so it is dropped with it.
+                changes = instance_dict.get(_CHANGES_ATTR)
+                if changes is None:
+                    changes = {}
+                    object.__setattr__(self, _CHANGES_ATTR, changes)
+                if name not in changes:
+                    changes[name] = old_value
+                elif changes[name] == value:
+                    del changes[name]
         super().__setattr__(name, value)
 
     @classmethod
@@ -165,15 +170,11 @@ class BaseSqlModel(ABC, SQLModel, registry=default_registry):
 
     def has_changes(self) -> bool:
         """Check if the object has changes."""
-        if not isinstance(self, BaseSqlModel) or not self.__changes:
-            return False
-        return bool(self.__changes)
+        return bool(self.__dict__.get(_CHANGES_ATTR))
 
     def clear_changes(self) -> None:
         """Clear the changes made to the object."""
-        if not isinstance(self, BaseSqlModel) or not self.__changes:
-            return
-        self.__changes__.pop(self.__change_key)
+        self.__dict__.pop(_CHANGES_ATTR, None)
 
     @model_serializer
     def serialize(self) -> dict[str, Any]:
@@ -199,6 +200,19 @@ class BaseSqlModel(ABC, SQLModel, registry=default_registry):
     @abstractmethod
     def notification_data(self) -> dict[str, Any]: ...
 
+    @classmethod
+    def api_response_list(cls: type[_TSqlModel], rows: Iterable[_TSqlModel]) -> list[dict[str, Any]]:
+        """Get the api responses of the rows of this model.
+
+        If the model has its own :attr:`API_RESPONSE_PLAN`, the rows are serialized with it in a batch.
+
+        :param rows: The rows to serialize.
+        """
+        plan = cls.__dict__.get("API_RESPONSE_PLAN")
+        if plan is None:
+            return [row.api_response() for row in rows]
+        return plan.serialize_many(rows)
+
     @overload
     @classmethod
     def get_foreign_models(cls) -> dict[str, type[SQLModel]]: ...
@@ -1,3 +1,5 @@
+from .ApiResponsePlan import ApiResponsePlan
+from .AsyncDbSession import AsyncDbSession
 from .BaseSeed import BaseSeed
 from .ColumnTypes import (
     CSVType,
@@ -10,14 +12,20 @@ from .ColumnTypes import (
     SnowflakeIDField,
     SnowflakeIDType,
 )
+from .DbEngine import DbEngine
+from .DbRequestScope import DbRequestScope
 from .DbSession import DbSession
 from .Models import BaseSqlModel, ChatContentModel, EditorContentModel, SoftDeleteModel
 from .SqlBuilder import SqlBuilder
 
 
 __all__ = [
+    "ApiResponsePlan",
     "BaseSeed",
     "DbSession",
+    "AsyncDbSession",
+    "DbEngine",
+    "DbRequestScope",
     "DateTimeField",
     "ModelColumnType",
     "ModelColumnListType",
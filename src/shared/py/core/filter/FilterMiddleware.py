@@ -1,8 +1,8 @@
 from typing import Literal, overload
-from starlette.routing import BaseRoute, Match
+from starlette.routing import BaseRoute
 from starlette.types import ASGIApp, Scope
-from ..routing import AppExceptionHandlingRoute
 from ..routing.BaseMiddleware import BaseMiddleware
+from ..routing.RouteIndex import RouteIndex
 from .BaseFilter import BaseFilter
 
 
@@ -17,6 +17,7 @@ class FilterMiddleware(BaseMiddleware):
     ):
         super().__init__(app)
         self._routes = routes
+        self._route_index = RouteIndex.of(routes)
         self._filter = filter
 
     @overload
@@ -24,15 +25,7 @@ class FilterMiddleware(BaseMiddleware):
     @overload
     def should_filter(self, scope: Scope) -> tuple[Literal[False], None]: ...
     def should_filter(self, scope: Scope) -> tuple[bool, Scope | None]:
-        should_filter = False
-        child_scope = None
-        for route in self._routes:
-            if not isinstance(route, AppExceptionHandlingRoute):
-                continue
-
-            matches, child_scope = route.matches(scope)
-            if matches == Match.FULL:
-                if self._filter.exists(child_scope["endpoint"]):
-                    should_filter = True
-                break
-        return should_filter, child_scope
+        child_scope = self._route_index.resolve(scope)
+        if child_scope is None or not self._filter.exists(child_scope["endpoint"]):
+            return False, None
+        return True, child_scope
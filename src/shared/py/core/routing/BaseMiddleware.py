@@ -1,8 +1,7 @@
 from abc import ABC, abstractmethod
 from fastapi import FastAPI
-from starlette.routing import Match
 from starlette.types import ASGIApp, Receive, Scope, Send
-from .AppExceptionHandlingRoute import AppExceptionHandlingRoute
+from .RouteIndex import RouteIndex
 
 
 class BaseMiddleware(ABC):
@@ -22,11 +21,5 @@ class BaseMiddleware(ABC):
         if not app:
             return None
 
-        for route in app.routes:
-            if not isinstance(route, AppExceptionHandlingRoute):
-                continue
-
-            matches, child_scope = route.matches(scope)
-            if matches == Match.FULL:
-                return child_scope["endpoint"]
-        return None
+        child_scope = RouteIndex.of(app.routes).resolve(scope)
+        return child_scope["endpoint"] if child_scope else None
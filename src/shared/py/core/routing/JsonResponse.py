@@ -1,9 +1,8 @@
-from json import dumps as json_dumps
 from typing import Any, Mapping
 from fastapi.responses import Response
 from pydantic import BaseModel
 from starlette.background import BackgroundTask
-from ..utils.Converter import json_default
+from ..serialization import JsonCodec
 from .ApiErrorCode import ApiErrorCode
 
 
@@ -32,11 +31,4 @@ class JsonResponse(Response):
         if isinstance(content, BaseModel):
             content = content.model_dump()
 
-        return json_dumps(
-            content,
-            ensure_ascii=False,
-            allow_nan=False,
-            indent=None,
-            separators=(",", ":"),
-            default=json_default,
-        ).encode("utf-8")
+        return JsonCodec.dumps(content)
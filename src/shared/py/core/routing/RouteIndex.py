@@ -0,0 +1,94 @@
+from typing import ClassVar
+from starlette._utils import get_route_path
+from starlette.routing import BaseRoute, Match
+from starlette.types import Scope
+from .AppExceptionHandlingRoute import AppExceptionHandlingRoute
+
+
+class RouteIndex:
+    """Resolves the route of a request once and shares the result between middlewares.
+
+    The resolved child scope is stashed in the request scope, so every middleware after the first one reuses it. Routes
+    without path parameters are also cached by ``(method, root_path, path)``, so requests to them skip the regex scan.
+    Other requests only scan the routes whose first path segment matches (plus the routes starting with a parameter),
+    in registration order.
+    """
+
+    SCOPE_KEY = "app_route_match"
+    MAX_STATIC_PATHS = 4096
+
+    __indexes: ClassVar[dict[int, "RouteIndex"]] = {}
+
+    def __init__(self, routes: list[BaseRoute]):
+        self._routes = routes
+        self._route_count = -1
+        self._wildcard_routes: list[AppExceptionHandlingRoute] = []
+        self._routes_by_segment: dict[str, list[AppExceptionHandlingRoute]] = {}
+        self._static_routes: dict[tuple[str, str, str], AppExceptionHandlingRoute] = {}
+
+    @staticmethod
+    def of(routes: list[BaseRoute]) -> "RouteIndex":
+        """Returns the index shared by every middleware given the same route list."""
+        index = RouteIndex.__indexes.get(id(routes))
+        if index is None or index._routes is not routes:
+            index = RouteIndex(routes)
+            RouteIndex.__indexes[id(routes)] = index
+        return index
+
+    def resolve(self, scope: Scope) -> Scope | None:
+        """Returns the child scope (``endpoint``, ``path_params`` and ``route``) of the route fully matching the
+        request, or None if there is none.
+        """
+        if scope["type"] != "http":
+            return None
+
+        key = (scope["method"], scope.get("root_path", ""), scope["path"])
+        stashed = scope.get(RouteIndex.SCOPE_KEY)
+        if stashed is not None and stashed[0] == key:
+            return stashed[1]
+
+        self.__refresh()
+        child_scope = None
+        route = self._static_routes.get(key)
+        if route is not None:
+            child_scope = {
+                "endpoint": route.endpoint,
+                "path_params": dict(scope.get("path_params", {})),
+                "route": route,
+            }
+        else:
+            segment = RouteIndex.__get_first_segment(get_route_path(scope))
+            for route in self._routes_by_segment.get(segment, self._wildcard_routes):
+                matches, matched_scope = route.matches(scope)
+                if matches == Match.FULL:
+                    child_scope = matched_scope
+                    if not route.param_convertors and len(self._static_routes) < RouteIndex.MAX_STATIC_PATHS:
+                        self._static_routes[key] = route
+                    break
+
+        scope[RouteIndex.SCOPE_KEY] = (key, child_scope)
+        return child_scope
+
+    def __refresh(self) -> None:
+        # Routes are registered after the middlewares are created, so the index is rebuilt when the list changes.
+        if len(self._routes) == self._route_count:
+            return
+
+        app_routes = [route for route in self._routes if isinstance(route, AppExceptionHandlingRoute)]
+        segments = [RouteIndex.__get_first_segment(route.path) for route in app_routes]
+        self._wildcard_routes = [route for route, segment in zip(app_routes, segments) if "{" in segment]
+        self._routes_by_segment = {}
+        for segment in set(segments):
+            if "{" in segment:
+                continue
+            self._routes_by_segment[segment] = [
+                route
+                for route, route_segment in zip(app_routes, segments)
+                if route_segment == segment or "{" in route_segment
+            ]
+        self._static_routes = {}
+        self._route_count = len(self._routes)
+
+    @staticmethod
+    def __get_first_segment(path: str) -> str:
+        return path.split("/", 2)[1] if path.startswith("/") and len(path) > 1 else ""
@@ -4,6 +4,7 @@ from .AppRouter import AppRouter
 from .BaseMiddleware import BaseMiddleware
 from .Form import BaseFormModel, form_model
 from .JsonResponse import JsonResponse
+from .RouteIndex import RouteIndex
 from .SocketTopic import GLOBAL_TOPIC_ID, NONE_TOPIC_ID, SocketTopic
 
 
@@ -15,6 +16,7 @@ __all__ = [
     "BaseMiddleware",
     "form_model",
     "JsonResponse",
+    "RouteIndex",
     "GLOBAL_TOPIC_ID",
     "NONE_TOPIC_ID",
     "SocketTopic",
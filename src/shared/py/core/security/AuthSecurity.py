@@ -1,6 +1,7 @@
 from calendar import timegm
 from datetime import timedelta
-from json import dumps as json_dumps
+from hashlib import sha256
+from hmac import new as hmac_new
 from json import loads as json_loads
 from typing import Any, Literal
 from fastapi import FastAPI
@@ -14,6 +15,7 @@ from ..routing.AppExceptionHandlingRoute import AppExceptionHandlingRoute
 from ..types import SafeDateTime, SnowflakeID
 from ..utils.decorators import staticclass
 from ..utils.Encryptor import Encryptor
+from .VerifiedTokenCache import VerifiedTokenCache
 
 
 @staticclass
@@ -21,6 +23,11 @@ class AuthSecurity:
     AUTHORIZATION_HEADER = "Authorization"
     IP_HEADER = "X-Forwarded-For"
     API_TOKEN_HEADER = "X-Api-Token"
+    REFRESH_TOKEN_ALGORITHM = "HS256"
+    VERIFIED_TOKEN_CACHE_SIZE = 10000
+    __refresh_token_key: tuple[str, str] | None = None
+    # Clients send the same tokens on every request, so each one is only verified once until it expires.
+    __verified_tokens = VerifiedTokenCache(VERIFIED_TOKEN_CACHE_SIZE)
 
     @staticmethod
     def authenticate(user_id: SnowflakeID) -> tuple[str, str]:
@@ -103,7 +110,41 @@ class AuthSecurity:
     @staticmethod
     def create_refresh_token(user_id: int) -> str:
         payload = AuthSecurity.__create_payload(user_id, timedelta(days=Env.JWT_RT_EXPIRATION))
-        return Encryptor.encrypt(json_dumps(payload), Env.JWT_SECRET_KEY)
+        return jwt_encode(
+            payload=payload,
+            key=AuthSecurity.__get_refresh_token_key(),
+            algorithm=AuthSecurity.REFRESH_TOKEN_ALGORITHM,
+        )
+
+    @staticmethod
+    def is_legacy_refresh_token(token: str) -> bool:
+        """Checks if the refresh token has the encrypted format used before refresh tokens became JWTs.
+
+        :param token: The refresh token.
+        """
+        return token.count(".") != 2
+
+    @staticmethod
+    def migrate_refresh_token(token: str) -> str | None:
+        """Re-issues a legacy refresh token as a JWT with the same subject and expiry.
+
+        :param token: The refresh token.
+
+        :return str: The new refresh token if the token is a legacy one.
+        :return None: If the token already has the current format.
+
+        :raises InvalidTokenError: If the token is invalid.
+        :raises ExpiredSignatureError: If the signature has expired.
+        """
+        if not AuthSecurity.is_legacy_refresh_token(token):
+            return None
+
+        payload = AuthSecurity.decode_refresh_token(token)
+        return jwt_encode(
+            payload=payload,
+            key=AuthSecurity.__get_refresh_token_key(),
+            algorithm=AuthSecurity.REFRESH_TOKEN_ALGORITHM,
+        )
 
     @staticmethod
     def compare_tokens(access_token: str | None, refresh_token: str | None) -> bool | Literal["expired_access"]:
@@ -126,16 +167,79 @@ class AuthSecurity:
 
     @staticmethod
     def decode_access_token(token: str) -> dict[str, Any]:
+        cache_key = VerifiedTokenCache.get_key("access", token)
+        payload = AuthSecurity.__verified_tokens.get(cache_key)
+        if payload is not None:
+            return payload
+
         payload = jwt_decode(jwt=token, key=Env.JWT_SECRET_KEY, algorithms=[Env.JWT_ALGORITHM], issuer=Env.PROJECT_NAME)
         AuthSecurity.__validate_payload(payload)
+        AuthSecurity.__verified_tokens.set(cache_key, payload)
         return payload
 
     @staticmethod
     def decode_refresh_token(token: str) -> dict[str, Any]:
-        payload = json_loads(Encryptor.decrypt(token, Env.JWT_SECRET_KEY))
+        cache_key = VerifiedTokenCache.get_key("refresh", token)
+        payload = AuthSecurity.__verified_tokens.get(cache_key)
+        if payload is not None:
+            return payload
+
+        if not AuthSecurity.is_legacy_refresh_token(token):
+            payload = jwt_decode(
+                jwt=token,
+                key=AuthSecurity.__get_refresh_token_key(),
+                algorithms=[AuthSecurity.REFRESH_TOKEN_ALGORITHM],
+                issuer=Env.PROJECT_NAME,
+            )
+        elif Env.JWT_RT_ACCEPT_LEGACY:
+            # Legacy tokens derive a key from the password on every decryption, so they are slow to decode.
+            payload = json_loads(Encryptor.decrypt(token, Env.JWT_SECRET_KEY))
+        else:
+            raise InvalidTokenError("Invalid token")
         AuthSecurity.__validate_payload(payload)
+        AuthSecurity.__verified_tokens.set(cache_key, payload)
         return payload
 
+    @staticmethod
+    def forget_tokens(access_token: str | None = None, refresh_token: str | None = None) -> None:
+        """Drops the given tokens from the verified token cache (e.g. on sign out).
+
+        :param access_token: The access token.
+        :param refresh_token: The refresh token.
+        """
+        cache_keys = []
+        if access_token:
+            cache_keys.append(VerifiedTokenCache.get_key("access", access_token))
+        if refresh_token:
+            cache_keys.append(VerifiedTokenCache.get_key("refresh", refresh_token))
+        AuthSecurity.__verified_tokens.invalidate(cache_keys)
+
+    @staticmethod
+    def forget_user_tokens(user_id: int) -> None:
+        """Drops every token of the user from the verified token cache.
+
+        :param user_id: The user ID.
+        """
+        AuthSecurity.__verified_tokens.invalidate_subject(str(user_id))
+
+    @staticmethod
+    def get_verified_token_stats() -> dict[str, int]:
+        """Returns the hit/miss counters and the size of the verified token cache."""
+        verified_tokens = AuthSecurity.__verified_tokens
+        return {"hits": verified_tokens.hits, "misses": verified_tokens.misses, "size": verified_tokens.size}
+
+    @staticmethod
+    def __get_refresh_token_key() -> str:
+        # Refresh tokens are signed with their own key, so an access token is never accepted as a refresh token.
+        if Env.JWT_RT_SECRET_KEY:
+            return Env.JWT_RT_SECRET_KEY
+
+        secret_key = Env.JWT_SECRET_KEY
+        if AuthSecurity.__refresh_token_key is None or AuthSecurity.__refresh_token_key[0] != secret_key:
+            derived_key = hmac_new(secret_key.encode(), b"refresh-token", sha256).hexdigest()
+            AuthSecurity.__refresh_token_key = (secret_key, derived_key)
+        return AuthSecurity.__refresh_token_key[1]
+
     @staticmethod
     def __create_payload(user_id: int, expiration: timedelta) -> dict[str, Any]:
         expiry = SafeDateTime.now() + expiration
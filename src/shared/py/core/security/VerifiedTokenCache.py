@@ -0,0 +1,81 @@
+from collections import OrderedDict
+from hashlib import sha256
+from threading import Lock
+from time import time
+from typing import Any
+
+
+class VerifiedTokenCache:
+    """Bounded process-local cache of the payloads of tokens that have already been verified.
+
+    Entries are keyed by a hash of the token (so the tokens themselves are not kept in memory) and expire with the
+    token's ``exp`` claim. Payloads are returned as copies, so callers may modify them.
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._lock = Lock()
+        self._entries: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
+        self._keys_by_subject: dict[str, set[bytes]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def get_key(kind: str, token: str) -> bytes:
+        """Returns the key of a token.
+
+        :param kind: The kind of the token (e.g. ``access``), so the same string is never mistaken for another kind.
+        :param token: The token.
+        """
+        return sha256(f"{kind}:{token}".encode()).digest()
+
+    def get(self, key: bytes) -> dict[str, Any] | None:
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+
+            if payload["exp"] <= time():
+                self.__remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(payload)
+
+    def set(self, key: bytes, payload: dict[str, Any]) -> None:
+        with self._lock:
+            self.__remove(key)
+            self._entries[key] = dict(payload)
+            self._keys_by_subject.setdefault(payload["sub"], set()).add(key)
+            while len(self._entries) > self._max_size:
+                self.__remove(next(iter(self._entries)))
+
+    def invalidate(self, keys: list[bytes]) -> None:
+        """Drops the given keys from the cache."""
+        with self._lock:
+            for key in keys:
+                self.__remove(key)
+
+    def invalidate_subject(self, subject: str) -> None:
+        """Drops every token whose ``sub`` claim is the given subject."""
+        with self._lock:
+            for key in list(self._keys_by_subject.get(subject, ())):
+                self.__remove(key)
+
+    def __remove(self, key: bytes) -> None:
+        payload = self._entries.pop(key, None)
+        if payload is None:
+            return
+
+        keys = self._keys_by_subject.get(payload["sub"])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                self._keys_by_subject.pop(payload["sub"], None)
@@ -1,6 +1,8 @@
 from .AuthSecurity import AuthSecurity
+from .VerifiedTokenCache import VerifiedTokenCache
 
 
 __all__ = [
     "AuthSecurity",
+    "VerifiedTokenCache",
 ]
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class BaseJsonCodec(ABC):
+    @abstractmethod
+    def dumps(self, value: Any, ids_as_str: bool = False) -> bytes:
+        """Serializes the value to compact UTF-8 JSON.
+
+        Datetimes, enums and other non-JSON values are written as :func:`core.utils.Converter.json_default` does.
+
+        :param value: The value to serialize.
+        :param ids_as_str: Whether to write :class:`SnowflakeID` values as strings, so JavaScript clients keep every
+            digit of them.
+        """
+
+    @abstractmethod
+    def loads(self, data: str | bytes) -> Any:
+        """Deserializes JSON.
+
+        :param data: The JSON to deserialize.
+        """
@@ -0,0 +1,31 @@
+from typing import Any
+from ..Env import Env
+from ..utils.decorators import class_instance, thread_safe_singleton
+from .BaseJsonCodec import BaseJsonCodec
+from .OrjsonCodec import OrjsonCodec
+from .StdlibJsonCodec import StdlibJsonCodec
+
+
+@class_instance()
+@thread_safe_singleton
+class JsonCodec(BaseJsonCodec):
+    """JSON codec of the application, selected with ``JSON_CODEC``.
+
+    Both codecs write the same compact UTF-8 JSON (See :class:`OrjsonCodec` for the few exceptions).
+    """
+
+    def __init__(self):
+        if Env.JSON_CODEC == "stdlib":
+            self._codec: BaseJsonCodec = StdlibJsonCodec()
+        else:
+            self._codec: BaseJsonCodec = OrjsonCodec()
+
+    def dumps(self, value: Any, ids_as_str: bool = False) -> bytes:
+        return self._codec.dumps(value, ids_as_str)
+
+    def dumps_str(self, value: Any, ids_as_str: bool = False) -> str:
+        """Serializes the value to compact JSON as a string (See :meth:`dumps`)."""
+        return self._codec.dumps(value, ids_as_str).decode("utf-8")
+
+    def loads(self, data: str | bytes) -> Any:
+        return self._codec.loads(data)
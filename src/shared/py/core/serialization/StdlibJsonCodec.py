@@ -0,0 +1,31 @@
+from json import JSONEncoder
+from json import loads as json_loads
+from typing import Any
+from ..types import SnowflakeID
+from ..utils.Converter import json_default
+from .BaseJsonCodec import BaseJsonCodec
+
+
+class StdlibJsonCodec(BaseJsonCodec):
+    def __init__(self):
+        self._encoder = JSONEncoder(
+            ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":"), default=json_default
+        )
+
+    def dumps(self, value: Any, ids_as_str: bool = False) -> bytes:
+        if ids_as_str:
+            value = self.__convert_ids(value)
+        return self._encoder.encode(value).encode("utf-8")
+
+    def loads(self, data: str | bytes) -> Any:
+        return json_loads(data)
+
+    def __convert_ids(self, value: Any) -> Any:
+        # int subclasses are written as numbers without calling the default function, so they are converted first.
+        if isinstance(value, SnowflakeID):
+            return str(value)
+        if isinstance(value, dict):
+            return {key: self.__convert_ids(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self.__convert_ids(item) for item in value]
+        return value
@@ -0,0 +1,6 @@
+from .JsonCodec import JsonCodec
+
+
+__all__ = [
+    "JsonCodec",
+]
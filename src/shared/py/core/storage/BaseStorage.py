@@ -1,15 +1,19 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import BinaryIO
 from ..utils.Encryptor import Encryptor
 from .FileModel import FileModel
 from .StorageName import StorageName
+from .StorageStream import StorageStream
 
 
 class BaseStorage(ABC):
     storage_type = ""
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def decrypt_storage_type(storage_type: str) -> str:
+        # Decrypting derives a key from the password, so it is too slow to run on every file request.
         return Encryptor.decrypt(storage_type, "storage_type")
 
     @abstractmethod
@@ -19,6 +23,14 @@ class BaseStorage(ABC):
         :param file_model: The :class:`FileModel` object to get.
         """
 
+    @abstractmethod
+    def open_stream(self, storage_name: str, filename: str) -> StorageStream | None:
+        """Open a file in the storage to be streamed in chunks instead of read into memory.
+
+        :param storage_name: The name of the storage (directory) of the file.
+        :param filename: The name of the file.
+        """
+
     @abstractmethod
     def upload(self, file: BinaryIO, filename: str, storage_name: StorageName) -> FileModel | None:
         """Upload a file to the storage and return the FileModel object.
@@ -1,10 +1,12 @@
-from os import path, unlink
+from hashlib import md5
+from os import path, stat, unlink
 from pathlib import Path
-from typing import BinaryIO
+from typing import BinaryIO, Iterator
 from ..utils.String import get_random_filename
 from .BaseStorage import BaseStorage
 from .FileModel import FileModel
 from .StorageName import StorageName
+from .StorageStream import StorageStream
 
 
 class LocalStorage(BaseStorage):
@@ -21,6 +23,34 @@ class LocalStorage(BaseStorage):
         with open(file_path, "rb") as f:
             return f.read()
 
+    def open_stream(self, storage_name: str, filename: str) -> StorageStream | None:
+        file_path = (self._local_storage_dir / storage_name / filename).resolve()
+        if not file_path.is_relative_to(self._local_storage_dir.resolve()) or not file_path.is_file():
+            return None
+
+        stat_result = stat(file_path)
+        # The same entity tag as :class:`starlette.responses.FileResponse`.
+        etag = md5(f"{stat_result.st_mtime}-{stat_result.st_size}".encode(), usedforsecurity=False).hexdigest()
+
+        def read_range(start: int, end: int) -> Iterator[bytes]:
+            with open(file_path, "rb") as f:
+                f.seek(start)
+                remaining = end - start + 1
+                while remaining > 0:
+                    chunk = f.read(min(StorageStream.CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    yield chunk
+
+        return StorageStream(
+            size=stat_result.st_size,
+            last_modified=stat_result.st_mtime,
+            etag=f'"{etag}"',
+            read_range=read_range,
+            local_path=file_path,
+        )
+
     def upload(self, file: BinaryIO, filename: str, storage_name: StorageName) -> FileModel | None:
         if not filename:
             return None
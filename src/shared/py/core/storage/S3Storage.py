@@ -1,36 +1,90 @@
+from os import register_at_fork
 from tempfile import TemporaryFile
-from typing import BinaryIO
-from boto3 import client
+from threading import Lock
+from typing import Any, BinaryIO, Iterator
+from boto3.s3.transfer import TransferConfig
+from boto3.session import Session
+from botocore.config import Config
 from ..Env import Env
 from ..utils.String import get_random_filename
 from .BaseStorage import BaseStorage
 from .FileModel import FileModel
 from .StorageName import StorageName
+from .StorageStream import StorageStream
 
 
 class S3Storage(BaseStorage):
+    """Stores files in an S3 bucket (or an S3-compatible storage with ``S3_ENDPOINT_URL``).
+
+    One client is shared by every operation of the process, so credentials, endpoints and the pooled TLS connections
+    are reused instead of being set up for each file. Clients are thread-safe but their connections must not be shared
+    with a forked child, so the client is dropped after a fork.
+    """
+
     storage_type = "s3"
+    MAX_POOL_CONNECTIONS = 32
+    # Files larger than the threshold are transferred in parts, several at once.
+    TRANSFER_CONFIG = TransferConfig(
+        multipart_threshold=8 * 1024 * 1024, multipart_chunksize=8 * 1024 * 1024, max_concurrency=4
+    )
+
+    def __init__(self):
+        self._client_lock = Lock()
+        self._client: Any = None
+        self._client_settings: tuple[str, ...] | None = None
+        register_at_fork(after_in_child=self._reset_after_fork)
 
     def get(self, storage_name: str, filename: str) -> bytes | None:
         try:
-            s3_client = self._connect_client()
-            temp_file = TemporaryFile("w+b")
-            s3_client.download_fileobj(Bucket=Env.S3_BUCKET_NAME, Key=f"{storage_name}/{filename}", Fileobj=temp_file)
-            s3_client.close()
-            temp_file.seek(0)
-            return temp_file.read()
+            s3_client = self._get_client()
+            with TemporaryFile("w+b") as temp_file:
+                s3_client.download_fileobj(
+                    Bucket=Env.S3_BUCKET_NAME,
+                    Key=f"{storage_name}/{filename}",
+                    Fileobj=temp_file,
+                    Config=S3Storage.TRANSFER_CONFIG,
+                )
+                temp_file.seek(0)
+                return temp_file.read()
+        except Exception:
+            return None
+
+    def open_stream(self, storage_name: str, filename: str) -> StorageStream | None:
+        key = f"{storage_name}/{filename}"
+        try:
+            s3_client = self._get_client()
+            head = s3_client.head_object(Bucket=Env.S3_BUCKET_NAME, Key=key)
         except Exception:
             return None
 
+        def read_range(start: int, end: int) -> Iterator[bytes]:
+            s3_object = s3_client.get_object(Bucket=Env.S3_BUCKET_NAME, Key=key, Range=f"bytes={start}-{end}")
+            body = s3_object["Body"]
+            try:
+                yield from body.iter_chunks(StorageStream.CHUNK_SIZE)
+            finally:
+                body.close()
+
+        return StorageStream(
+            size=head["ContentLength"],
+            last_modified=head["LastModified"].timestamp(),
+            etag=head["ETag"],
+            read_range=read_range,
+        )
+
     def upload(self, file: BinaryIO, filename: str, storage_name: StorageName) -> FileModel | None:
         if not filename:
             return None
 
         try:
             new_filename = get_random_filename(filename)
-            s3_client = self._connect_client()
-            s3_client.upload_fileobj(Fileobj=file, Bucket=Env.S3_BUCKET_NAME, Key=f"{storage_name}/{new_filename}")
-            s3_client.close()
+            s3_client = self._get_client()
+            s3_client.upload_fileobj(
+                Fileobj=file,
+                Bucket=Env.S3_BUCKET_NAME,
+                Key=f"{storage_name.value}/{new_filename}",
+                Config=S3Storage.TRANSFER_CONFIG,
+            )
 
             return FileModel(
                 storage_type=S3Storage.storage_type,
@@ -47,9 +101,8 @@ class S3Storage(BaseStorage):
             return False
 
         try:
-            s3_client = self._connect_client()
+            s3_client = self._get_client()
             s3_client.delete_object(Bucket=Env.S3_BUCKET_NAME, Key=f"{file_model.storage_name}/{file_model.filename}")
-            s3_client.close()
             return True
         except Exception:
             return False
@@ -59,15 +112,37 @@ class S3Storage(BaseStorage):
             return False
 
         try:
-            self._connect_client()
+            self._get_client()
             return True
         except Exception:
             return False
 
-    def _connect_client(self):
-        return client(
-            "s3",
-            region_name=Env.S3_REGION_NAME,
-            aws_access_key_id=Env.S3_ACCESS_KEY_ID,
-            aws_secret_access_key=Env.S3_SECRET_ACCESS_KEY,
-        )
+    def _get_client(self):
+        settings = (Env.S3_REGION_NAME, Env.S3_ACCESS_KEY_ID, Env.S3_SECRET_ACCESS_KEY, Env.S3_ENDPOINT_URL)
+        s3_client = self._client
+        if s3_client is not None and self._client_settings == settings:
+            return s3_client
+
+        with self._client_lock:
+            if self._client is None or self._client_settings != settings:
+                region_name, access_key_id, secret_access_key, endpoint_url = settings
+                # Sessions are not thread-safe, so each client is created from its own one.
+                self._client = Session().client(
+                    "s3",
+                    region_name=region_name,
+                    aws_access_key_id=access_key_id,
+                    aws_secret_access_key=secret_access_key,
+                    endpoint_url=endpoint_url or None,
+                    config=Config(
+                        max_pool_connections=S3Storage.MAX_POOL_CONNECTIONS,
+                        retries={"mode": "standard"},
+                        tcp_keepalive=True,
+                    ),
+                )
+                self._client_settings = settings
+            return self._client
+
+    def _reset_after_fork(self) -> None:
+        self._client_lock = Lock()
+        self._client = None
+        self._client_settings = None
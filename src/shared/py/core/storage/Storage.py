@@ -1,3 +1,4 @@
+from asyncio import to_thread
 from pathlib import Path
 from typing import BinaryIO, overload
 from starlette.datastructures import UploadFile
@@ -6,6 +7,7 @@ from .FileModel import FileModel
 from .LocalStorage import LocalStorage
 from .S3Storage import S3Storage
 from .StorageName import StorageName
+from .StorageStream import StorageStream
 
 
 class Storage:
@@ -23,6 +25,18 @@ class Storage:
         storage = self._storages[storage_type]
         return storage.get(storage_name, filename)
 
+    async def get_async(self, storage_type: str, storage_name: str, filename: str) -> bytes | None:
+        """Runs :meth:`get` in a worker thread, so the event loop is not blocked by the transfer."""
+        return await to_thread(self.get, storage_type, storage_name, filename)
+
+    def open_stream(self, storage_type: str, storage_name: str, filename: str) -> StorageStream | None:
+        storage_type = BaseStorage.decrypt_storage_type(storage_type)
+        if not storage_type or storage_type not in self._storages:
+            return None
+
+        storage = self._storages[storage_type]
+        return storage.open_stream(storage_name, filename)
+
     @overload
     def upload(self, file: UploadFile, storage_name: StorageName) -> FileModel | None: ...
     @overload
@@ -46,6 +60,14 @@ class Storage:
 
         return self._storages[LocalStorage.storage_type].upload(file, filename, storage_name)
 
+    @overload
+    async def upload_async(self, file: UploadFile, storage_name: StorageName) -> FileModel | None: ...
+    @overload
+    async def upload_async(self, file: BinaryIO, storage_name: StorageName) -> FileModel | None: ...
+    async def upload_async(self, file: UploadFile | BinaryIO, storage_name: StorageName) -> FileModel | None:
+        """Runs :meth:`upload` in a worker thread, so the event loop is not blocked by the transfer."""
+        return await to_thread(self.upload, file, storage_name)
+
     def delete(self, file_model: FileModel) -> bool:
         if file_model.storage_type not in self._storages:
             return False
@@ -0,0 +1,40 @@
+from pathlib import Path
+from typing import Callable, Iterator
+
+
+class StorageStream:
+    """A file opened in a storage to be streamed instead of read into memory.
+
+    :param size: The size of the file in bytes.
+    :param last_modified: The modification time of the file as a POSIX timestamp.
+    :param etag: The entity tag of the file, quoted as in the ``ETag`` header.
+    :param read_range: Function yielding the chunks of the bytes from ``start`` to ``end`` (inclusive).
+    :param local_path: The path of the file if it is on the local disk, so it can be sent by the server directly.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        size: int,
+        last_modified: float,
+        etag: str,
+        read_range: Callable[[int, int], Iterator[bytes]],
+        local_path: Path | None = None,
+    ):
+        self.size = size
+        self.last_modified = last_modified
+        self.etag = etag
+        self.local_path = local_path
+        self._read_range = read_range
+
+    def iter_chunks(self, start: int = 0, end: int | None = None) -> Iterator[bytes]:
+        """Yields the chunks of the file from ``start`` to ``end`` (inclusive, the end of the file by default).
+
+        :param start: The offset of the first byte.
+        :param end: The offset of the last byte.
+        """
+        end = self.size - 1 if end is None else min(end, self.size - 1)
+        if start > end:
+            return iter(())
+        return self._read_range(start, end)
@@ -1,10 +1,12 @@
 from .FileModel import FileModel
 from .Storage import Storage
 from .StorageName import StorageName
+from .StorageStream import StorageStream
 
 
 __all__ = [
     "FileModel",
     "Storage",
     "StorageName",
+    "StorageStream",
 ]
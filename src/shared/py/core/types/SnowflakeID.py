@@ -1,16 +1,47 @@
+from functools import lru_cache
+from itertools import count
+from os import O_CREAT, O_RDWR, close, register_at_fork
+from os import open as os_open
+from pathlib import Path
 from random import getrandbits
+from tempfile import gettempdir
 from threading import Lock
 from time import time
-from typing import Any
+from typing import Any, Iterable, Iterator
 from ..utils.String import BASE62_ALPHABET
 
 
+# Short codes are 1 base-62 digit followed by 5 pairs of digits, so they are encoded and decoded a pair at a time.
+_BASE62_INDEXES = {char: index for index, char in enumerate(BASE62_ALPHABET)}
+_BASE62_PAIR_BASE = 62 * 62
+_BASE62_PAIRS = [high + low for high in BASE62_ALPHABET for low in BASE62_ALPHABET]
+_BASE62_PAIR_INDEXES = {pair: index for index, pair in enumerate(_BASE62_PAIRS)}
+_SHORT_CODE_CACHE_SIZE = 2**16
+
+
 class SnowflakeID(int):
+    """64-bit ID made of the milliseconds since :attr:`EPOCH` (42 bits), the machine ID (10 bits) and a sequence
+    number within the millisecond (12 bits).
+
+    The machine ID is 5 bits of node ID and 5 bits of worker ID:
+
+    - The node ID is ``SNOWFLAKE_NODE_ID``, or a hash of the MAC address and hostname if unset.
+    - The worker ID is ``SNOWFLAKE_WORKER_ID``, or else the first free slot of the node claimed by locking a file in the
+      temp directory (held until the process exits), so the processes of a node never share a worker ID. The PID is
+      not used, as it is the same (e.g. 1) in every container.
+
+    Each millisecond's sequence also starts at a random offset (wrapping around), which makes collisions unlikely
+    between nodes whose derived node IDs clash.
+    """
+
     FIXED_SHORT_CODE_LENGTH = 11
     EPOCH = 1704067200000  # 2024-01-01 00:00:00 UTC
+    MAX_SEQUENCE = 0xFFF
     _lock = Lock()
-    _sequence = 0
-    _last_timestamp = -1
+    # The current millisecond, its random sequence offset and the counter of the sequence numbers handed out within it.
+    _state: tuple[int, int, Iterator[int]] = (-1, 0, count())
+    _machine_bits: int | None = None
+    _worker_slot_fd: int | None = None
 
     def __new__(cls, value: int | str | None = None):
         if value is not None:
@@ -21,31 +52,97 @@ class SnowflakeID(int):
                     value = 0
             return super().__new__(cls, value)
 
-        machine_id = SnowflakeID.__get_machine_id()
+        return super().__new__(cls, cls._next_value())
+
+    @classmethod
+    def allocate(cls, size: int) -> list["SnowflakeID"]:
+        """Generates a block of unique IDs at once (e.g. for bulk inserts).
+
+        :param size: The number of IDs to be generated.
+        """
+        values: list[int] = []
+        while len(values) < size:
+            value = cls._next_value()
+            values.append(value)
+
+            # Keeps drawing from the same millisecond's counter until it runs out.
+            timestamp, offset, sequences = cls._state
+            base = ((timestamp - SnowflakeID.EPOCH) << 22) | cls._get_machine_bits()
+            if value & ~SnowflakeID.MAX_SEQUENCE != base:
+                continue
+            while len(values) < size:
+                sequence = next(sequences)
+                if sequence > SnowflakeID.MAX_SEQUENCE:
+                    break
+                values.append(base | ((offset + sequence) & SnowflakeID.MAX_SEQUENCE))
+
+        return [int.__new__(cls, value) for value in values]
+
+    @classmethod
+    def _next_value(cls) -> int:
+        # next() on itertools.count is atomic, so the lock is only taken to move on to the next millisecond.
+        timestamp, offset, sequences = cls._state
+        if cls._current_millis() <= timestamp:
+            sequence = next(sequences)
+            if sequence <= SnowflakeID.MAX_SEQUENCE:
+                sequence = (offset + sequence) & SnowflakeID.MAX_SEQUENCE
+                return ((timestamp - SnowflakeID.EPOCH) << 22) | cls._get_machine_bits() | sequence
 
         with cls._lock:
+            timestamp, offset, sequences = cls._state
             current_timestamp = cls._current_millis()
+            if current_timestamp > timestamp:
+                timestamp, offset, sequences = current_timestamp, getrandbits(12), count()
+                cls._state = (timestamp, offset, sequences)
 
-            if current_timestamp == cls._last_timestamp:
-                cls._sequence = (cls._sequence + 1) & 0xFFF
-                if cls._sequence == 0:
-                    current_timestamp = cls._wait_next_millis(current_timestamp)
-            else:
-                cls._sequence = 0
+            sequence = next(sequences)
+            while sequence > SnowflakeID.MAX_SEQUENCE:
+                timestamp, offset, sequences = cls._wait_next_millis(timestamp), getrandbits(12), count()
+                cls._state = (timestamp, offset, sequences)
+                sequence = next(sequences)
 
-            cls._last_timestamp = current_timestamp
+        sequence = (offset + sequence) & SnowflakeID.MAX_SEQUENCE
+        return ((timestamp - SnowflakeID.EPOCH) << 22) | cls._get_machine_bits() | sequence
 
-            snowflake_value = ((current_timestamp - SnowflakeID.EPOCH) << 22) | (machine_id << 12) | getrandbits(20)
+    @classmethod
+    def _get_machine_bits(cls) -> int:
+        if cls._machine_bits is None:
+            with cls._lock:
+                if cls._machine_bits is None:
+                    cls._machine_bits = ((SnowflakeID.__get_node_id() << 5) | cls.__get_worker_id()) << 12
+        return cls._machine_bits
 
-        return super().__new__(cls, snowflake_value)
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        cls._lock = Lock()
+        cls._state = (-1, 0, count())
+        cls._machine_bits = None
+        # The worker slot stays claimed by the parent, so the child drops its copy of the lock and claims another one.
+        if cls._worker_slot_fd is not None:
+            close(cls._worker_slot_fd)
+            cls._worker_slot_fd = None
 
     @staticmethod
     def from_short_code(short_code: str) -> "SnowflakeID":
         if not short_code or len(short_code) != SnowflakeID.FIXED_SHORT_CODE_LENGTH:
             return SnowflakeID(0)
-        decoded_int = SnowflakeID.__base62_decode(short_code)
-        original_value = SnowflakeID.__feistel_unshuffle(decoded_int)
-        return SnowflakeID(original_value)
+        return SnowflakeID.__decode_short_code(short_code)
+
+    @staticmethod
+    def decode_many(short_codes: Iterable[str]) -> list["SnowflakeID"]:
+        """Decodes short codes in bulk; invalid lengths decode to ``SnowflakeID(0)`` as in :meth:`from_short_code`."""
+        decode = SnowflakeID.__decode_short_code
+        length = SnowflakeID.FIXED_SHORT_CODE_LENGTH
+        return [
+            decode(short_code) if short_code and len(short_code) == length else SnowflakeID(0)
+            for short_code in short_codes
+        ]
+
+    @staticmethod
+    def encode_many(ids: Iterable[int]) -> list[str]:
+        """Encodes IDs to short codes in bulk."""
+        encode = SnowflakeID.__encode_short_code
+        return [encode(int(id)) for id in ids]
 
     @classmethod
     def _current_millis(cls):
@@ -86,50 +183,110 @@ class SnowflakeID(int):
         return f"SnowflakeID({int(self)})"
 
     def to_short_code(self) -> str:
-        mixed_value = SnowflakeID.__feistel_shuffle(int(self))
-        return SnowflakeID.__base62_encode(mixed_value)
+        return SnowflakeID.__encode_short_code(int(self))
+
+    @staticmethod
+    @lru_cache(maxsize=_SHORT_CODE_CACHE_SIZE)
+    def __encode_short_code(value: int) -> str:
+        return SnowflakeID.__base62_encode(SnowflakeID.__feistel_shuffle(value))
+
+    @staticmethod
+    @lru_cache(maxsize=_SHORT_CODE_CACHE_SIZE)
+    def __decode_short_code(short_code: str) -> "SnowflakeID":
+        return SnowflakeID(SnowflakeID.__feistel_unshuffle(SnowflakeID.__base62_decode(short_code)))
 
     @staticmethod
     def __base62_encode(n: int) -> str:
-        s = []
-        while n > 0:
-            n, r = divmod(n, 62)
-            s.append(BASE62_ALPHABET[r])
-        return "".join(reversed(s)).rjust(SnowflakeID.FIXED_SHORT_CODE_LENGTH, BASE62_ALPHABET[0])
+        if n >= 62**SnowflakeID.FIXED_SHORT_CODE_LENGTH:
+            s = []
+            while n > 0:
+                n, r = divmod(n, 62)
+                s.append(BASE62_ALPHABET[r])
+            return "".join(reversed(s))
+
+        n, r0 = divmod(n, _BASE62_PAIR_BASE)
+        n, r1 = divmod(n, _BASE62_PAIR_BASE)
+        n, r2 = divmod(n, _BASE62_PAIR_BASE)
+        n, r3 = divmod(n, _BASE62_PAIR_BASE)
+        n, r4 = divmod(n, _BASE62_PAIR_BASE)
+        pairs = _BASE62_PAIRS
+        return BASE62_ALPHABET[n] + pairs[r4] + pairs[r3] + pairs[r2] + pairs[r1] + pairs[r0]
 
     @staticmethod
     def __base62_decode(s: str) -> int:
-        n = 0
-        for c in s:
-            n = n * 62 + BASE62_ALPHABET.index(c)
+        pairs = _BASE62_PAIR_INDEXES
+        try:
+            n = _BASE62_INDEXES[s[0]]
+            n = n * _BASE62_PAIR_BASE + pairs[s[1:3]]
+            n = n * _BASE62_PAIR_BASE + pairs[s[3:5]]
+            n = n * _BASE62_PAIR_BASE + pairs[s[5:7]]
+            n = n * _BASE62_PAIR_BASE + pairs[s[7:9]]
+            n = n * _BASE62_PAIR_BASE + pairs[s[9:11]]
+        except KeyError:
+            raise ValueError(f"Invalid short code: {s}") from None
         return n
 
     @staticmethod
     def __feistel_shuffle(x: int, rounds: int = 4) -> int:
         left = x >> 32
         right = x & 0xFFFFFFFF
+        epoch = SnowflakeID.EPOCH
         for i in range(rounds):
-            left, right = right, left ^ ((right * SnowflakeID.EPOCH + i) & 0xFFFFFFFF)
+            left, right = right, left ^ ((right * epoch + i) & 0xFFFFFFFF)
         return (left << 32) | right
 
     @staticmethod
     def __feistel_unshuffle(x: int, rounds: int = 4) -> int:
         left = x >> 32
         right = x & 0xFFFFFFFF
+        epoch = SnowflakeID.EPOCH
         for i in reversed(range(rounds)):
-            left, right = right ^ ((left * SnowflakeID.EPOCH + i) & 0xFFFFFFFF), left
+            left, right = right ^ ((left * epoch + i) & 0xFFFFFFFF), left
         return (left << 32) | right
 
     @staticmethod
-    def __get_machine_id() -> int:
+    def __get_node_id() -> int:
         from hashlib import sha256
         from socket import gethostname
         from uuid import getnode
+        from ..Env import Env
+
+        node_id = Env.SNOWFLAKE_NODE_ID
+        if node_id is None:
+            mac = str(getnode())
+            hostname = gethostname()
+            raw = mac + hostname
+            digest = sha256(raw.encode()).digest()
+            node_id = int.from_bytes(digest, "little") % 2**5
+        return node_id
+
+    @classmethod
+    def __get_worker_id(cls) -> int:
+        from ..Env import Env
+
+        worker_id = Env.SNOWFLAKE_WORKER_ID
+        if worker_id is not None:
+            return worker_id
+
+        try:
+            from fcntl import LOCK_EX, LOCK_NB, flock
+        except ImportError:
+            return getrandbits(5)
+
+        slot_dir = Path(gettempdir()) / f"{Env.PROJECT_NAME}-snowflake-workers"
+        slot_dir.mkdir(exist_ok=True)
+        for worker_id in range(32):
+            fd = os_open(slot_dir / f"{worker_id}.lock", O_RDWR | O_CREAT, 0o666)
+            try:
+                flock(fd, LOCK_EX | LOCK_NB)
+            except OSError:
+                close(fd)
+                continue
+            cls._worker_slot_fd = fd
+            return worker_id
+
+        # More than 32 processes on the node; the random sequence offsets are the only protection left.
+        return getrandbits(5)
+
 
-        modulo = 2**10
-        mac = str(getnode())
-        hostname = gethostname()
-        raw = mac + hostname
-        digest = sha256(raw.encode()).digest()
-        int_val = int.from_bytes(digest, "little")
-        return int_val % modulo
+register_at_fork(after_in_child=SnowflakeID._reset_after_fork)
@@ -1,7 +1,6 @@
 from os import urandom
 from random import randint, shuffle
 from string import ascii_lowercase, ascii_uppercase, digits
-from ..types import SafeDateTime
 
 
 BASE62_ALPHABET = f"{digits}{ascii_lowercase}{ascii_uppercase}"
@@ -70,6 +69,9 @@ def create_short_unique_id(length: int) -> str:
 
 
 def get_random_filename(file_name: str | None) -> str:
+    # Imported here because SnowflakeID in core.types imports this module.
+    from ..types import SafeDateTime
+
     extension = file_name.split(".")[-1] if file_name else ""
 
     return concat(str(int(SafeDateTime.now().timestamp())), urandom(10).hex(), ".", extension)
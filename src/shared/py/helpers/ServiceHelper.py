@@ -1,5 +1,5 @@
 from typing import Any, Literal, Sequence, TypeVar, cast, overload
-from core.db import BaseSqlModel, DbSession, SoftDeleteModel, SqlBuilder
+from core.db import AsyncDbSession, BaseSqlModel, DbSession, SoftDeleteModel, SqlBuilder
 from core.types import SnowflakeID
 from core.utils.decorators import staticclass
 from sqlalchemy import Delete, Update, func
@@ -218,11 +218,25 @@ class ServiceHelper:
             return None
         result = None
         with DbSession.use(readonly=True) as target_db:
-            result = target_db.exec(
-                SqlBuilder.select.table(model_class, with_deleted=with_deleted)
-                .where(model_class.column(column) == value)
-                .limit(1)
-            )
+            result = target_db.exec(ServiceHelper.__get_by_query(model_class, column, value, with_deleted))
+        if not result:
+            return None
+        return result.first()
+
+    @staticmethod
+    async def get_by_async(
+        model_class: type[_TBaseModel],
+        column: str,
+        value: Any,
+        is_none: bool = False,
+        with_deleted: bool = False,
+    ) -> _TBaseModel | None:
+        """Same as :meth:`get_by`, but queries through :class:`AsyncDbSession` without blocking the event loop."""
+        if not is_none and value is None:
+            return None
+        result = None
+        async with AsyncDbSession.use(readonly=True) as target_db:
+            result = await target_db.exec(ServiceHelper.__get_by_query(model_class, column, value, with_deleted))
         if not result:
             return None
         return result.first()
@@ -254,6 +268,26 @@ class ServiceHelper:
             )
         return None
 
+    @staticmethod
+    async def get_by_param_async(
+        model_class: type[_TBaseModel], id_param: _TIdParam, with_deleted: bool = False
+    ) -> _TBaseModel | None:
+        """Same as :meth:`get_by_param`, but queries through :class:`AsyncDbSession` without blocking the event loop."""
+        if not id_param:
+            return None
+        if isinstance(id_param, model_class):
+            return id_param
+        if isinstance(id_param, SnowflakeID) or isinstance(id_param, int):
+            return await ServiceHelper.get_by_async(model_class, "id", id_param, with_deleted=with_deleted)
+        if isinstance(id_param, str):
+            return await ServiceHelper.get_by_async(
+                model_class,
+                "id",
+                SnowflakeID.from_short_code(id_param),
+                with_deleted=with_deleted,
+            )
+        return None
+
     @staticmethod
     def convert_id(id_param: BaseSqlModel | SnowflakeID | int | str) -> SnowflakeID:
         if isinstance(id_param, BaseSqlModel):
@@ -273,13 +307,23 @@ class ServiceHelper:
         values: Any | list[Any],
         with_deleted: bool = False,
     ) -> list[_TBaseModel]:
-        sql_query = SqlBuilder.select.table(model_class, with_deleted=with_deleted)
-        if not isinstance(values, list) and not isinstance(values, set):
-            values = [values]
-        sql_query = sql_query.where(model_class.column(column).in_(values))
         records = []
         with DbSession.use(readonly=True) as target_db:
-            result = target_db.exec(sql_query)
+            result = target_db.exec(ServiceHelper.__get_all_by_query(model_class, column, values, with_deleted))
+            records = result.all()
+        return records
+
+    @staticmethod
+    async def get_all_by_async(
+        model_class: type[_TBaseModel],
+        column: str,
+        values: Any | list[Any],
+        with_deleted: bool = False,
+    ) -> list[_TBaseModel]:
+        """Same as :meth:`get_all_by`, but queries through :class:`AsyncDbSession` without blocking the event loop."""
+        records = []
+        async with AsyncDbSession.use(readonly=True) as target_db:
+            result = await target_db.exec(ServiceHelper.__get_all_by_query(model_class, column, values, with_deleted))
             records = result.all()
         return records
 
@@ -388,3 +432,22 @@ class ServiceHelper:
             return None
 
         return tuple(list(records)[::-1])
+
+    @staticmethod
+    def __get_by_query(
+        model_class: type[_TBaseModel], column: str, value: Any, with_deleted: bool
+    ) -> SelectOfScalar[_TBaseModel]:
+        return (
+            SqlBuilder.select.table(model_class, with_deleted=with_deleted)
+            .where(model_class.column(column) == value)
+            .limit(1)
+        )
+
+    @staticmethod
+    def __get_all_by_query(
+        model_class: type[_TBaseModel], column: str, values: Any | list[Any], with_deleted: bool
+    ) -> SelectOfScalar[_TBaseModel]:
+        sql_query = SqlBuilder.select.table(model_class, with_deleted=with_deleted)
+        if not isinstance(values, list) and not isinstance(values, set):
+            values = [values]
+        return sql_query.where(model_class.column(column).in_(values))
@@ -31,7 +31,7 @@ class BotSchedule(BaseSqlModel, table=True):
         default=BotScheduleRunningType.Infinite, nullable=False, sa_type=EnumLikeType(BotScheduleRunningType)
     )
     status: BotScheduleStatus = Field(nullable=False, sa_type=EnumLikeType(BotScheduleStatus))
-    interval_str: str = Field(nullable=False)
+    interval_str: str = Field(nullable=False, index=True)
     start_at: SafeDateTime | None = DateTimeField(default=None, nullable=True)
     end_at: SafeDateTime | None = DateTimeField(default=None, nullable=True)
 
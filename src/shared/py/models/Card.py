@@ -1,5 +1,12 @@
-from typing import Any
-from core.db import DateTimeField, EditorContentModel, ModelColumnType, SnowflakeIDField, SoftDeleteModel
+from typing import Any, ClassVar
+from core.db import (
+    ApiResponsePlan,
+    DateTimeField,
+    EditorContentModel,
+    ModelColumnType,
+    SnowflakeIDField,
+    SoftDeleteModel,
+)
 from core.types import SafeDateTime, SnowflakeID
 from sqlalchemy import TEXT
 from sqlmodel import Field
@@ -8,6 +15,20 @@ from .ProjectColumn import ProjectColumn
 
 
 class Card(SoftDeleteModel, table=True):
+    API_RESPONSE_PLAN: ClassVar[ApiResponsePlan] = ApiResponsePlan(
+        {
+            "uid": ("id", SnowflakeID.to_short_code),
+            "project_uid": ("project_id", SnowflakeID.to_short_code),
+            "column_uid": ("project_column_id", SnowflakeID.to_short_code),
+            "title": "title",
+            "description": ("description", EditorContentModel.model_dump),
+            "ai_description": "ai_description",
+            "order": "order",
+            "deadline_at": "deadline_at",
+            "created_at": "created_at",
+            "archived_at": "archived_at",
+        }
+    )
     project_id: SnowflakeID = SnowflakeIDField(foreign_key=Project, nullable=False, index=True)
     project_column_id: SnowflakeID = SnowflakeIDField(foreign_key=ProjectColumn, nullable=False, index=True)
     title: str = Field(nullable=False)
@@ -34,18 +55,7 @@ class Card(SoftDeleteModel, table=True):
         }
 
     def api_response(self) -> dict[str, Any]:
-        return {
-            "uid": self.get_uid(),
-            "project_uid": self.project_id.to_short_code(),
-            "column_uid": self.project_column_id.to_short_code(),
-            "title": self.title,
-            "description": self.description.model_dump(),
-            "ai_description": self.ai_description,
-            "order": self.order,
-            "deadline_at": self.deadline_at,
-            "created_at": self.created_at,
-            "archived_at": self.archived_at,
-        }
+        return Card.API_RESPONSE_PLAN.serialize(self)
 
     def board_api_response(
         self,
@@ -1,11 +1,19 @@
-from typing import Any
-from core.db import BaseSqlModel, SnowflakeIDField
+from typing import Any, ClassVar
+from core.db import ApiResponsePlan, BaseSqlModel, SnowflakeIDField
 from core.types import SnowflakeID
 from .Card import Card
 from .GlobalCardRelationshipType import GlobalCardRelationshipType
 
 
 class CardRelationship(BaseSqlModel, table=True):
+    API_RESPONSE_PLAN: ClassVar[ApiResponsePlan] = ApiResponsePlan(
+        {
+            "uid": ("id", SnowflakeID.to_short_code),
+            "relationship_type_uid": ("relationship_type_id", SnowflakeID.to_short_code),
+            "parent_card_uid": ("card_id_parent", SnowflakeID.to_short_code),
+            "child_card_uid": ("card_id_child", SnowflakeID.to_short_code),
+        }
+    )
     relationship_type_id: SnowflakeID = SnowflakeIDField(
         foreign_key=GlobalCardRelationshipType, nullable=False, index=True
     )
@@ -23,12 +31,7 @@ class CardRelationship(BaseSqlModel, table=True):
         }
 
     def api_response(self) -> dict[str, Any]:
-        return {
-            "uid": self.get_uid(),
-            "relationship_type_uid": self.relationship_type_id.to_short_code(),
-            "parent_card_uid": self.card_id_parent.to_short_code(),
-            "child_card_uid": self.card_id_child.to_short_code(),
-        }
+        return CardRelationship.API_RESPONSE_PLAN.serialize(self)
 
     def notification_data(self) -> dict[str, Any]:
         return {}
@@ -1,6 +1,7 @@
 from enum import Enum
-from typing import Any
-from core.db import EnumLikeType, SnowflakeIDField
+from operator import attrgetter
+from typing import Any, ClassVar
+from core.db import ApiResponsePlan, EnumLikeType, SnowflakeIDField
 from core.types import SnowflakeID
 from sqlmodel import Field
 from .bases import BaseActivityModel
@@ -69,7 +70,24 @@ class ProjectActivityType(Enum):
     CardCheckitemDeleted = "card_checkitem_deleted"
 
 
+def _create_filterable_map(
+    project_id: SnowflakeID, project_column_id: SnowflakeID | None, card_id: SnowflakeID | None
+) -> dict[str, str]:
+    filterable_map = {Project.__tablename__: project_id.to_short_code()}
+    if project_column_id:
+        filterable_map[ProjectColumn.__tablename__] = project_column_id.to_short_code()
+    if card_id:
+        filterable_map[Card.__tablename__] = card_id.to_short_code()
+    return filterable_map
+
+
 class ProjectActivity(BaseActivityModel, table=True):
+    API_RESPONSE_PLAN: ClassVar[ApiResponsePlan] = BaseActivityModel.API_RESPONSE_PLAN.extend(
+        {
+            "activity_type": ("activity_type", attrgetter("value")),
+            "filterable_map": (("project_id", "project_column_id", "card_id"), _create_filterable_map),
+        }
+    )
     project_id: SnowflakeID = SnowflakeIDField(foreign_key=Project, index=True)
     project_column_id: SnowflakeID | None = Field(default=ProjectColumn, nullable=True)
     card_id: SnowflakeID | None = SnowflakeIDField(foreign_key=Card, nullable=True)
@@ -86,14 +104,4 @@ class ProjectActivity(BaseActivityModel, table=True):
         )
 
     def api_response(self) -> dict[str, Any]:
-        base_api_response = super().api_response()
-        base_api_response["activity_type"] = self.activity_type.value
-        base_api_response["filterable_map"] = {
-            Project.__tablename__: self.project_id.to_short_code(),
-        }
-
-        if self.project_column_id:
-            base_api_response["filterable_map"][ProjectColumn.__tablename__] = self.project_column_id.to_short_code()
-        if self.card_id:
-            base_api_response["filterable_map"][Card.__tablename__] = self.card_id.to_short_code()
-        return base_api_response
+        return ProjectActivity.API_RESPONSE_PLAN.serialize(self)
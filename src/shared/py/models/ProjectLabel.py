@@ -1,5 +1,5 @@
 from typing import Any, ClassVar
-from core.db import BaseSqlModel, SnowflakeIDField
+from core.db import ApiResponsePlan, BaseSqlModel, SnowflakeIDField
 from core.types import SnowflakeID
 from sqlmodel import Field
 from .Project import Project
@@ -19,6 +19,16 @@ class ProjectLabel(BaseSqlModel, table=True):
         {"name": "Fixing", "color": "#388E3C", "description": "Tasks that are being fixed."},
         {"name": "Fetch", "color": "#1DE9B6", "description": "Tasks that are fetching data."},
     ]
+    API_RESPONSE_PLAN: ClassVar[ApiResponsePlan] = ApiResponsePlan(
+        {
+            "uid": ("id", SnowflakeID.to_short_code),
+            "project_uid": ("project_id", SnowflakeID.to_short_code),
+            "name": "name",
+            "description": "description",
+            "order": "order",
+            "color": "color",
+        }
+    )
     project_id: SnowflakeID = SnowflakeIDField(foreign_key=Project, nullable=False, index=True)
     name: str = Field(nullable=False)
     color: str = Field(nullable=False)
@@ -38,14 +48,7 @@ class ProjectLabel(BaseSqlModel, table=True):
         }
 
     def api_response(self) -> dict[str, Any]:
-        return {
-            "uid": self.get_uid(),
-            "project_uid": self.project_id.to_short_code(),
-            "name": self.name,
-            "description": self.description,
-            "order": self.order,
-            "color": self.color,
-        }
+        return ProjectLabel.API_RESPONSE_PLAN.serialize(self)
 
     def notification_data(self) -> dict[str, Any]:
         return {}
@@ -1,6 +1,7 @@
 from enum import Enum
-from typing import Any
-from core.db import EnumLikeType, SnowflakeIDField
+from operator import attrgetter
+from typing import Any, ClassVar
+from core.db import ApiResponsePlan, EnumLikeType, SnowflakeIDField
 from core.types import SnowflakeID
 from sqlmodel import Field
 from .bases import BaseActivityModel
@@ -16,7 +17,20 @@ class ProjectWikiActivityType(Enum):
     WikiDeleted = "wiki_deleted"
 
 
+def _create_filterable_map(project_id: SnowflakeID, project_wiki_id: SnowflakeID) -> dict[str, str]:
+    return {
+        Project.__tablename__: project_id.to_short_code(),
+        ProjectWiki.__tablename__: project_wiki_id.to_short_code(),
+    }
+
+
 class ProjectWikiActivity(BaseActivityModel, table=True):
+    API_RESPONSE_PLAN: ClassVar[ApiResponsePlan] = BaseActivityModel.API_RESPONSE_PLAN.extend(
+        {
+            "activity_type": ("activity_type", attrgetter("value")),
+            "filterable_map": (("project_id", "project_wiki_id"), _create_filterable_map),
+        }
+    )
     project_id: SnowflakeID = SnowflakeIDField(foreign_key=Project, index=True)
     project_wiki_id: SnowflakeID = SnowflakeIDField(foreign_key=ProjectWiki, index=True)
     activity_type: ProjectWikiActivityType = Field(nullable=False, sa_type=EnumLikeType(ProjectWikiActivityType))
@@ -32,10 +46,4 @@ class ProjectWikiActivity(BaseActivityModel, table=True):
         )
 
     def api_response(self) -> dict[str, Any]:
-        base_api_response = super().api_response()
-        base_api_response["activity_type"] = self.activity_type.value
-        base_api_response["filterable_map"] = {
-            Project.__tablename__: self.project_id.to_short_code(),
-            ProjectWiki.__tablename__: self.project_wiki_id.to_short_code(),
-        }
-        return base_api_response
+        return ProjectWikiActivity.API_RESPONSE_PLAN.serialize(self)
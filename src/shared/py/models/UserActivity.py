@@ -1,6 +1,6 @@
 from enum import Enum
-from typing import Any
-from core.db import EnumLikeType, SnowflakeIDField
+from typing import Any, ClassVar
+from core.db import ApiResponsePlan, EnumLikeType, SnowflakeIDField
 from core.types import SnowflakeID
 from sqlmodel import Field
 from .bases import BaseActivityModel
@@ -13,7 +13,27 @@ class UserActivityType(Enum):
     DeclinedProjectInvitation = "declined_project_invitation"
 
 
+def _get_activity_type_value(activity_type: UserActivityType | None) -> str | None:
+    return activity_type.value if activity_type else None
+
+
+def _create_filterable_map(
+    activity_id: SnowflakeID, user_id: SnowflakeID | None, bot_id: SnowflakeID | None
+) -> dict[str, str]:
+    if user_id:
+        return {User.__tablename__: user_id.to_short_code()}
+    if bot_id:
+        return {Bot.__tablename__: bot_id.to_short_code()}
+    return {"uid": SnowflakeID.to_short_code(activity_id)}
+
+
 class UserActivity(BaseActivityModel, table=True):
+    API_RESPONSE_PLAN: ClassVar[ApiResponsePlan] = BaseActivityModel.API_RESPONSE_PLAN.extend(
+        {
+            "activity_type": ("activity_type", _get_activity_type_value),
+            "filterable_map": (("id", "user_id", "bot_id"), _create_filterable_map),
+        }
+    )
     activity_type: UserActivityType | None = Field(default=None, nullable=True, sa_type=EnumLikeType(UserActivityType))
     refer_activity_table: str | None = Field(default=None, nullable=True)
     refer_activity_id: SnowflakeID | None = SnowflakeIDField(nullable=True)
@@ -29,13 +49,4 @@ class UserActivity(BaseActivityModel, table=True):
         )
 
     def api_response(self) -> dict[str, Any]:
-        base_api_response = super().api_response()
-        base_api_response["activity_type"] = self.activity_type.value if self.activity_type else None
-        base_api_response["filterable_map"] = {}
-        if self.user_id:
-            base_api_response["filterable_map"][User.__tablename__] = self.user_id.to_short_code()
-        elif self.bot_id:
-            base_api_response["filterable_map"][Bot.__tablename__] = self.bot_id.to_short_code()
-        else:
-            base_api_response["filterable_map"]["uid"] = self.get_uid()
-        return base_api_response
+        return UserActivity.API_RESPONSE_PLAN.serialize(self)
@@ -1,6 +1,7 @@
 from enum import Enum
-from typing import Any
-from core.db import BaseSqlModel, DateTimeField, EnumLikeType, SnowflakeIDField
+from operator import attrgetter
+from typing import Any, ClassVar
+from core.db import ApiResponsePlan, BaseSqlModel, DateTimeField, EnumLikeType, SnowflakeIDField
 from core.types import SafeDateTime, SnowflakeID
 from sqlalchemy import JSON
 from sqlmodel import Field
@@ -18,6 +19,15 @@ class NotificationType(Enum):
 
 
 class UserNotification(BaseSqlModel, table=True):
+    API_RESPONSE_PLAN: ClassVar[ApiResponsePlan] = ApiResponsePlan(
+        {
+            "uid": ("id", SnowflakeID.to_short_code),
+            "type": ("notification_type", attrgetter("value")),
+            "message_vars": "message_vars",
+            "read_at": "read_at",
+            "created_at": "created_at",
+        }
+    )
     notifier_type: str = Field(nullable=False)
     notifier_id: SnowflakeID = SnowflakeIDField(nullable=False, index=True)
     receiver_id: SnowflakeID = SnowflakeIDField(foreign_key=User, nullable=False, index=True)
@@ -38,13 +48,7 @@ class UserNotification(BaseSqlModel, table=True):
         }
 
     def api_response(self) -> dict[str, Any]:
-        return {
-            "uid": self.get_uid(),
-            "type": self.notification_type.value,
-            "message_vars": self.message_vars,
-            "read_at": self.read_at,
-            "created_at": self.created_at,
-        }
+        return UserNotification.API_RESPONSE_PLAN.serialize(self)
 
     def notification_data(self) -> dict[str, Any]:
         return {}
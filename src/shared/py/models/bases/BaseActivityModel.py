@@ -1,5 +1,5 @@
-from typing import Any
-from core.db import BaseSqlModel, SnowflakeIDField
+from typing import Any, ClassVar
+from core.db import ApiResponsePlan, BaseSqlModel, SnowflakeIDField
 from core.types import SnowflakeID
 from sqlalchemy import JSON
 from sqlmodel import Field
@@ -7,7 +7,25 @@ from ..Bot import Bot
 from ..User import User
 
 
+def _create_activity_history_response(activity_history: dict[str, Any]) -> dict[str, Any]:
+    response = {**activity_history}
+    if "record_ids" in activity_history:
+        record_ids = response.pop("record_ids")
+        for record_id, dict_key in record_ids:
+            if dict_key not in response:
+                response[dict_key] = {}
+            response[dict_key]["uid"] = SnowflakeID(record_id).to_short_code()
+    return response
+
+
 class BaseActivityModel(BaseSqlModel):
+    API_RESPONSE_PLAN: ClassVar[ApiResponsePlan] = ApiResponsePlan(
+        {
+            "uid": ("id", SnowflakeID.to_short_code),
+            "activity_history": ("activity_history", _create_activity_history_response),
+            "created_at": "created_at",
+        }
+    )
     user_id: SnowflakeID | None = SnowflakeIDField(foreign_key=User, nullable=True)
     bot_id: SnowflakeID | None = SnowflakeIDField(foreign_key=Bot, nullable=True)
     activity_history: dict[str, Any] = Field(default={}, sa_type=JSON)
@@ -22,20 +40,7 @@ class BaseActivityModel(BaseSqlModel):
         }
 
     def api_response(self) -> dict[str, Any]:
-        response = {
-            "uid": self.get_uid(),
-            "activity_history": {**self.activity_history},
-            "created_at": self.created_at,
-        }
-
-        if "record_ids" in self.activity_history:
-            record_ids = response["activity_history"].pop("record_ids")
-            for record_id, dict_key in record_ids:
-                if dict_key not in response["activity_history"]:
-                    response["activity_history"][dict_key] = {}
-                response["activity_history"][dict_key]["uid"] = SnowflakeID(record_id).to_short_code()
-
-        return response
+        return BaseActivityModel.API_RESPONSE_PLAN.serialize(self)
 
     def notification_data(self) -> dict[str, Any]:
         return {}
@@ -27,19 +27,30 @@ class BaseRoleModel(BaseSqlModel):
         return {}
 
     def is_all_granted(self) -> bool:
-        if ALL_GRANTED in self.actions or self.actions == [action.value for action in self.get_all_actions()]:
+        return self.check_all_granted(self.actions)
+
+    def is_granted(self, actions: Enum | str | list[Enum | str] | list[Enum] | list[str]):
+        return self.check_granted(self.actions, actions)
+
+    @classmethod
+    def check_all_granted(cls, granted_actions: list[str]) -> bool:
+        if ALL_GRANTED in granted_actions or granted_actions == [action.value for action in cls.get_all_actions()]:
             return True
         return False
 
-    def is_granted(self, actions: Enum | str | list[Enum | str] | list[Enum] | list[str]):
-        if self.is_all_granted():
+    @classmethod
+    def check_granted(
+        cls, granted_actions: list[str], actions: Enum | str | list[Enum | str] | list[Enum] | list[str]
+    ) -> bool:
+        """Checks the actions against granted actions without a role instance (e.g. cached ones)."""
+        if cls.check_all_granted(granted_actions):
             return True
         if not isinstance(actions, list):
             actions = [actions]
         actions = [action.value if isinstance(action, Enum) else action for action in actions]
 
         for action in actions:
-            if action not in self.actions:
+            if action not in granted_actions:
                 return False
         return True
 
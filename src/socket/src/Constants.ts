@@ -1,3 +1,4 @@
+import crypto from "crypto";
 import * as path from "path";
 import { fileURLToPath } from "url";
 import * as dotenv from "dotenv";
@@ -83,6 +84,12 @@ const SUPPORTED_JWT_ALTORITHMES: jwt.Algorithm[] = [
 
 export const JWT_SECRET_KEY = getEnv<string>({ key: "JWT_SECRET_KEY", defaultValue: `${PROJECT_NAME}_secret_key` });
 export const JWT_ALGORITHM = getEnv<jwt.Algorithm>({ key: "JWT_ALGORITHM", defaultValue: "HS256", availableValues: SUPPORTED_JWT_ALTORITHMES });
+// Must match the API: refresh tokens are signed with their own key, derived from JWT_SECRET_KEY if not set.
+export const JWT_RT_SECRET_KEY =
+    getEnv<string>({ key: "JWT_RT_SECRET_KEY", defaultValue: "" }) ||
+    crypto.createHmac("sha256", JWT_SECRET_KEY).update("refresh-token").digest("hex");
+export const JWT_RT_ALGORITHM: jwt.Algorithm = "HS256";
+export const JWT_RT_ACCEPT_LEGACY = getEnv<string>({ key: "JWT_RT_ACCEPT_LEGACY", defaultValue: "true" }) === "true";
 
 export const MAIN_DATABASE_URL = getEnv<string>({
     key: "MAIN_DATABASE_URL",
@@ -52,12 +52,17 @@ class KafkaConsumer extends BaseConsumer {
                                 return;
                             }
 
-                            const cacheKey = model.cache_key;
-                            if (!cacheKey) {
-                                return;
+                            // Small payloads are sent inline, large ones are stored in the cache by the API server.
+                            let data: Record<string, any> | null = model.data ?? null;
+                            if (!data) {
+                                const cacheKey = model.cache_key;
+                                if (!cacheKey) {
+                                    return;
+                                }
+
+                                data = await Cache.get<Record<string, any>>(cacheKey);
                             }
 
-                            const data = await Cache.get<Record<string, any>>(cacheKey);
                             if (!data) {
                                 return;
                             }
@@ -2,7 +2,15 @@ import User from "@/models/User";
 import http from "http";
 import cookie from "cookie";
 import jwt from "jsonwebtoken";
-import { JWT_ALGORITHM, JWT_SECRET_KEY, PROJECT_NAME, REFRESH_TOKEN_NAME } from "@/Constants";
+import {
+    JWT_ALGORITHM,
+    JWT_RT_ACCEPT_LEGACY,
+    JWT_RT_ALGORITHM,
+    JWT_RT_SECRET_KEY,
+    JWT_SECRET_KEY,
+    PROJECT_NAME,
+    REFRESH_TOKEN_NAME,
+} from "@/Constants";
 import Encryptor from "@/core/security/Encryptor";
 import { Utils } from "@langboard/core/utils";
 
@@ -87,7 +95,18 @@ class Auth {
 
     static #decodeRefreshToken(refreshToken: string) {
         try {
-            const decoded = JSON.parse(Encryptor.decrypt(refreshToken, JWT_SECRET_KEY)) as { sub: string; exp: number; iss: string };
+            let decoded: { sub: string; exp: number; iss: string };
+            if (!Auth.#isLegacyRefreshToken(refreshToken)) {
+                decoded = jwt.verify(refreshToken, JWT_RT_SECRET_KEY, {
+                    algorithms: [JWT_RT_ALGORITHM],
+                    ignoreExpiration: true,
+                    issuer: PROJECT_NAME,
+                }) as { sub: string; exp: number; iss: string };
+            } else if (JWT_RT_ACCEPT_LEGACY) {
+                decoded = JSON.parse(Encryptor.decrypt(refreshToken, JWT_SECRET_KEY)) as { sub: string; exp: number; iss: string };
+            } else {
+                return null;
+            }
 
             if (
                 !decoded ||
@@ -104,6 +123,11 @@ class Auth {
             return null;
         }
     }
+
+    static #isLegacyRefreshToken(refreshToken: string): bool {
+        // Refresh tokens were encrypted payloads before they became JWTs, which have exactly three dot-separated parts.
+        return refreshToken.split(".").length !== 3;
+    }
 }
 
 export default Auth;